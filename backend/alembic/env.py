@@ -14,7 +14,11 @@ from app.models.tender_document import TenderDocument
 from app.models.tender_analysis import TenderAnalysis
 from app.models.similar_tender import SimilarTender
 from app.models.criterion_suggestion import CriterionSuggestion
+from app.models.extraction_cache import ExtractionCacheEntry
+from app.models.embedding_cache import EmbeddingCacheEntry
+from app.models.embedding_centroid import EmbeddingCentroid
 from app.core.config import settings
+from app.services.vector_index_service import VectorIndexService
 
 # this is the Alembic Config object
 config = context.config
@@ -30,12 +34,20 @@ if config.config_file_name is not None:
 target_metadata = Base.metadata
 
 
+def include_object(object, name, type_, reflected, compare_to):
+    """Leave the ANN indexes alone: scripts/rebuild_vector_indexes.py owns them (method and storage are settings)."""
+    if type_ == "index" and name and name.startswith(VectorIndexService.INDEX_PREFIX):
+        return False
+    return True
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode."""
     url = config.get_main_option("sqlalchemy.url")
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -55,7 +67,8 @@ def run_migrations_online() -> None:
     with connectable.connect() as connection:
         context.configure(
             connection=connection,
-            target_metadata=target_metadata
+            target_metadata=target_metadata,
+            include_object=include_object
         )
 
         with context.begin_transaction():
@@ -1,7 +1,12 @@
 """
 Document management endpoints.
 """
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.base import get_db
+from app.models.extraction_cache import ExtractionCacheEntry
 
 router = APIRouter()
 
@@ -18,3 +23,52 @@ async def ingest_document():
     """Ingest a document into the RAG knowledge base."""
     # TODO: Implement document ingestion
     return {"message": "Document ingestion not yet implemented"}
+
+
+@router.get("/extraction-cache/stats")
+async def get_extraction_cache_stats(db: AsyncSession = Depends(get_db)):
+    """
+    Extraction cache hit/miss counters and size.
+    """
+    from app.services.extraction_cache_service import extraction_cache_service
+    from app.services.parser_service import PARSER_VERSION
+
+    stats = await extraction_cache_service.get_stats()
+
+    result = await db.execute(
+        select(ExtractionCacheEntry.kind, func.count())
+        .where(ExtractionCacheEntry.parser_version == PARSER_VERSION)
+        .group_by(ExtractionCacheEntry.kind)
+    )
+    entries = {kind: count for kind, count in result.fetchall()}
+
+    return {
+        "parser_version": PARSER_VERSION,
+        "entries": entries,
+        "counters": stats
+    }
+
+
+@router.get("/embedding-cache/stats")
+async def get_embedding_cache_stats(db: AsyncSession = Depends(get_db)):
+    """
+    Embedding cache hit rate, tokens saved and size.
+    """
+    from app.core.config import settings
+    from app.models.embedding_cache import EmbeddingCacheEntry
+    from app.services.embedding_cache_service import embedding_cache_service
+
+    stats = await embedding_cache_service.get_stats()
+
+    result = await db.execute(
+        select(EmbeddingCacheEntry.model, func.count())
+        .group_by(EmbeddingCacheEntry.model)
+    )
+    entries = {model: count for model, count in result.fetchall()}
+
+    return {
+        "model": settings.embedding_model,
+        "entries": entries,
+        "max_entries": settings.embedding_cache_max_entries,
+        "counters": stats
+    }
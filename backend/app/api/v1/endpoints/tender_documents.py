@@ -7,16 +7,41 @@ from typing import List
 from fastapi import APIRouter, HTTPException, UploadFile, File, Depends, Form
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.orm import undefer
 
 from app.models.base import get_db
 from app.models.tender import Tender
 from app.models.tender_document import TenderDocument
-from app.schemas.tender_document import TenderDocumentResponse, TenderDocumentWithContent
+from app.models.document_section import DocumentSection
+from app.schemas.tender_document import (
+    TenderDocumentResponse,
+    TenderDocumentWithContent,
+    DocumentSectionSummary,
+    DocumentSectionWithContent,
+)
 from app.tasks.tender_tasks import process_tender_document
 from app.services.storage_service import storage_service
 
 router = APIRouter()
 
+# Accepted upload formats (extension -> default content type)
+SUPPORTED_FILE_TYPES = {
+    ".pdf": "application/pdf",
+    ".xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+}
+
+
+def _validate_file_type(filename: str) -> str:
+    """Return the lowercased extension of an accepted upload, or raise 400."""
+    extension = os.path.splitext(filename.lower())[1]
+    if extension not in SUPPORTED_FILE_TYPES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported file type. Must be one of: {', '.join(SUPPORTED_FILE_TYPES)}"
+        )
+    return extension
+
 
 @router.post("/{tender_id}/documents/upload", response_model=TenderDocumentResponse, status_code=201)
 async def upload_document(
@@ -30,8 +55,8 @@ async def upload_document(
 
     Args:
         tender_id: UUID of the tender
-        file: PDF file to upload
-        document_type: Type of document (CCTP, RC, AE, BPU, DUME, ANNEXE)
+        file: PDF, XLSX or DOCX file to upload
+        document_type: Type of document (CCTP, RC, AE, BPU, DQE, DPGF, DUME, ANNEXE)
     """
     # Verify tender exists
     stmt = select(Tender).where(Tender.id == tender_id)
@@ -42,11 +67,10 @@ async def upload_document(
         raise HTTPException(status_code=404, detail="Tender not found")
 
     # Validate file type
-    if not file.filename.endswith('.pdf'):
-        raise HTTPException(status_code=400, detail="Only PDF files are supported")
+    extension = _validate_file_type(file.filename)
 
     # Validate document type
-    valid_types = ["CCTP", "RC", "AE", "BPU", "DUME", "ANNEXE"]
+    valid_types = ["CCTP", "RC", "AE", "BPU", "DQE", "DPGF", "DUME", "ANNEXE"]
     if document_type.upper() not in valid_types:
         raise HTTPException(
             status_code=400,
@@ -65,7 +89,7 @@ async def upload_document(
         storage_service.upload_file(
             file_content=content,
             object_name=file_path,
-            content_type=file.content_type or "application/pdf"
+            content_type=file.content_type or SUPPORTED_FILE_TYPES[extension]
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to upload file: {str(e)}")
@@ -139,6 +163,128 @@ async def get_document(
     return document
 
 
+@router.get("/{tender_id}/documents/{document_id}/sections", response_model=List[DocumentSectionSummary])
+async def list_document_sections(
+    tender_id: str,
+    document_id: str,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    List the sections of a document (content previews, the compressed bodies are not loaded).
+    """
+    stmt = select(DocumentSection).join(TenderDocument).where(
+        DocumentSection.document_id == document_id,
+        TenderDocument.tender_id == tender_id
+    ).order_by(DocumentSection.page, DocumentSection.line)
+    result = await db.execute(stmt)
+
+    return result.scalars().all()
+
+
+@router.get(
+    "/{tender_id}/documents/{document_id}/sections/{section_id}",
+    response_model=DocumentSectionWithContent
+)
+async def get_document_section(
+    tender_id: str,
+    document_id: str,
+    section_id: str,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get a section with its full content.
+    """
+    stmt = select(DocumentSection).join(TenderDocument).options(
+        undefer(DocumentSection.content_compressed)
+    ).where(
+        DocumentSection.id == section_id,
+        DocumentSection.document_id == document_id,
+        TenderDocument.tender_id == tender_id
+    )
+    result = await db.execute(stmt)
+    section = result.scalar_one_or_none()
+
+    if not section:
+        raise HTTPException(status_code=404, detail="Section not found")
+
+    return section
+
+
+@router.put("/{tender_id}/documents/{document_id}/file", response_model=TenderDocumentResponse)
+async def upload_document_version(
+    tender_id: str,
+    document_id: str,
+    file: UploadFile = File(...),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Replace a document with a new version (e.g. a "rectificatif").
+
+    The previous extraction is kept until re-processing: only pages whose
+    content fingerprint changed are re-parsed, and only chunks whose text
+    changed are re-embedded.
+
+    Args:
+        tender_id: UUID of the tender
+        document_id: UUID of the document to replace
+        file: New version of the file (PDF, XLSX or DOCX)
+    """
+    stmt = select(TenderDocument).where(
+        TenderDocument.id == document_id,
+        TenderDocument.tender_id == tender_id
+    )
+    result = await db.execute(stmt)
+    document = result.scalar_one_or_none()
+
+    if not document:
+        raise HTTPException(status_code=404, detail="Document not found")
+
+    # Validate file type
+    extension = _validate_file_type(file.filename)
+
+    # Read file content
+    content = await file.read()
+
+    # Upload new version to MinIO
+    file_id = str(uuid.uuid4())
+    file_path = f"tenders/{tender_id}/documents/{file_id}_{file.filename}"
+    content_type = file.content_type or SUPPORTED_FILE_TYPES[extension]
+
+    try:
+        storage_service.upload_file(
+            file_content=content,
+            object_name=file_path,
+            content_type=content_type
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to upload file: {str(e)}")
+
+    previous_file_path = document.file_path
+
+    document.filename = file.filename
+    document.file_path = file_path
+    document.file_size = len(content)
+    document.mime_type = content_type
+    document.extraction_status = "pending"
+    document.extraction_error = None
+
+    await db.commit()
+    await db.refresh(document)
+
+    # The new version is committed: the previous file is no longer referenced
+    try:
+        storage_service.delete_file(previous_file_path)
+    except Exception as e:
+        print(f"⚠️  Could not delete previous version {previous_file_path}: {e}")
+
+    # Trigger async (incremental) re-processing
+    print(f"🚀 Triggering incremental re-processing for document {document.id}")
+    task = process_tender_document.delay(str(document.id))
+    print(f"✅ Task queued: {task.id}")
+
+    return document
+
+
 @router.delete("/{tender_id}/documents/{document_id}", status_code=204)
 async def delete_document(
     tender_id: str,
@@ -122,10 +122,10 @@ async def ask_question_about_tender(
 
     Returns answer with source citations.
     """
+    import asyncio
     import hashlib
     import json
     import redis.asyncio as redis
-    from sqlalchemy import text
     from app.schemas.search import SearchResult
     from app.services.rag_service import rag_service
     from app.services.llm_service import llm_service
@@ -143,59 +143,41 @@ async def ask_question_about_tender(
     # 2. Check Redis cache
     redis_client = await redis.from_url(settings.redis_url)
     q_hash = hashlib.sha256(request.question.encode()).hexdigest()[:16]
-    cache_key = f"tender_qa:{tender_id}:{q_hash}"
+    mode = request.mode or settings.rag_retrieval_mode
+    cache_key = f"tender_qa:{tender_id}:{mode}:{q_hash}"
 
     cached = await redis_client.get(cache_key)
     if cached:
         return TenderQuestionResponse(**json.loads(cached), cached=True)
 
-    # 3. Get document IDs for this tender
+    # 3. Get documents of this tender
     from app.models.tender_document import TenderDocument
-    stmt = select(TenderDocument.id).where(TenderDocument.tender_id == tender_id)
+    stmt = select(TenderDocument.id, TenderDocument.filename, TenderDocument.document_type).where(
+        TenderDocument.tender_id == tender_id
+    )
     result = await db.execute(stmt)
-    doc_ids = [str(r[0]) for r in result.fetchall()]
+    documents = {str(r.id): r for r in result.fetchall()}
 
-    if not doc_ids:
+    if not documents:
         raise HTTPException(
             status_code=404,
             detail="No documents found for this tender"
         )
 
-    # 4. RAG search for relevant chunks
-    query_emb = await rag_service.create_embedding(request.question)
-
-    # Build SQL with proper parameter binding for asyncpg (enriched with document filename)
-    from sqlalchemy import bindparam
-    sql = text("""
-        SELECT
-            de.id,
-            de.document_id,
-            de.document_type,
-            de.chunk_text,
-            de.meta_data,
-            1 - (de.embedding <=> CAST(:emb AS vector)) as similarity,
-            td.filename as document_filename,
-            td.document_type as document_type_full
-        FROM document_embeddings de
-        LEFT JOIN tender_documents td ON de.document_id = td.id
-        WHERE de.document_id = ANY(CAST(:doc_ids AS uuid[]))
-        ORDER BY de.embedding <=> CAST(:emb AS vector)
-        LIMIT :k
-    """).bindparams(
-        bindparam("emb", type_=None),
-        bindparam("doc_ids", type_=None),
-        bindparam("k", type_=None)
+    # 4. RAG search for relevant chunks: a wide candidate set, reranked down to top_k
+    from app.services.reranker_service import reranker_service
+    rerank = await asyncio.to_thread(lambda: reranker_service.available)
+    chunks = await rag_service.retrieve_relevant_content(
+        db,
+        request.question,
+        top_k=max(settings.reranker_candidates, request.top_k) if rerank else request.top_k,
+        document_ids=list(documents),
+        mode=mode
     )
+    candidate_count = len(chunks)
+    chunks = await rag_service.rerank_results(request.question, chunks, top_k=request.top_k)
 
-    result = await db.execute(sql, {
-        "emb": str(query_emb),
-        "doc_ids": [str(d) for d in doc_ids],
-        "k": request.top_k
-    })
-
-    rows = result.fetchall()
-
-    if not rows:
+    if not chunks:
         raise HTTPException(
             status_code=404,
             detail="No embeddings found for this tender. The tender may not have been processed yet."
@@ -205,24 +187,35 @@ async def ask_question_about_tender(
     sources = []
     context_parts = []
 
-    for row in rows:
+    for chunk in chunks:
+        document = documents.get(chunk["document_id"])
+
         # Enrich metadata with document filename
-        enriched_metadata = row.meta_data.copy() if row.meta_data else {}
-        enriched_metadata["document_filename"] = row.document_filename or "Unknown"
-        enriched_metadata["document_type_full"] = row.document_type_full or row.document_type
+        enriched_metadata = chunk["metadata"].copy() if chunk["metadata"] else {}
+        enriched_metadata["document_filename"] = (document and document.filename) or "Unknown"
+        enriched_metadata["document_type_full"] = (document and document.document_type) or chunk["document_type"]
+        if "rrf_score" in chunk:
+            enriched_metadata["retrieval"] = {
+                "mode": mode,
+                "vector_rank": chunk["vector_rank"],
+                "lexical_rank": chunk["lexical_rank"],
+                "rrf_score": chunk["rrf_score"]
+            }
+        if "rerank_score" in chunk:
+            enriched_metadata["rerank_score"] = chunk["rerank_score"]
 
         sources.append(SearchResult(
-            document_id=str(row.document_id),
-            document_type=row.document_type,
-            chunk_text=row.chunk_text,
-            similarity_score=float(row.similarity),
+            document_id=chunk["document_id"],
+            document_type=chunk["document_type"],
+            chunk_text=chunk["chunk_text"],
+            similarity_score=chunk["similarity_score"],
             metadata=enriched_metadata
         ))
 
         section = enriched_metadata.get("section_number", "?")
         page = enriched_metadata.get("page", "?")
-        filename = row.document_filename or "Document inconnu"
-        context_parts.append(f"[{filename} - Section {section}, Page {page}]\n{row.chunk_text}")
+        filename = (document and document.filename) or "Document inconnu"
+        context_parts.append(f"[{filename} - Section {section}, Page {page}]\n{chunk['chunk_text']}")
 
     context = "\n\n".join(context_parts)
 
@@ -232,7 +225,7 @@ async def ask_question_about_tender(
         context=context
     )
 
-    print(f"🤖 Calling Claude for Q&A (context: {len(context)} chars)...")
+    print(f"🤖 Calling Claude for Q&A (context: {len(context)} chars, {len(chunks)}/{candidate_count} chunks)...")
 
     response = await llm_service.client.messages.create(
         model=llm_service.model,
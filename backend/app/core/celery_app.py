@@ -13,6 +13,9 @@ from app.models.proposal import Proposal
 from app.models.document import DocumentEmbedding
 from app.models.similar_tender import SimilarTender
 from app.models.criterion_suggestion import CriterionSuggestion
+from app.models.extraction_cache import ExtractionCacheEntry
+from app.models.embedding_cache import EmbeddingCacheEntry
+from app.models.embedding_centroid import EmbeddingCentroid
 
 # Create Celery app
 celery_app = Celery(
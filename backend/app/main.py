@@ -8,6 +8,7 @@ from fastapi.responses import JSONResponse
 
 from app.core.config import settings
 from app.api.v1.api import api_router
+from app.services.parser_service import parser_service
 
 
 @asynccontextmanager
@@ -18,6 +19,7 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     print("👋 Shutting down")
+    parser_service.shutdown_async_executor()
 
 
 app = FastAPI(
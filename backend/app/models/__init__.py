@@ -7,6 +7,9 @@ from app.models.tender_document import TenderDocument
 from app.models.document_section import DocumentSection
 from app.models.tender_analysis import TenderAnalysis
 from app.models.similar_tender import SimilarTender
+from app.models.extraction_cache import ExtractionCacheEntry
+from app.models.embedding_cache import EmbeddingCacheEntry
+from app.models.embedding_centroid import EmbeddingCentroid
 
 # Historical models for RAG Knowledge Base
 from app.models.historical_tender import HistoricalTender
@@ -20,6 +23,9 @@ __all__ = [
     "DocumentSection",
     "TenderAnalysis",
     "SimilarTender",
+    "ExtractionCacheEntry",
+    "EmbeddingCacheEntry",
+    "EmbeddingCentroid",
     # Historical models
     "HistoricalTender",
     "PastProposal",
@@ -1,7 +1,8 @@
 """
 SQLAlchemy base model and database session management.
 """
-from sqlalchemy import create_engine
+from pgvector.asyncpg import register_vector
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base, sessionmaker
 
@@ -18,6 +19,13 @@ async_engine = create_async_engine(
     echo=settings.debug,
 )
 
+
+@event.listens_for(async_engine.sync_engine, "connect")
+def register_vector_codec(dbapi_connection, connection_record):
+    """Exchange pgvector values with asyncpg in binary format (see app.models.vector)."""
+    dbapi_connection.run_async(register_vector)
+
+
 # Sync engine for Alembic migrations
 sync_engine = create_engine(
     settings.database_url_sync,
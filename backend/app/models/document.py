@@ -3,11 +3,12 @@ SQLAlchemy models for Document embeddings.
 """
 from datetime import datetime
 from uuid import uuid4
-from sqlalchemy import Column, String, Text, DateTime, JSON
+from sqlalchemy import Column, String, Text, DateTime, JSON, Index, text
 from sqlalchemy.dialects.postgresql import UUID
-from pgvector.sqlalchemy import Vector
 
+from app.core.config import settings
 from app.models.base import Base
+from app.models.vector import EmbeddingVector, EMBEDDING_DIMENSIONS
 
 
 class DocumentEmbedding(Base):
@@ -19,9 +20,18 @@ class DocumentEmbedding(Base):
     document_id = Column(UUID(as_uuid=True), index=True)
     document_type = Column(String(50), index=True)
     chunk_text = Column(Text, nullable=False)
-    embedding = Column(Vector(1536))
+    embedding = Column(EmbeddingVector(EMBEDDING_DIMENSIONS))
     meta_data = Column(JSON, default={})
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
 
+    # Full-text index of hybrid retrieval (ANN indexes: scripts/rebuild_vector_indexes.py)
+    __table_args__ = (
+        Index(
+            'idx_document_embeddings_fts',
+            text(f"to_tsvector('{settings.rag_fts_config}', chunk_text)"),
+            postgresql_using='gin'
+        ),
+    )
+
     def __repr__(self):
         return f"<DocumentEmbedding {self.document_id}>"
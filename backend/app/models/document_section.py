@@ -1,10 +1,11 @@
 """
 Document sections model for storing structured extracted content.
 """
+import zlib
 from datetime import datetime
-from sqlalchemy import Column, String, Integer, Text, Boolean, ForeignKey, JSON, Index, DateTime
+from sqlalchemy import Column, String, Integer, Text, Boolean, ForeignKey, JSON, Index, DateTime, LargeBinary
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 from uuid import uuid4
 
 from app.models.base import Base
@@ -16,8 +17,15 @@ class DocumentSection(Base):
 
     Stores hierarchical sections (PARTIE, Article, numbered sections)
     with their full content, enabling fast retrieval without re-parsing.
+
+    `content` only holds a preview (first CONTENT_PREVIEW_LENGTH chars) for
+    listings; longer bodies are stored zlib-compressed in `content_compressed`,
+    a deferred column loaded on first access to `full_content` (or eagerly
+    with `.options(undefer(DocumentSection.content_compressed))`).
     """
 
+    CONTENT_PREVIEW_LENGTH = 2000
+
     __tablename__ = "document_sections"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
@@ -34,9 +42,10 @@ class DocumentSection(Base):
     title = Column(Text, nullable=False)
 
     # Content
-    content = Column(Text)
-    content_length = Column(Integer, default=0)
-    content_truncated = Column(Boolean, default=False)
+    content = Column(Text)  # Preview (first CONTENT_PREVIEW_LENGTH chars)
+    content_length = Column(Integer, default=0)  # Length of the full content
+    content_truncated = Column(Boolean, default=False)  # True if content is shorter than the full content
+    content_compressed = deferred(Column(LargeBinary))  # zlib-compressed full content (when truncated)
 
     # Position in document
     page = Column(Integer, nullable=False, index=True)
@@ -74,5 +83,20 @@ class DocumentSection(Base):
         Index('idx_key_sections', 'document_id', 'is_key_section'),
     )
 
+    @property
+    def full_content(self) -> str | None:
+        """Full section content (lazy-loads and decompresses content_compressed)."""
+        if self.content_compressed is None:
+            return self.content
+        return zlib.decompress(self.content_compressed).decode("utf-8")
+
+    def set_full_content(self, text: str | None) -> None:
+        """Store the full content compressed, with its preview in content."""
+        text = text or ""
+        self.content = text[:self.CONTENT_PREVIEW_LENGTH]
+        self.content_length = len(text)
+        self.content_truncated = len(text) > self.CONTENT_PREVIEW_LENGTH
+        self.content_compressed = zlib.compress(text.encode("utf-8")) if self.content_truncated else None
+
     def __repr__(self):
         return f"<DocumentSection(id={self.id}, type={self.section_type}, number={self.section_number}, title={self.title[:50]}...)>"
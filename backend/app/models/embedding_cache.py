@@ -0,0 +1,40 @@
+"""
+SQLAlchemy model for the content-addressed embedding cache.
+"""
+from datetime import datetime
+from sqlalchemy import Column, String, Integer, DateTime, Index
+
+from app.models.base import Base
+from app.models.vector import EmbeddingVector, EMBEDDING_DIMENSIONS
+
+
+class EmbeddingCacheEntry(Base):
+    """
+    Embedding of a chunk keyed by the SHA-256 of the model and the normalized chunk text.
+
+    CCAG clauses, RGPD paragraphs and ITIL boilerplate recur in nearly every
+    tender: a hit returns the stored vector without calling OpenAI. Entries
+    are evicted least recently used first once the table exceeds
+    settings.embedding_cache_max_entries.
+    """
+
+    __tablename__ = "embedding_cache"
+
+    # SHA-256 hex of "<model>\0<normalized text>"
+    cache_key = Column(String(64), primary_key=True)
+
+    model = Column(String(100), nullable=False)
+    embedding = Column(EmbeddingVector(EMBEDDING_DIMENSIONS), nullable=False)
+    token_count = Column(Integer, nullable=False, default=0)  # Estimated tokens saved per hit
+
+    # Usage
+    hit_count = Column(Integer, default=0)
+    created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+    last_used_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+
+    __table_args__ = (
+        Index('idx_embedding_cache_last_used', 'last_used_at'),
+    )
+
+    def __repr__(self):
+        return f"<EmbeddingCacheEntry {self.model}:{self.cache_key[:12]}>"
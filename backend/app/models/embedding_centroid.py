@@ -0,0 +1,55 @@
+"""
+SQLAlchemy model for per-document and per-tender centroid embeddings.
+"""
+from datetime import datetime
+from sqlalchemy import Column, String, Integer, DateTime, Index, text
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.models.base import Base
+from app.models.vector import EmbeddingVector, EMBEDDING_DIMENSIONS
+
+
+class EmbeddingCentroid(Base):
+    """
+    Mean embedding of a document (its chunks) or of a tender (its documents).
+
+    Maintained on ingestion by CentroidService, so similarity between
+    documents or tenders is a KNN over this small table instead of an
+    aggregate over every chunk of document_embeddings. A tender centroid
+    averages its document centroids: each document weighs the same,
+    whatever its length.
+    """
+
+    __tablename__ = "embedding_centroids"
+
+    # "document" (entity_id = document_embeddings.document_id) or "tender" (entity_id = tenders.id)
+    scope = Column(String(20), primary_key=True)
+    entity_id = Column(UUID(as_uuid=True), primary_key=True)
+
+    document_type = Column(String(50), nullable=True)  # document_embeddings.document_type (document scope)
+    embedding = Column(EmbeddingVector(EMBEDDING_DIMENSIONS), nullable=False)
+    chunk_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+
+    # One ANN index per scope: KNN queries filter on a single scope
+    __table_args__ = (
+        Index(
+            'idx_embedding_centroids_document_hnsw',
+            'embedding',
+            postgresql_using='hnsw',
+            postgresql_with={'m': 16, 'ef_construction': 64},
+            postgresql_ops={'embedding': 'vector_cosine_ops'},
+            postgresql_where=text("scope = 'document'")
+        ),
+        Index(
+            'idx_embedding_centroids_tender_hnsw',
+            'embedding',
+            postgresql_using='hnsw',
+            postgresql_with={'m': 16, 'ef_construction': 64},
+            postgresql_ops={'embedding': 'vector_cosine_ops'},
+            postgresql_where=text("scope = 'tender'")
+        ),
+    )
+
+    def __repr__(self):
+        return f"<EmbeddingCentroid {self.scope}:{self.entity_id}>"
@@ -0,0 +1,41 @@
+"""
+SQLAlchemy model for the content-addressed extraction cache.
+"""
+from datetime import datetime
+from sqlalchemy import Column, String, Integer, DateTime, JSON, Index
+
+from app.models.base import Base
+
+
+class ExtractionCacheEntry(Base):
+    """
+    Parser output keyed by the SHA-256 of the source bytes and the parser version.
+
+    Buyers republish identical CCAP/RC files across lots and re-issues: a hit
+    returns the stored extraction without opening the PDF at all. Bumping
+    PARSER_VERSION naturally invalidates every entry.
+    """
+
+    __tablename__ = "extraction_cache"
+
+    # "<kind>:<content_hash>:<parser_version>"
+    cache_key = Column(String(128), primary_key=True)
+
+    kind = Column(String(20), nullable=False, default="document")  # document, ocr_page
+    content_hash = Column(String(64), nullable=False)  # SHA-256 hex of the source bytes
+    parser_version = Column(String(20), nullable=False)
+
+    # Stored extraction (text, sections, tables, structured, metadata, ...)
+    payload = Column(JSON, nullable=False)
+
+    # Usage
+    hit_count = Column(Integer, default=0)
+    created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+    last_hit_at = Column(DateTime(timezone=True))
+
+    __table_args__ = (
+        Index('idx_extraction_cache_hash', 'content_hash'),
+    )
+
+    def __repr__(self):
+        return f"<ExtractionCacheEntry {self.kind}:{self.content_hash[:12]} v{self.parser_version}>"
@@ -25,10 +25,10 @@ class TenderDocument(Base):
     mime_type = Column(String(100))
 
     # Document type
-    document_type = Column(String(50), index=True)  # CCTP, RC, AE, BPU, DUME, ANNEXE
+    document_type = Column(String(50), index=True)  # CCTP, RC, AE, BPU, DQE, DPGF, DUME, ANNEXE
 
     # Extraction status
-    extraction_status = Column(String(50), default="pending", index=True)  # pending, processing, completed, failed
+    extraction_status = Column(String(50), default="pending", index=True)  # pending, processing, completed, failed, quarantined
     extracted_text = Column(Text)
     page_count = Column(Integer)
 
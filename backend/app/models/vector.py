@@ -0,0 +1,58 @@
+"""
+pgvector type bound natively by each database driver.
+"""
+from typing import Optional, Sequence
+
+import numpy as np
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import bindparam
+from sqlalchemy.sql.elements import BindParameter
+
+# text-embedding-3-small
+EMBEDDING_DIMENSIONS = 1536
+
+
+def format_vector(value: Optional[Sequence[float]], dim: Optional[int] = None) -> Optional[str]:
+    """
+    pgvector text literal with float32 precision (what a vector column stores).
+
+    Nine significant digits round-trip any float32, and are about half the
+    text of the float64 repr.
+    """
+    if value is None:
+        return None
+    if dim is not None and len(value) != dim:
+        raise ValueError(f"expected {dim} dimensions, not {len(value)}")
+    return "[" + ",".join(f"{v:.9g}" for v in np.asarray(value, dtype=np.float32).tolist()) + "]"
+
+
+class EmbeddingVector(Vector):
+    """
+    Vector column and parameter type.
+
+    asyncpg: values are handed to the binary codec registered on every
+    connection (app.models.base), which sends 4 bytes per dimension.
+    psycopg2 only speaks the text protocol: values are bound as a compact
+    float32 literal (format_vector).
+    """
+
+    cache_ok = True
+
+    def bind_processor(self, dialect):
+        dim = self.dim
+
+        if dialect.driver == "asyncpg":
+            def process(value):
+                if value is not None and dim is not None and len(value) != dim:
+                    raise ValueError(f"expected {dim} dimensions, not {len(value)}")
+                return value
+            return process
+
+        def process(value):
+            return format_vector(value, dim)
+        return process
+
+
+def vector_param(name: str = "query_embedding") -> BindParameter:
+    """Bind parameter carrying an embedding, for text() queries."""
+    return bindparam(name, type_=EmbeddingVector(EMBEDDING_DIMENSIONS))
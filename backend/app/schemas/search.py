@@ -1,7 +1,7 @@
 """
 Pydantic schemas for Search operations.
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Literal
 from pydantic import BaseModel, Field
 
 
@@ -33,6 +33,7 @@ class TenderQuestionRequest(BaseModel):
     """Schema for tender Q&A request."""
     question: str = Field(..., min_length=5, max_length=500)
     top_k: int = Field(default=5, ge=1, le=20)
+    mode: Literal["vector", "hybrid"] | None = None  # Retrieval mode (default: RAG_RETRIEVAL_MODE)
 
 
 class TenderQuestionResponse(BaseModel):
@@ -9,7 +9,7 @@ from pydantic import BaseModel, Field
 
 class TenderDocumentBase(BaseModel):
     """Base schema for tender documents."""
-    document_type: str = Field(..., description="Type of document: CCTP, RC, AE, BPU, DUME, ANNEXE")
+    document_type: str = Field(..., description="Type of document: CCTP, RC, AE, BPU, DQE, DPGF, DUME, ANNEXE")
 
 
 class TenderDocumentUpload(TenderDocumentBase):
@@ -42,3 +42,31 @@ class TenderDocumentWithContent(TenderDocumentResponse):
 
     class Config:
         from_attributes = True
+
+
+class DocumentSectionSummary(BaseModel):
+    """Schema for section listings (content preview only)."""
+    id: UUID
+    section_type: str
+    section_number: Optional[str]
+    parent_number: Optional[str]
+    title: str
+    content: Optional[str] = Field(None, description="Preview of the section content")
+    content_length: Optional[int]
+    content_truncated: Optional[bool]
+    page: int
+    line: Optional[int]
+    level: Optional[int]
+    is_toc: Optional[bool]
+    is_key_section: Optional[bool]
+
+    class Config:
+        from_attributes = True
+
+
+class DocumentSectionWithContent(DocumentSectionSummary):
+    """Schema with the full (decompressed) section content."""
+    full_content: Optional[str]
+
+    class Config:
+        from_attributes = True
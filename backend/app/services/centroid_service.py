@@ -0,0 +1,196 @@
+"""
+Maintenance and KNN search of per-document and per-tender centroid embeddings.
+"""
+from typing import Dict, Any, List, Optional
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.services.vector_index_service import vector_index_service
+
+
+class CentroidService:
+    """
+    Keeps embedding_centroids in line with document_embeddings.
+
+    refresh_document*() recomputes the centroid of a document (pgvector
+    AVG over its chunks) then the centroid of its tender (AVG over the
+    tender's document centroids), in the caller's transaction. A
+    document or tender left without embeddings loses its centroid.
+    """
+
+    SCOPES = ("document", "tender")
+
+    UPSERT = """
+        ON CONFLICT (scope, entity_id) DO UPDATE SET
+            document_type = EXCLUDED.document_type,
+            embedding = EXCLUDED.embedding,
+            chunk_count = EXCLUDED.chunk_count,
+            updated_at = EXCLUDED.updated_at
+    """
+
+    # :document_id = NULL refreshes every document (backfill)
+    REFRESH_DOCUMENTS_SQL = text(f"""
+        INSERT INTO embedding_centroids (scope, entity_id, document_type, embedding, chunk_count, updated_at)
+        SELECT 'document', document_id, MIN(document_type), AVG(embedding), COUNT(*), now()
+        FROM document_embeddings
+        WHERE (CAST(:document_id AS uuid) IS NULL OR document_id = CAST(:document_id AS uuid))
+          AND document_id IS NOT NULL
+        GROUP BY document_id
+        {UPSERT}
+    """)
+
+    DELETE_EMPTY_DOCUMENT_SQL = text("""
+        DELETE FROM embedding_centroids
+        WHERE scope = 'document' AND entity_id = CAST(:document_id AS uuid)
+          AND NOT EXISTS (SELECT 1 FROM document_embeddings WHERE document_id = CAST(:document_id AS uuid))
+    """)
+
+    # Tender of the document (none for past proposals...), or every tender when :document_id is NULL
+    REFRESH_TENDERS_SQL = text(f"""
+        INSERT INTO embedding_centroids (scope, entity_id, document_type, embedding, chunk_count, updated_at)
+        SELECT 'tender', td.tender_id, NULL, AVG(c.embedding), SUM(c.chunk_count), now()
+        FROM embedding_centroids c
+        JOIN tender_documents td ON td.id = c.entity_id
+        WHERE c.scope = 'document'
+          AND (
+              CAST(:document_id AS uuid) IS NULL
+              OR td.tender_id = (SELECT tender_id FROM tender_documents WHERE id = CAST(:document_id AS uuid))
+          )
+        GROUP BY td.tender_id
+        {UPSERT}
+    """)
+
+    DELETE_EMPTY_TENDER_SQL = text("""
+        DELETE FROM embedding_centroids t
+        WHERE t.scope = 'tender'
+          AND t.entity_id = (SELECT tender_id FROM tender_documents WHERE id = CAST(:document_id AS uuid))
+          AND NOT EXISTS (
+              SELECT 1
+              FROM tender_documents td
+              JOIN embedding_centroids c ON c.scope = 'document' AND c.entity_id = td.id
+              WHERE td.tender_id = t.entity_id
+          )
+    """)
+
+    def _nearest_sql(self, scope: str, document_type: Optional[str]):
+        """KNN over the centroids of a scope, around the centroid of :entity_id."""
+        if scope not in self.SCOPES:
+            raise ValueError(f"Unknown centroid scope '{scope}' (expected one of {', '.join(self.SCOPES)})")
+
+        type_filter, params = vector_index_service.type_filter([document_type] if document_type else None)
+        sql = text(f"""
+            SELECT
+                entity_id,
+                document_type,
+                embedding <=> (
+                    SELECT embedding FROM embedding_centroids
+                    WHERE scope = '{scope}' AND entity_id = :entity_id
+                ) AS distance
+            FROM embedding_centroids
+            WHERE scope = '{scope}'
+              AND entity_id != :entity_id
+              AND {type_filter}
+            ORDER BY distance
+            LIMIT :limit
+        """)
+        return sql, params
+
+    @staticmethod
+    def _neighbours(rows) -> List[Dict[str, Any]]:
+        """Neighbour dicts (no rows when the reference has no centroid: distances are NULL)."""
+        return [
+            {"entity_id": str(row.entity_id), "document_type": row.document_type, "similarity_score": 1 - float(row.distance)}
+            for row in rows
+            if row.distance is not None
+        ]
+
+    # ========== SYNCHRONOUS METHODS FOR CELERY TASKS ==========
+
+    def refresh_document_sync(self, db: Session, document_id: UUID) -> None:
+        """
+        Recompute the centroids of a document and of its tender, and commit.
+
+        Args:
+            db: Sync database session
+            document_id: document_embeddings.document_id
+        """
+        params = {"document_id": str(document_id)}
+        for statement in (
+            self.REFRESH_DOCUMENTS_SQL, self.DELETE_EMPTY_DOCUMENT_SQL,
+            self.REFRESH_TENDERS_SQL, self.DELETE_EMPTY_TENDER_SQL
+        ):
+            db.execute(statement, params)
+        db.commit()
+
+    def refresh_all_sync(self, db: Session) -> Dict[str, int]:
+        """
+        Recompute every centroid (backfill), and commit.
+
+        Returns:
+            {"documents": int, "tenders": int} centroids written
+        """
+        params = {"document_id": None}
+        db.execute(text("DELETE FROM embedding_centroids"))
+        documents = db.execute(self.REFRESH_DOCUMENTS_SQL, params).rowcount
+        tenders = db.execute(self.REFRESH_TENDERS_SQL, params).rowcount
+        db.commit()
+        return {"documents": documents, "tenders": tenders}
+
+    def nearest_sync(
+        self,
+        db: Session,
+        scope: str,
+        entity_id: UUID,
+        limit: int = 5,
+        document_type: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Documents or tenders whose centroid is closest to the centroid of entity_id.
+
+        Args:
+            db: Sync database session
+            scope: "document" or "tender"
+            entity_id: Reference document or tender
+            limit: Number of neighbours
+            document_type: Only documents of this type (document scope)
+
+        Returns:
+            [{"entity_id": str, "document_type": str or None, "similarity_score": float}]
+        """
+        sql, params = self._nearest_sql(scope, document_type)
+        vector_index_service.apply_search_params_sync(db, limit)
+        rows = db.execute(sql, {"entity_id": str(entity_id), "limit": limit, **params}).fetchall()
+        return self._neighbours(rows)
+
+    # ========== ASYNC METHODS FOR API ENDPOINTS ==========
+
+    async def refresh_document(self, db: AsyncSession, document_id: UUID) -> None:
+        """Async variant of refresh_document_sync."""
+        params = {"document_id": str(document_id)}
+        for statement in (
+            self.REFRESH_DOCUMENTS_SQL, self.DELETE_EMPTY_DOCUMENT_SQL,
+            self.REFRESH_TENDERS_SQL, self.DELETE_EMPTY_TENDER_SQL
+        ):
+            await db.execute(statement, params)
+        await db.commit()
+
+    async def nearest(
+        self,
+        db: AsyncSession,
+        scope: str,
+        entity_id: UUID,
+        limit: int = 5,
+        document_type: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Async variant of nearest_sync."""
+        sql, params = self._nearest_sql(scope, document_type)
+        await vector_index_service.apply_search_params(db, limit)
+        result = await db.execute(sql, {"entity_id": str(entity_id), "limit": limit, **params})
+        return self._neighbours(result.fetchall())
+
+
+# Global instance
+centroid_service = CentroidService()
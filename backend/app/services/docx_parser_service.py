@@ -0,0 +1,232 @@
+"""
+DOCX parsing service (acte d'engagement, memo templates).
+"""
+import io
+import os
+import re
+from typing import Dict, Any, Optional, Union, BinaryIO
+
+import docx
+from docx.oxml.ns import qn
+from docx.table import Table
+from docx.text.paragraph import Paragraph
+
+from app.services.parser_service import parser_service
+
+
+class DocxParserService:
+    """
+    Service for parsing Word documents without converting them to PDF.
+
+    Sections come straight from the document structure: heading levels are
+    read from outline levels (paragraph or style chain, e.g. "Heading 2" or a
+    custom template style based on it), and section numbers from explicit
+    numbering in the title or, failing that, the heading outline position.
+    The regex-based ParserService._detect_sections is never used.
+
+    Pages follow the page breaks rendered by Word when the file was saved,
+    and the output has the same shape as ParserService.extract_from_pdf_sync.
+
+    Bump PARSER_VERSION (parser_service) whenever the output changes.
+    """
+
+    # "Heading 2", "Titre 2" (French Word) when no outline level is declared
+    HEADING_STYLE_PATTERN = re.compile(r'^(?:heading|titre)\s*(\d)$', re.IGNORECASE)
+
+    # Explicit numbering typed in the title: "3.1 Titre", "2. Titre"
+    NUMBERED_TITLE_PATTERN = re.compile(r'^(\d+(?:\.\d+)*)\.?\s+(.+)$')
+
+    # ========== SYNCHRONOUS METHODS FOR CELERY TASKS ==========
+
+    def extract_from_docx_sync(
+        self,
+        source: Union[str, os.PathLike, bytes, BinaryIO]
+    ) -> Dict[str, Any]:
+        """
+        Extract sections, tables and text from a .docx document (sync version for Celery tasks).
+
+        Args:
+            source: File path, bytes or binary file object
+
+        Returns:
+            Same structure as ParserService.extract_from_pdf_sync
+            (sections of type "HEADING", level = outline level)
+        """
+        if isinstance(source, (bytes, bytearray)):
+            source = io.BytesIO(source)
+
+        document = docx.Document(source)
+        page_results = self._extract_pages(document)
+
+        extraction = parser_service._merge_page_results(page_results)
+
+        structured_data = parser_service._extract_structured_info_enhanced_sync(
+            extraction["text"],
+            extraction["tables"],
+            extraction["sections"]
+        )
+
+        return {
+            "text": extraction["text"],
+            "tables": extraction["tables"],
+            "sections": extraction["sections"],
+            "page_fingerprints": extraction["page_fingerprints"],
+            "metadata": self._extract_metadata(document, len(page_results)),
+            "structured": structured_data,
+            "page_count": len(page_results),
+            "extraction_method": "python-docx"
+        }
+
+    def _extract_pages(self, document) -> list[Dict[str, Any]]:
+        """
+        Walk the body (paragraphs and tables in document order) once.
+
+        Returns:
+            Page results in the shape of ParserService._extract_page_sync
+        """
+        style_levels: Dict[str, Optional[int]] = {}
+        counters: list[int] = []  # Heading outline position, for unnumbered titles
+
+        pages = [self._new_page(1)]
+
+        for block in document.iter_inner_content():
+            page = pages[-1]
+
+            if isinstance(block, Table):
+                rows = [[" ".join(cell.text.split()) for cell in row.cells] for row in block.rows]
+                for row in rows:
+                    page["lines"].append(" | ".join(cell for cell in row if cell))
+                self._add_table(page, rows)
+                continue
+
+            if block.contains_page_break and page["lines"]:
+                page = self._new_page(len(pages) + 1)
+                pages.append(page)
+
+            text = " ".join(block.text.split())
+            if not text:
+                continue
+
+            level = self._heading_level(block, style_levels)
+            if level is not None:
+                # Outline position: "2.3" for the 3rd level-2 heading under the 2nd level-1
+                counters = (counters + [0] * level)[:level]
+                counters[-1] += 1
+
+                match = self.NUMBERED_TITLE_PATTERN.match(text)
+                if match:
+                    number, title = match.group(1), match.group(2)
+                else:
+                    number, title = ".".join(str(c) for c in counters), text
+
+                line_num = len(page["lines"])
+                page["sections"].append({
+                    "type": "HEADING",
+                    "number": number,
+                    "title": title,
+                    "level": level,
+                    "page": page["page"],
+                    "line": line_num,
+                    "content": text,  # Will be enriched later
+                    "start_line": line_num
+                })
+
+            page["lines"].append(text)
+
+        return [
+            {
+                "page": page["page"],
+                "text": "\n".join(page["lines"]),
+                "tables": page["tables"],
+                "sections": page["sections"]
+            }
+            for page in pages
+        ]
+
+    def _new_page(self, page_num: int) -> Dict[str, Any]:
+        """Empty page accumulator."""
+        return {"page": page_num, "lines": [], "tables": [], "sections": []}
+
+    def _add_table(self, page: Dict[str, Any], rows: list[list[str]]) -> None:
+        """Append a structured table (same shape as the PDF path), skipping empty ones."""
+        if not any(any(cell for cell in row) for row in rows):
+            return
+
+        page["tables"].append({
+            "id": f"table_p{page['page']}_{len(page['tables'])}",
+            "page": page["page"],
+            "headers": rows[0],
+            "rows": rows[1:],
+            "row_count": len(rows) - 1,
+            "col_count": len(rows[0])
+        })
+
+    def _heading_level(
+        self,
+        paragraph: Paragraph,
+        style_levels: Dict[str, Optional[int]]
+    ) -> Optional[int]:
+        """
+        1-based heading level of a paragraph, or None for body text.
+
+        A direct outline level on the paragraph wins; otherwise the style chain
+        is searched (memoized per style id in style_levels: resolving a style
+        object is the costly part of walking a document).
+        """
+        level = self._outline_level(paragraph._p.pPr)
+        if level is not None:
+            return level
+
+        style_id = paragraph._p.style
+        if style_id not in style_levels:
+            style = paragraph.style
+            style_levels[style_id] = self._style_level(style) if style is not None else None
+        return style_levels[style_id]
+
+    def _style_level(self, style) -> Optional[int]:
+        """Heading level declared by a style or one of its base styles."""
+        # Table of contents entries ("toc 1"...) are often based on heading styles
+        if (style.name or "").lower().startswith("toc"):
+            return None
+
+        while style is not None:
+            level = self._outline_level(style.element.pPr)
+            if level is not None:
+                return level
+
+            match = self.HEADING_STYLE_PATTERN.match(style.name or "")
+            if match:
+                return int(match.group(1))
+
+            style = style.base_style
+        return None
+
+    def _outline_level(self, pPr) -> Optional[int]:
+        """Outline level (w:outlineLvl, 0-based in OOXML; 9 = body text) as a 1-based level."""
+        if pPr is None:
+            return None
+
+        outline = pPr.find(qn("w:outlineLvl"))
+        if outline is None:
+            return None
+
+        value = int(outline.get(qn("w:val")))
+        return value + 1 if value < 9 else None
+
+    def _extract_metadata(self, document, page_count: int) -> Dict[str, Any]:
+        """Extract document core properties."""
+        properties = document.core_properties
+
+        return {
+            "page_count": page_count,
+            "title": properties.title or "",
+            "author": properties.author or "",
+            "subject": properties.subject or "",
+            "creator": properties.author or "",
+            "producer": properties.last_modified_by or "",
+            "creation_date": properties.created.isoformat() if properties.created else "",
+        }
+
+
+# Global instance
+docx_parser_service = DocxParserService()
@@ -0,0 +1,231 @@
+"""
+Content-addressed cache for chunk embeddings.
+"""
+import hashlib
+import unicodedata
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+import redis.asyncio as redis
+import redis as redis_sync
+from sqlalchemy import select, update, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.embedding_cache import EmbeddingCacheEntry
+
+
+class EmbeddingCacheService:
+    """
+    Durable embedding cache keyed by SHA-256(model + normalized chunk text).
+
+    Entries live in Postgres (embedding_cache table, next to the vectors they
+    feed); hit/miss and tokens-saved counters live in Redis so they are
+    shared by every API process and Celery worker.
+    """
+
+    STATS_KEY = "embedding_cache:stats"
+
+    # Least recently used entries beyond settings.embedding_cache_max_entries
+    EVICT_SQL = text("""
+        DELETE FROM embedding_cache
+        WHERE cache_key IN (
+            SELECT cache_key FROM embedding_cache
+            ORDER BY last_used_at
+            LIMIT GREATEST((SELECT count(*) FROM embedding_cache) - :max_entries, 0)
+        )
+    """)
+
+    # Planner row estimate (kept current by autovacuum): no scan of the table
+    ESTIMATE_SQL = text("""
+        SELECT GREATEST(reltuples, 0)::bigint FROM pg_class WHERE oid = 'embedding_cache'::regclass
+    """)
+
+    def __init__(self):
+        self.redis_client: redis.Redis | None = None
+        self.redis_sync_client: redis_sync.Redis | None = None
+
+    @staticmethod
+    def normalize_text(chunk_text: str) -> str:
+        """Unicode NFC with whitespace runs collapsed: layout-only differences share an entry."""
+        return " ".join(unicodedata.normalize("NFC", chunk_text).split())
+
+    def cache_key(self, chunk_text: str, model: Optional[str] = None) -> str:
+        """Return the SHA-256 hex digest of the model and the normalized text."""
+        model = model or settings.embedding_model
+        return hashlib.sha256(f"{model}\0{self.normalize_text(chunk_text)}".encode()).hexdigest()
+
+    def _keys(self, texts: List[str]) -> List[str]:
+        """Cache keys of texts for the configured embedding model."""
+        return [self.cache_key(chunk_text) for chunk_text in texts]
+
+    def _new_entries(self, texts: List[str], embeddings: List[List[float]]) -> List[Dict[str, Any]]:
+        """Rows to insert, one per distinct key."""
+        now = datetime.utcnow()
+        entries = {}
+        for key, chunk_text, embedding in zip(self._keys(texts), texts, embeddings):
+            entries[key] = {
+                "cache_key": key,
+                "model": settings.embedding_model,
+                "embedding": embedding,
+                "token_count": len(chunk_text) // 4,
+                "hit_count": 0,
+                "created_at": now,
+                "last_used_at": now
+            }
+        return list(entries.values())
+
+    def _counters(self, found: Dict[str, Any], keys: List[str], tokens: Dict[str, int]) -> Dict[str, int]:
+        """Counter increments of a lookup (tokens_saved: estimated tokens not sent to OpenAI)."""
+        hits = [key for key in keys if key in found]
+        return {
+            "hits": len(hits),
+            "misses": len(keys) - len(hits),
+            "tokens_saved": sum(tokens[key] for key in hits)
+        }
+
+    @staticmethod
+    def _needs_eviction(estimated_rows: int, inserted: int) -> bool:
+        """Whether the rows just inserted may push the table over settings.embedding_cache_max_entries."""
+        return inserted > 0 and estimated_rows + inserted > settings.embedding_cache_max_entries
+
+    # ========== SYNCHRONOUS METHODS FOR CELERY TASKS ==========
+
+    def _get_redis_sync(self) -> redis_sync.Redis:
+        """Get or create sync Redis client."""
+        if self.redis_sync_client is None:
+            self.redis_sync_client = redis_sync.from_url(settings.redis_url)
+        return self.redis_sync_client
+
+    def _record_sync(self, counters: Dict[str, int]) -> None:
+        """Increment the counters (never fails the caller)."""
+        try:
+            pipeline = self._get_redis_sync().pipeline()
+            for field, value in counters.items():
+                pipeline.hincrby(self.STATS_KEY, field, value)
+            pipeline.execute()
+        except Exception as e:
+            print(f"⚠️  Embedding cache stats error: {e}")
+
+    def get_many_sync(self, db: Session, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        Look up the embeddings of texts.
+
+        Args:
+            db: Sync database session
+            texts: Chunk texts
+
+        Returns:
+            Embedding or None (miss) for each text, in order
+        """
+        keys = self._keys(texts)
+        rows = db.execute(
+            select(EmbeddingCacheEntry.cache_key, EmbeddingCacheEntry.embedding, EmbeddingCacheEntry.token_count)
+            .where(EmbeddingCacheEntry.cache_key.in_(set(keys)))
+        ).fetchall()
+        found = {row.cache_key: row.embedding.tolist() for row in rows}
+
+        if found:
+            db.execute(
+                update(EmbeddingCacheEntry)
+                .where(EmbeddingCacheEntry.cache_key.in_(list(found)))
+                .values(hit_count=EmbeddingCacheEntry.hit_count + 1, last_used_at=datetime.utcnow())
+            )
+            db.commit()
+
+        self._record_sync(self._counters(found, keys, {row.cache_key: row.token_count for row in rows}))
+        return [found.get(key) for key in keys]
+
+    def set_many_sync(self, db: Session, texts: List[str], embeddings: List[List[float]]) -> None:
+        """
+        Store embeddings (first writer wins on concurrent inserts).
+
+        Eviction (exact count + LRU delete) only runs when the planner estimate
+        plus the inserted rows exceeds the size limit.
+
+        Args:
+            db: Sync database session
+            texts: Chunk texts
+            embeddings: Their embeddings, in order
+        """
+        entries = self._new_entries(texts, embeddings)
+        if not entries:
+            return
+
+        result = db.execute(insert(EmbeddingCacheEntry).values(entries).on_conflict_do_nothing(index_elements=["cache_key"]))
+        if self._needs_eviction(db.execute(self.ESTIMATE_SQL).scalar() or 0, result.rowcount):
+            db.execute(self.EVICT_SQL, {"max_entries": settings.embedding_cache_max_entries})
+        db.commit()
+
+    # ========== ASYNC METHODS FOR API ENDPOINTS ==========
+
+    async def _get_redis(self) -> redis.Redis:
+        """Get or create async Redis client."""
+        if self.redis_client is None:
+            self.redis_client = await redis.from_url(settings.redis_url)
+        return self.redis_client
+
+    async def _record(self, counters: Dict[str, int]) -> None:
+        """Increment the counters (never fails the caller)."""
+        try:
+            client = await self._get_redis()
+            pipeline = client.pipeline()
+            for field, value in counters.items():
+                pipeline.hincrby(self.STATS_KEY, field, value)
+            await pipeline.execute()
+        except Exception as e:
+            print(f"⚠️  Embedding cache stats error: {e}")
+
+    async def get_many(self, db: AsyncSession, texts: List[str]) -> List[Optional[List[float]]]:
+        """Async variant of get_many_sync."""
+        keys = self._keys(texts)
+        result = await db.execute(
+            select(EmbeddingCacheEntry.cache_key, EmbeddingCacheEntry.embedding, EmbeddingCacheEntry.token_count)
+            .where(EmbeddingCacheEntry.cache_key.in_(set(keys)))
+        )
+        rows = result.fetchall()
+        found = {row.cache_key: row.embedding.tolist() for row in rows}
+
+        if found:
+            await db.execute(
+                update(EmbeddingCacheEntry)
+                .where(EmbeddingCacheEntry.cache_key.in_(list(found)))
+                .values(hit_count=EmbeddingCacheEntry.hit_count + 1, last_used_at=datetime.utcnow())
+            )
+            await db.commit()
+
+        await self._record(self._counters(found, keys, {row.cache_key: row.token_count for row in rows}))
+        return [found.get(key) for key in keys]
+
+    async def set_many(self, db: AsyncSession, texts: List[str], embeddings: List[List[float]]) -> None:
+        """Async variant of set_many_sync."""
+        entries = self._new_entries(texts, embeddings)
+        if not entries:
+            return
+
+        result = await db.execute(insert(EmbeddingCacheEntry).values(entries).on_conflict_do_nothing(index_elements=["cache_key"]))
+        estimated_rows = (await db.execute(self.ESTIMATE_SQL)).scalar() or 0
+        if self._needs_eviction(estimated_rows, result.rowcount):
+            await db.execute(self.EVICT_SQL, {"max_entries": settings.embedding_cache_max_entries})
+        await db.commit()
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """
+        Cache counters since they were last reset.
+
+        Returns:
+            {"hits": int, "misses": int, "hit_rate": float, "tokens_saved": int}
+        """
+        client = await self._get_redis()
+        raw = await client.hgetall(self.STATS_KEY)
+        counters = {"hits": 0, "misses": 0, "tokens_saved": 0}
+        counters.update({field.decode(): int(value) for field, value in raw.items()})
+
+        lookups = counters["hits"] + counters["misses"]
+        return {**counters, "hit_rate": counters["hits"] / lookups if lookups else 0.0}
+
+
+# Global instance
+embedding_cache_service = EmbeddingCacheService()
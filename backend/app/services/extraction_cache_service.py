@@ -0,0 +1,244 @@
+"""
+Content-addressed cache for parser output.
+"""
+import base64
+import hashlib
+import zlib
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+import redis.asyncio as redis
+import redis as redis_sync
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.document_section import DocumentSection
+from app.models.extraction_cache import ExtractionCacheEntry
+from app.services.parser_service import PARSER_VERSION
+
+
+class ExtractionCacheService:
+    """
+    Durable extraction cache keyed by SHA-256(file bytes) + parser version.
+
+    Entries live in Postgres (extraction_cache table); hit/miss counters live
+    in Redis so they are shared by every API process and Celery worker.
+    Changing a setting of DOCUMENT_OPTIONS / OCR_OPTIONS changes the keys, so
+    stale extractions are never served.
+
+    Document payloads store section bodies longer than the DocumentSection
+    preview zlib-compressed (base64), like DocumentSection.content_compressed,
+    instead of a second uncompressed copy of the text.
+    """
+
+    STATS_KEY = "extraction_cache:stats"
+
+    # Settings that change the output of an entry kind: they are part of its cache key
+    OCR_OPTIONS = ("parser_ocr_resolution", "parser_ocr_language")
+    DOCUMENT_OPTIONS = OCR_OPTIONS + (
+        "parser_fidelity",
+        "parser_table_min_edges",
+        "parser_ocr_enabled",
+        "parser_ocr_min_chars",
+        "parser_strip_boilerplate",
+        "parser_boilerplate_zone_lines",
+        "parser_boilerplate_min_ratio",
+        "parser_use_outline",
+        "parser_outline_min_entries",
+    )
+
+    def __init__(self):
+        self.redis_client: redis.Redis | None = None
+        self.redis_sync_client: redis_sync.Redis | None = None
+
+    @staticmethod
+    def hash_content(content: bytes) -> str:
+        """Return the SHA-256 hex digest of the source bytes."""
+        return hashlib.sha256(content).hexdigest()
+
+    def _options_hash(self, kind: str) -> str:
+        """Short hash of the settings the output of an entry kind depends on."""
+        names = self.OCR_OPTIONS if kind == "ocr_page" else self.DOCUMENT_OPTIONS
+        options = "\0".join(f"{name}={getattr(settings, name)}" for name in names)
+        return hashlib.sha256(options.encode()).hexdigest()[:12]
+
+    def _cache_key(self, content_hash: str, kind: str) -> str:
+        """Build the primary key for an entry (parser version and output-affecting settings included)."""
+        return f"{kind}:{content_hash}:{PARSER_VERSION}:{self._options_hash(kind)}"
+
+    @staticmethod
+    def _pack_sections(payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Payload with long section contents replaced by preview + compressed body."""
+        if not payload.get("sections"):
+            return payload
+
+        preview_length = DocumentSection.CONTENT_PREVIEW_LENGTH
+        sections = []
+        for section in payload["sections"]:
+            content = section.get("content") or ""
+            if len(content) > preview_length:
+                section = {
+                    **section,
+                    "content": content[:preview_length],
+                    "content_compressed": base64.b64encode(zlib.compress(content.encode("utf-8"))).decode("ascii"),
+                }
+            sections.append(section)
+        return {**payload, "sections": sections}
+
+    @staticmethod
+    def _unpack_sections(payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Inverse of _pack_sections: sections with their full content."""
+        if not payload.get("sections"):
+            return payload
+
+        sections = []
+        for section in payload["sections"]:
+            if "content_compressed" in section:
+                section = dict(section)
+                section["content"] = zlib.decompress(base64.b64decode(section.pop("content_compressed"))).decode("utf-8")
+            sections.append(section)
+        return {**payload, "sections": sections}
+
+    # ========== SYNCHRONOUS METHODS FOR CELERY TASKS ==========
+
+    def _get_redis_sync(self) -> redis_sync.Redis:
+        """Get or create sync Redis client."""
+        if self.redis_sync_client is None:
+            self.redis_sync_client = redis_sync.from_url(settings.redis_url)
+        return self.redis_sync_client
+
+    def _record_sync(self, kind: str, hit: bool) -> None:
+        """Increment the hit or miss counter (never fails the caller)."""
+        try:
+            self._get_redis_sync().hincrby(self.STATS_KEY, f"{kind}:{'hits' if hit else 'misses'}", 1)
+        except Exception as e:
+            print(f"⚠️  Extraction cache stats error: {e}")
+
+    def get_sync(
+        self,
+        db: Session,
+        content_hash: str,
+        kind: str = "document"
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached extraction.
+
+        Args:
+            db: Sync database session
+            content_hash: SHA-256 of the source bytes (see hash_content)
+            kind: Entry kind (document, ocr_page)
+
+        Returns:
+            Stored payload, or None on miss
+        """
+        cache_key = self._cache_key(content_hash, kind)
+        entry = db.get(ExtractionCacheEntry, cache_key)
+
+        if entry is None:
+            self._record_sync(kind, hit=False)
+            return None
+
+        db.execute(
+            update(ExtractionCacheEntry)
+            .where(ExtractionCacheEntry.cache_key == cache_key)
+            .values(
+                hit_count=ExtractionCacheEntry.hit_count + 1,
+                last_hit_at=datetime.utcnow()
+            )
+        )
+        db.commit()
+
+        self._record_sync(kind, hit=True)
+        return self._unpack_sections(entry.payload)
+
+    def set_sync(
+        self,
+        db: Session,
+        content_hash: str,
+        payload: Dict[str, Any],
+        kind: str = "document"
+    ) -> None:
+        """
+        Store an extraction (first writer wins on concurrent inserts).
+
+        Args:
+            db: Sync database session
+            content_hash: SHA-256 of the source bytes
+            payload: JSON-serializable extraction result
+            kind: Entry kind (document, ocr_page)
+        """
+        stmt = insert(ExtractionCacheEntry).values(
+            cache_key=self._cache_key(content_hash, kind),
+            kind=kind,
+            content_hash=content_hash,
+            parser_version=PARSER_VERSION,
+            payload=self._pack_sections(payload),
+            hit_count=0,
+            created_at=datetime.utcnow()
+        ).on_conflict_do_nothing(index_elements=["cache_key"])
+
+        db.execute(stmt)
+        db.commit()
+
+    def ocr_page_cache(self, db: Session) -> "OcrPageCache":
+        """Per-page OCR cache bound to a session, to pass to the parser."""
+        return OcrPageCache(self, db)
+
+    # ========== ASYNC METHODS FOR API ENDPOINTS ==========
+
+    async def _get_redis(self) -> redis.Redis:
+        """Get or create async Redis client."""
+        if self.redis_client is None:
+            self.redis_client = await redis.from_url(settings.redis_url)
+        return self.redis_client
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """
+        Hit/miss counters per entry kind.
+
+        Returns:
+            {"document": {"hits": int, "misses": int, "hit_rate": float}, ...}
+        """
+        client = await self._get_redis()
+        raw = await client.hgetall(self.STATS_KEY)
+
+        counters: Dict[str, Dict[str, int]] = {}
+        for field, value in raw.items():
+            kind, counter = field.decode().split(":", 1)
+            counters.setdefault(kind, {"hits": 0, "misses": 0})[counter] = int(value)
+
+        return {
+            kind: {
+                **values,
+                "hit_rate": values["hits"] / (values["hits"] + values["misses"])
+                if values["hits"] + values["misses"] else 0.0
+            }
+            for kind, values in counters.items()
+        }
+
+
+class OcrPageCache:
+    """
+    OCR text of scanned pages keyed by page image hash (entry kind "ocr_page").
+
+    A retried or re-uploaded document never sends the same scan to Tesseract twice.
+    """
+
+    def __init__(self, service: ExtractionCacheService, db: Session):
+        self.service = service
+        self.db = db
+
+    def get(self, image_hash: str) -> Optional[str]:
+        """Cached OCR text of a page, or None on miss."""
+        payload = self.service.get_sync(self.db, image_hash, kind="ocr_page")
+        return payload["text"] if payload else None
+
+    def set(self, image_hash: str, text: str) -> None:
+        """Store the OCR text of a page."""
+        self.service.set_sync(self.db, image_hash, {"text": text}, kind="ocr_page")
+
+
+# Global instance
+extraction_cache_service = ExtractionCacheService()
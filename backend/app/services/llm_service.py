@@ -436,7 +436,7 @@ Générez la réponse:
         # Check cache
         cached = await cache.get(cache_key)
         if cached:
-            print(f"✅ Cache hit for structured tender analysis")
+            print("✅ Cache hit for structured tender analysis")
             return json.loads(cached)
 
         prompt = TENDER_ANALYSIS_STRUCTURED_PROMPT.format(
@@ -534,6 +534,61 @@ Générez la réponse:
 
         return result
 
+    def analyze_tender_structured_sync(
+        self,
+        sections: List[Dict[str, Any]],
+        metadata: Dict[str, Any] | None = None
+    ) -> Dict[str, Any]:
+        """
+        Analyze tender using structured sections with hierarchy (sync version for Celery tasks).
+
+        Args:
+            sections: List of structured sections with hierarchy (full content)
+            metadata: Document metadata
+
+        Returns:
+            Analysis results (same format as analyze_tender_sync)
+        """
+        from app.core.prompts import TENDER_ANALYSIS_STRUCTURED_PROMPT
+
+        structured_content = self._build_hierarchical_structure(sections)
+
+        cache = self._get_cache_sync()
+        cache_key = self._cache_key_sync("tender_structured", structured_content)
+
+        # Check cache
+        cached = cache.get(cache_key)
+        if cached:
+            print("✅ Cache hit for structured tender analysis")
+            return json.loads(cached)
+
+        prompt = TENDER_ANALYSIS_STRUCTURED_PROMPT.format(
+            sections=structured_content,
+            metadata=json.dumps(metadata or {}, indent=2, ensure_ascii=False)
+        )
+
+        print(f"🤖 Calling Claude API for structured analysis ({len(prompt)} chars, ~{len(prompt)//4} tokens)...")
+
+        try:
+            response = self.sync_client.messages.create(
+                model=self.model,
+                max_tokens=settings.max_tokens,
+                temperature=settings.temperature,
+                messages=[{"role": "user", "content": prompt}]
+            )
+            print(f"✅ Claude API response received ({response.usage.input_tokens} input, {response.usage.output_tokens} output tokens)")
+        except Exception as e:
+            print(f"❌ Claude API error: {e}")
+            raise
+
+        # Parse response
+        result = self._parse_analysis_response(response.content[0].text)
+
+        # Cache for 1 hour
+        cache.setex(cache_key, 3600, json.dumps(result))
+
+        return result
+
     def extract_criteria_sync(
         self,
         tender_content: str
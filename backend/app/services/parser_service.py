@@ -1,29 +1,209 @@
 """
 Document parsing service for PDF extraction.
 """
+import asyncio
+import hashlib
 import io
-from typing import Dict, Any, Optional
+import math
+import os
+import resource
+import string
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Any, Optional, Iterator, Callable, TextIO, BinaryIO, Union, TYPE_CHECKING
 from datetime import datetime
 import re
 
 import PyPDF2
 import pdfplumber
+import pypdfium2 as pdfium
+import pypdfium2.raw as pdfium_c
 from PIL import Image
 import pytesseract
 
+from app.core.config import settings
+
+if TYPE_CHECKING:
+    from app.services.extraction_cache_service import OcrPageCache
+
+
+# Bump whenever extraction output changes: invalidates the extraction cache
+PARSER_VERSION = "1.11"
+
+
+# ========== PAGE-PARALLEL WORKERS (must be module-level to be picklable) ==========
+
+_worker_pdf_content: Optional[bytes] = None
+_worker_outline: Optional[Dict[int, list[Dict[str, Any]]]] = None
+_worker_fidelity: str = "full"
+
+
+def _init_page_worker(
+    file_content: bytes,
+    outline: Optional[Dict[int, list[Dict[str, Any]]]] = None,
+    fidelity: str = "full"
+) -> None:
+    """Receive the PDF bytes (and outline entries) once per worker process instead of once per chunk."""
+    global _worker_pdf_content, _worker_outline, _worker_fidelity
+    _worker_pdf_content = file_content
+    _worker_outline = outline
+    _worker_fidelity = fidelity
+
+
+def _extract_page_range(page_range: tuple[int, int]) -> list[Dict[str, Any]]:
+    """
+    Extract an inclusive 1-based page range in a worker process.
+
+    Args:
+        page_range: (first_page, last_page)
+
+    Returns:
+        Per-page results in page order (see ParserService._extract_page_sync)
+    """
+    first_page, last_page = page_range
+
+    return parser_service._extract_page_results_sync(
+        _worker_pdf_content,
+        _worker_outline,
+        _worker_fidelity,
+        page_numbers=list(range(first_page, last_page + 1))
+    )
+
+
+# ========== ASYNC EXTRACTION WORKERS ==========
+
+def _extract_pdf_in_worker(file_content: bytes, use_ocr: bool) -> Dict[str, Any]:
+    """
+    Full extraction in a worker of the async API pool.
+
+    Pages are not re-parallelized: the pool already runs one document per core.
+    """
+    return parser_service.extract_from_pdf_sync(file_content, use_ocr=use_ocr, parallel=False)
+
+
+# ========== OCR WORKERS ==========
+
+_worker_ocr_pdf = None
+
+
+def _init_ocr_worker(source: Union[str, bytes]) -> None:
+    """Open the PDF once per OCR worker process."""
+    global _worker_ocr_pdf
+    _worker_ocr_pdf = pdfplumber.open(parser_service._as_pdf_source(source))
+
+
+def _ocr_page(page_num: int) -> tuple[int, Optional[str]]:
+    """
+    OCR a single 1-based page in a worker process.
+
+    Returns:
+        (page_num, text) where text is None if OCR failed
+    """
+    return page_num, parser_service._ocr_pdf_page_sync(_worker_ocr_pdf, page_num)
+
+
+# ========== EXTRACTION BUDGET ==========
+
+class ParseBudgetExceeded(Exception):
+    """A document extraction went over its ParseBudget."""
+
+    def __init__(self, diagnostics: Dict[str, Any]):
+        super().__init__(
+            f"{diagnostics['resource']} budget exceeded ({diagnostics[diagnostics['resource']]} > "
+            f"{diagnostics['limit']}) during {diagnostics['stage']}, page {diagnostics['page']}"
+        )
+        self.diagnostics = diagnostics
+
+
+class ParseBudget:
+    """
+    CPU-time, wall-time and RSS budget of one document extraction.
+
+    Checked between pages (a page is never interrupted), so a budget can be
+    overrun by the cost of one page; the Celery time limits remain the hard
+    stop. CPU time is the calling process's own: page-parallel and OCR pool
+    workers only count through wall time. A limit of 0 disables it.
+    """
+
+    def __init__(self, cpu_seconds: float = 0, wall_seconds: float = 0, rss_mb: float = 0):
+        self.limits = {"cpu_seconds": cpu_seconds, "wall_seconds": wall_seconds, "rss_mb": rss_mb}
+        self._cpu_start = time.process_time()
+        self._wall_start = time.monotonic()
+
+    @classmethod
+    def from_settings(cls) -> "ParseBudget":
+        """Budget of a Celery document extraction (settings.parser_budget_*)."""
+        return cls(
+            cpu_seconds=settings.parser_budget_cpu_seconds,
+            wall_seconds=settings.parser_budget_wall_seconds,
+            rss_mb=settings.parser_budget_rss_mb
+        )
+
+    def usage(self) -> Dict[str, float]:
+        """Resources used since the budget was created (RSS: current, whole process)."""
+        return {
+            "cpu_seconds": time.process_time() - self._cpu_start,
+            "wall_seconds": time.monotonic() - self._wall_start,
+            "rss_mb": self._rss_mb(),
+        }
+
+    def check(self, stage: str, page: Optional[int] = None) -> None:
+        """
+        Raise ParseBudgetExceeded if any limit is exceeded.
+
+        Args:
+            stage: What is being extracted ("pages", "ocr"), for diagnostics
+            page: 1-based page reached
+        """
+        usage = self.usage()
+        for name, limit in self.limits.items():
+            if limit and usage[name] > limit:
+                rounded = {key: round(value, 2) for key, value in usage.items()}
+                raise ParseBudgetExceeded({"resource": name, "limit": limit, "stage": stage, "page": page, **rounded})
+
+    def _rss_mb(self) -> float:
+        """Resident set size in MB (peak RSS where /proc is not available)."""
+        try:
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+        except (OSError, ValueError):
+            return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
 
 class ParserService:
     """Service for parsing tender documents."""
 
+    # Fidelity levels, from fastest to most complete:
+    #   fast      pdfium text layer only, no tables
+    #   standard  pdfium text, pdfplumber (text + tables) on pages passing the table pre-check
+    #   full      pdfplumber on every page
+    # Scanned pages always go through pdfplumber, which renders and hashes them for OCR.
+    FIDELITY_LEVELS = ("fast", "standard", "full")
+    EXTRACTION_METHODS = {"fast": "pdfium_fast", "standard": "pdfium_standard", "full": "pdfplumber_enhanced"}
+
+    # Shorter edges are ignored by pdfplumber's table finder (edge_min_length)
+    RULING_MIN_LENGTH = 3
+
+    # Streaming OCR holds at most this many batches of pages (see _ocr_in_batches)
+    OCR_BATCH_HOLD_FACTOR = 4
+
     def __init__(self):
         self.tesseract_config = "--oem 3 --psm 6"
 
+        # Process pool of the async API, created on first use
+        self._async_executor: Optional[ProcessPoolExecutor] = None
+
         # TOC detection patterns
         self.TOC_INDICATORS = [
             r'\.{3,}',  # 3+ consecutive dots (...)
             r'\s+\d+\s*$',  # ends with page number
         ]
 
+        # Section content scanned for key-section keywords (the full body is kept)
+        self.KEY_SECTION_SCAN_CHARS = 2000
+
         # Key section detection patterns (case-insensitive)
         self.KEY_SECTION_PATTERNS = [
             # Exclusions
@@ -74,165 +254,168 @@ class ParserService:
             (r'transfert\s+de\s+connaissances?', 'transition'),
         ]
 
-    async def extract_from_pdf(
-        self,
-        file_content: bytes,
-        use_ocr: bool = False
-    ) -> Dict[str, Any]:
-        """
-        Extract text and metadata from PDF with enhanced structure.
-
-        Args:
-            file_content: PDF file content as bytes
-            use_ocr: Whether to use OCR for scanned PDFs
-
-        Returns:
-            Extracted content and metadata including tables and sections
-        """
-        pdf_file = io.BytesIO(file_content)
+        # Section header patterns (ordre important: du plus spécifique au plus général)
+        self.SECTION_PATTERNS = [
+            # PARTIE 1 – Titre
+            (r'^PARTIE\s+([IVX\d]+)\s*[–-]\s*(.+)$', 'PART', 1),
+            # Article 1 – Titre
+            (r'^Article\s+(\d+)\s*[–-]\s*(.+)$', 'ARTICLE', 2),
+            # 3.1.2 Titre (numérotation hiérarchique)
+            (r'^(\d+(?:\.\d+)+)\s+(.+)$', 'SECTION', 3),
+            # 1. Titre (liste numérotée niveau 1)
+            (r'^(\d+)\.\s+([A-ZÀÂÄÆÇÉÈÊËÏÎÔŒÙÛÜ].+)$', 'NUMBERED_ITEM', 4),
+        ]
 
-        # IMPROVED: Use pdfplumber for better extraction
-        extraction = await self._extract_with_pdfplumber_enhanced(pdf_file)
+        # French dates: 15/03/2024, 15-03-24, 1er mars 2024, optionally followed by a time (à 12h00)
+        self.FRENCH_MONTHS = {
+            "janvier": 1, "février": 2, "fevrier": 2, "mars": 3, "avril": 4, "mai": 5, "juin": 6,
+            "juillet": 7, "août": 8, "aout": 8, "septembre": 9, "octobre": 10, "novembre": 11,
+            "décembre": 12, "decembre": 12,
+        }
+        months = '|'.join(self.FRENCH_MONTHS)
+        self.DATE_PATTERN = (
+            r'(?P<day>\d{1,2})(?:[/-](?P<month>\d{1,2})[/-](?P<year>\d{2,4})'
+            r'|(?:er)?[^\S\n]+(?P<month_name>' + months + r')[^\S\n]+(?P<full_year>\d{4}))\b'
+            r'(?:[^\S\n]*(?:à|,)?[^\S\n]*(?P<hour>\d{1,2})[^\S\n]*[h:][^\S\n]*(?P<minute>\d{2})?\b)?'
+        )
 
-        # If no text found, try OCR
-        if not extraction["text"].strip() and use_ocr:
-            pdf_file.seek(0)
-            extraction["text"] = await self._extract_with_ocr(pdf_file)
+        # Lines announcing a deadline: their dates are reported as deadlines
+        self.DEADLINE_KEYWORDS = [
+            "date limite",
+            "avant le",
+            "échéance",
+            "remise des offres",
+            "dépôt des candidatures"
+        ]
 
-        # Extract metadata
-        pdf_file.seek(0)
-        metadata = await self._extract_metadata(pdf_file)
+        # Structured info: one pass per pattern, each with findall semantics (its matches
+        # never overlap each other, but may overlap those of another pattern: "Marché n° 2024/015/AO"
+        # is both a market reference and a 2024/015/AO reference). Patterns open with the
+        # character they must start on, so the regex engine jumps from one occurrence of it to
+        # the next instead of trying the pattern at every position; lookbehinds placed after
+        # it restore the leading word boundaries.
+        self.STRUCTURED_INFO_PATTERNS = [
+            # contact@acheteur.fr (from the "@": the local part is read backwards)
+            (r'@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', 'email'),
+            # 2024/123/AO
+            (r'\d(?<!\w\d)\d{3}[-/]\d{2,4}[-/]\w+\b', 'reference'),
+            # AO-2024-123
+            (r'[Aa](?<!\w[Aa])[Oo][-/]?\d{4}[-/]?\d+\b', 'reference'),
+            # Marché n° 2024-123
+            (r'[Mm](?<!\w[Mm])(?i:arché\s+n°\s*[\w-]+)\b', 'reference'),
+            # 01 23 45 67 89, +33 1 23 45 67 89
+            (r'(?:0(?<!\w0)|\+(?<=\w\+)33)[1-9](?:[\s.-]?\d{2}){4}\b', 'phone'),
+            # DATE_PATTERN, kept on deadline lines only
+            (r'\d(?<!\w\d)\d?(?:[/-]\d{1,2}[/-]\d{2,4}|(?:er)?[^\S\n]+(?i:' + months + r')[^\S\n]+\d{4})\b'
+             r'(?:[^\S\n]*(?:à|,)?[^\S\n]*\d{1,2}[^\S\n]*[h:][^\S\n]*(?:\d{2})?\b)?', 'date'),
+        ]
 
-        # Extract structured information (ENHANCED)
-        structured_data = await self._extract_structured_info_enhanced(
-            extraction["text"],
-            extraction["tables"],
-            extraction["sections"]
+        # Precompiled classification engine built from the pattern lists above
+        self._section_header_re, self._section_header_groups = self._compile_section_patterns()
+        self._key_section_any_res, self._key_section_res = self._compile_key_section_patterns()
+        self._structured_info_res = [
+            (re.compile(pattern), kind) for pattern, kind in self.STRUCTURED_INFO_PATTERNS
+        ]
+        self._email_local_re = re.compile(r'\b[A-Za-z0-9._%+-]+\Z')
+        self._email_local_chars = frozenset(string.ascii_letters + string.digits + "._%+-")
+        self._boilerplate_digits_re = re.compile(r'\d+')
+        # pdfium drops the tab between a heading number and its title ("11.1.1Demandes")
+        self._pdfium_heading_gap_re = re.compile(
+            r'^(\d+(?:\.\d+)+\.?|\d+\.)(?=[A-ZÀÂÄÆÇÉÈÊËÏÎÔŒÙÛÜ])', re.MULTILINE
         )
+        self._date_re = re.compile(self.DATE_PATTERN, re.IGNORECASE)
 
-        return {
-            "text": extraction["text"],
-            "tables": extraction["tables"],  # NEW: structured tables
-            "sections": extraction["sections"],  # NEW: detected sections
-            "metadata": metadata,
-            "structured": structured_data,
-            "page_count": metadata.get("page_count", 0),
-            "extraction_method": "pdfplumber_enhanced"
-        }
+    def _compile_section_patterns(self) -> tuple[re.Pattern, Dict[str, tuple[int, int, int]]]:
+        """
+        Combine SECTION_PATTERNS into one multiline pattern run over a whole page.
 
-    async def _extract_text_pypdf2(self, pdf_file: io.BytesIO) -> str:
-        """Extract text using PyPDF2."""
-        try:
-            reader = PyPDF2.PdfReader(pdf_file)
-            text_parts = []
+        Each pattern becomes a named alternative (its section type), tried in
+        order like the original per-line loop. Patterns are written for a
+        stripped line, so whitespace is kept from crossing line breaks and
+        surrounding whitespace is allowed around each line.
 
-            for page in reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text_parts.append(page_text)
+        Returns:
+            (compiled pattern, {section_type: (level, number_group, title_group)})
+        """
+        alternatives = []
+        groups = {}
+        group_index = 0
 
-            return "\n\n".join(text_parts)
-        except Exception as e:
-            print(f"PyPDF2 extraction error: {e}")
-            return ""
+        for pattern, section_type, level in self.SECTION_PATTERNS:
+            body = pattern.lstrip('^').rstrip('$').replace(r'\s', r'[^\S\n]')
+            alternatives.append(f"(?P<{section_type}>{body})")
+            groups[section_type] = (level, group_index + 2, group_index + 3)
+            group_index += 1 + re.compile(body).groups
 
-    async def _extract_text_pdfplumber(self, pdf_file: io.BytesIO) -> str:
-        """Extract text using pdfplumber (better table support)."""
-        try:
-            text_parts = []
+        combined = r'^[^\S\n]*(?:' + '|'.join(alternatives) + r')(?<=\S)[^\S\n]*$'
+        return re.compile(combined, re.IGNORECASE | re.MULTILINE), groups
 
-            with pdfplumber.open(pdf_file) as pdf:
-                for page in pdf.pages:
-                    # Extract text
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_parts.append(page_text)
+    def _compile_key_section_patterns(self) -> tuple[list[Optional[re.Pattern]], list[re.Pattern]]:
+        """
+        Combine KEY_SECTION_PATTERNS into alternations of their first n patterns.
 
-                    # Extract tables
-                    tables = page.extract_tables()
-                    for table in tables:
-                        table_text = self._format_table(table)
-                        text_parts.append(table_text)
+        Index n of the first list holds one pattern matching any of the first n
+        key patterns. Alternations are plain (no groups, case-sensitive on
+        lowercased text) so the regex engine keeps its fast prefix scan; the
+        individual patterns in the second list only identify which one matched.
 
-            return "\n\n".join(text_parts)
-        except Exception as e:
-            print(f"pdfplumber extraction error: {e}")
-            return ""
+        Returns:
+            (alternations by prefix length, individual patterns)
+        """
+        patterns = [pattern for pattern, _ in self.KEY_SECTION_PATTERNS]
+        alternations = [None] + [
+            re.compile('|'.join(f"(?:{pattern})" for pattern in patterns[:n]))
+            for n in range(1, len(patterns) + 1)
+        ]
+        return alternations, [re.compile(pattern) for pattern in patterns]
 
-    async def _extract_with_pdfplumber_enhanced(
+    async def extract_from_pdf(
         self,
-        pdf_file: io.BytesIO
+        file_content: bytes,
+        use_ocr: bool = False
     ) -> Dict[str, Any]:
         """
-        Enhanced extraction with pdfplumber: text + structured tables + sections with content.
+        Extract text and metadata from PDF with enhanced structure.
+
+        Parsing is CPU-bound: extract_from_pdf_sync runs in a process pool
+        (settings.parser_async_workers) so the event loop keeps serving other
+        requests meanwhile.
+
+        Args:
+            file_content: PDF file content as bytes
+            use_ocr: Whether to OCR pages without a usable text layer
 
         Returns:
-            {
-                "text": str,
-                "tables": List[Dict],  # Structured tables with headers/rows
-                "sections": List[Dict]  # Detected sections with full content
-            }
+            Same structure as extract_from_pdf_sync
         """
-        try:
-            text_parts = []
-            tables = []
-            sections = []
-            pages_text = {}  # Store text by page for content extraction
-
-            with pdfplumber.open(pdf_file) as pdf:
-                for page_num, page in enumerate(pdf.pages, start=1):
-                    # Extract text
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_parts.append(page_text)
-                        pages_text[page_num] = page_text
-
-                        # Detect sections in text
-                        detected_sections = self._detect_sections(page_text, page_num)
-                        sections.extend(detected_sections)
-
-                    # Extract tables as STRUCTURED data
-                    page_tables = page.extract_tables()
-                    for table_idx, table_data in enumerate(page_tables):
-                        if table_data and len(table_data) > 0:
-                            # Clean empty cells
-                            cleaned_table = [
-                                [cell.strip() if cell else "" for cell in row]
-                                for row in table_data
-                            ]
-
-                            # Skip empty tables
-                            if any(any(cell for cell in row) for row in cleaned_table):
-                                structured_table = {
-                                    "id": f"table_p{page_num}_{table_idx}",
-                                    "page": page_num,
-                                    "headers": cleaned_table[0] if len(cleaned_table) > 0 else [],
-                                    "rows": cleaned_table[1:] if len(cleaned_table) > 1 else [],
-                                    "row_count": len(cleaned_table) - 1,
-                                    "col_count": len(cleaned_table[0]) if cleaned_table else 0
-                                }
-                                tables.append(structured_table)
-
-            # IMPROVED: Extract full content for sections
-            sections = self._extract_section_content_from_pages(sections, pages_text)
-
-            # Build parent-child hierarchy
-            sections = self._build_section_hierarchy(sections)
+        loop = asyncio.get_running_loop()
 
-            return {
-                "text": "\n\n".join(text_parts),
-                "tables": tables,
-                "sections": sections
-            }
-        except Exception as e:
-            print(f"Enhanced pdfplumber extraction error: {e}")
-            import traceback
-            traceback.print_exc()
-            return {
-                "text": "",
-                "tables": [],
-                "sections": []
-            }
+        try:
+            return await loop.run_in_executor(
+                self._get_async_executor(),
+                _extract_pdf_in_worker,
+                file_content,
+                use_ocr
+            )
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM-killed): the next call starts a fresh pool
+            self._async_executor = None
+            raise
+
+    def _get_async_executor(self) -> ProcessPoolExecutor:
+        """Process pool of the async API (workers are recycled to bound memory)."""
+        if self._async_executor is None:
+            self._async_executor = ProcessPoolExecutor(
+                max_workers=settings.parser_async_workers or os.cpu_count() or 1,
+                max_tasks_per_child=settings.parser_async_max_tasks_per_child or None
+            )
+        return self._async_executor
+
+    def shutdown_async_executor(self) -> None:
+        """Stop the async API process pool (application shutdown)."""
+        if self._async_executor is not None:
+            self._async_executor.shutdown(wait=False, cancel_futures=True)
+            self._async_executor = None
 
     def _extract_section_content_from_pages(
         self,
@@ -288,17 +471,19 @@ class ParserService:
                         if line:  # Skip empty lines
                             content_lines.append(line)
 
-                # Store full content (limit to 2000 chars)
+                # Store full content (DocumentSection keeps a preview and the compressed body)
                 full_content = "\n".join(content_lines)
-                section["content"] = full_content[:2000] if len(full_content) > 2000 else full_content
+                section["content"] = full_content
                 section["content_length"] = len(full_content)
-                section["content_truncated"] = len(full_content) > 2000
 
                 # Detect if section is TOC
                 section["is_toc"] = self._is_toc_section(section)
 
-                # Detect if section is key section
-                is_key, category = self._is_key_section(section)
+                # Detect if section is key section (on the section start, as a long body
+                # would match almost every keyword)
+                is_key, category = self._is_key_section(
+                    {**section, "content": full_content[:self.KEY_SECTION_SCAN_CHARS]}
+                )
                 section["is_key_section"] = is_key
                 section["key_category"] = category if is_key else None
 
@@ -366,18 +551,39 @@ class ParserService:
         title = section.get("title", "").lower()
         content = section.get("content", "").lower()
 
-        # Check title and content against patterns
-        for pattern, category in self.KEY_SECTION_PATTERNS:
-            # Match in title (stronger signal)
-            if re.search(pattern, title, re.IGNORECASE):
-                return True, category
+        # Lowest-index pattern matching the title (stronger signal)...
+        best = self._first_key_pattern(title, len(self.KEY_SECTION_PATTERNS))
+
+        # ...or the content (weaker signal, requires longer content)
+        if len(content) > 100:
+            best = self._first_key_pattern(content, best)
 
-            # Match in content (weaker signal, requires longer content)
-            if len(content) > 100 and re.search(pattern, content, re.IGNORECASE):
-                return True, category
+        if best < len(self.KEY_SECTION_PATTERNS):
+            return True, self.KEY_SECTION_PATTERNS[best][1]
 
         return False, None
 
+    def _first_key_pattern(self, text: str, limit: int) -> int:
+        """
+        Lowest index below limit of a KEY_SECTION_PATTERNS entry found in text.
+
+        Scans the (lowercased) text left to right with one alternation: at each
+        match position the lowest matching index is kept, and only lower indices
+        are searched for afterwards.
+
+        Returns:
+            Pattern index, or limit if none of the first limit patterns match
+        """
+        pos = 0
+        while limit:
+            match = self._key_section_any_res[limit].search(text, pos)
+            if not match:
+                break
+            start = match.start()
+            limit = next(i for i in range(limit) if self._key_section_res[i].match(text, start))
+            pos = start + 1
+        return limit
+
     def _build_section_hierarchy(
         self,
         sections: list[Dict[str, Any]]
@@ -430,139 +636,162 @@ class ParserService:
             List of detected sections with type, number, title, level
         """
         sections = []
+        line_num = 0
+        line_pos = 0
+
+        # One scan of the page: every header line, whatever its type
+        for match in self._section_header_re.finditer(text):
+            line_num += text.count('\n', line_pos, match.start())
+            line_pos = match.start()
+
+            section_type = match.lastgroup
+            level, number_group, title_group = self._section_header_groups[section_type]
+
+            sections.append({
+                "type": section_type,
+                "number": match.group(number_group),
+                "title": match.group(title_group).strip(),
+                "level": level,
+                "page": page_num,
+                "line": line_num,
+                "content": match.group(0).strip(),  # Will be enriched later
+                "start_line": line_num
+            })
 
-        # Patterns de détection (ordre important: du plus spécifique au plus général)
-        PATTERNS = [
-            # PARTIE 1 – Titre
-            (r'^PARTIE\s+([IVX\d]+)\s*[–-]\s*(.+)$', 'PART', 1),
-            # Article 1 – Titre
-            (r'^Article\s+(\d+)\s*[–-]\s*(.+)$', 'ARTICLE', 2),
-            # 3.1.2 Titre (numérotation hiérarchique)
-            (r'^(\d+(?:\.\d+)+)\s+(.+)$', 'SECTION', 3),
-            # 1. Titre (liste numérotée niveau 1)
-            (r'^(\d+)\.\s+([A-ZÀÂÄÆÇÉÈÊËÏÎÔŒÙÛÜ].+)$', 'NUMBERED_ITEM', 4),
-        ]
-
-        lines = text.split('\n')
-
-        for line_num, line in enumerate(lines):
-            line_stripped = line.strip()
-
-            # Skip empty lines or very short lines
-            if len(line_stripped) < 3:
-                continue
+        return sections
 
-            for pattern, section_type, level in PATTERNS:
-                match = re.match(pattern, line_stripped, re.IGNORECASE | re.MULTILINE)
-                if match:
-                    sections.append({
-                        "type": section_type,
-                        "number": match.group(1),
-                        "title": match.group(2).strip() if len(match.groups()) > 1 else "",
-                        "level": level,
-                        "page": page_num,
-                        "line": line_num,
-                        "content": line_stripped,  # Will be enriched later
-                        "start_line": line_num
-                    })
-                    break  # Stop at first match
+    def _extract_outline_sync(self, pdf: pdfium.PdfDocument) -> list[Dict[str, Any]]:
+        """
+        Flatten the PDF outline (bookmarks) in document order.
 
-        return sections
+        Args:
+            pdf: Open pdfium document
 
+        Returns:
+            [{"title": str, "level": int (1-based depth), "page": int (1-based)}],
+            empty if the document has no outline
+        """
+        entries = []
 
-    async def _extract_with_ocr(self, pdf_file: io.BytesIO) -> str:
-        """Extract text using OCR for scanned PDFs."""
         try:
-            # TODO: Implement OCR extraction
-            # Would require pdf2image and pytesseract
-            return "OCR extraction not yet implemented"
+            for bookmark in pdf.get_toc():
+                title = " ".join((bookmark.get_title() or "").split())
+                dest = bookmark.get_dest()
+                page_index = dest.get_index() if dest is not None else None
+                if title and page_index is not None:
+                    entries.append({"title": title, "level": bookmark.level + 1, "page": page_index + 1})
         except Exception as e:
-            print(f"OCR extraction error: {e}")
-            return ""
-
-    async def _extract_metadata(self, pdf_file: io.BytesIO) -> Dict[str, Any]:
-        """Extract PDF metadata."""
-        try:
-            reader = PyPDF2.PdfReader(pdf_file)
-            metadata = reader.metadata or {}
+            print(f"Outline extraction error: {e}")
+            return []
 
-            return {
-                "page_count": len(reader.pages),
-                "title": metadata.get("/Title", ""),
-                "author": metadata.get("/Author", ""),
-                "subject": metadata.get("/Subject", ""),
-                "creator": metadata.get("/Creator", ""),
-                "producer": metadata.get("/Producer", ""),
-                "creation_date": metadata.get("/CreationDate", ""),
-            }
-        except Exception as e:
-            print(f"Metadata extraction error: {e}")
-            return {}
+        return entries
 
-    async def _extract_structured_info(self, text: str) -> Dict[str, Any]:
+    def _outline_by_page(
+        self,
+        outline: Optional[list[Dict[str, Any]]]
+    ) -> Optional[Dict[int, list[Dict[str, Any]]]]:
         """
-        Extract structured information from text.
-
-        Args:
-            text: Extracted text content
+        Group usable outline entries by page, numbering them by outline position.
 
         Returns:
-            Structured data (deadlines, reference numbers, etc.)
+            {page: [entry + "number"]}, or None when sections must be detected
+            in the text (outline disabled, missing or too small to be a table of contents)
         """
-        structured = {
-            "reference_numbers": self._extract_reference_numbers(text),
-            "deadlines": self._extract_deadlines(text),
-            "organizations": self._extract_organizations(text),
-            "email_addresses": self._extract_emails(text),
-            "phone_numbers": self._extract_phones(text),
-        }
+        if not settings.parser_use_outline or len(outline or []) < settings.parser_outline_min_entries:
+            return None
 
-        return structured
+        by_page: Dict[int, list[Dict[str, Any]]] = {}
+        counters: list[int] = []
+
+        for entry in outline:
+            # Outline position: "2.3" for the 3rd level-2 entry under the 2nd level-1
+            level = entry["level"]
+            counters = (counters + [0] * level)[:level]
+            counters[-1] += 1
+
+            by_page.setdefault(entry["page"], []).append(
+                {**entry, "number": ".".join(str(c) for c in counters)}
+            )
+
+        return by_page
 
-    async def _extract_structured_info_enhanced(
+    def _outline_sections(
         self,
-        text: str,
-        tables: list[Dict[str, Any]],
-        sections: list[Dict[str, Any]]
-    ) -> Dict[str, Any]:
+        page_text: str,
+        page_num: int,
+        entries: list[Dict[str, Any]]
+    ) -> list[Dict[str, Any]]:
         """
-        Enhanced structured information extraction with tables and sections context.
+        Sections of a page from its outline entries, anchored on their heading line.
+
+        Headings are searched in order from the previous anchor. A heading line
+        matching SECTION_PATTERNS gives the section type and number, otherwise
+        the section is a "HEADING" numbered by its outline position.
+        An entry whose heading is not in the text (e.g. scanned page) is
+        anchored at the top of the page if it comes first, skipped otherwise.
 
         Args:
-            text: Extracted text
-            tables: Structured tables
-            sections: Detected sections
+            page_text: Page text
+            page_num: Page number
+            entries: Outline entries of the page (see _outline_by_page)
 
         Returns:
-            Enhanced structured data with section context
+            Sections in the shape of _detect_sections
         """
-        # Basic extraction
-        basic_info = {
-            "reference_numbers": self._extract_reference_numbers(text),
-            "deadlines": self._extract_deadlines(text),
-            "organizations": self._extract_organizations(text),
-            "email_addresses": self._extract_emails(text),
-            "phone_numbers": self._extract_phones(text),
-        }
+        lines = page_text.split('\n')
+        normalized = [" ".join(line.split()).lower() for line in lines]
 
-        # Enhanced with sections context
-        enhanced_info = {
-            **basic_info,
-            "section_summary": {
-                "total_sections": len(sections),
-                "parts": len([s for s in sections if s["type"] == "PART"]),
-                "articles": len([s for s in sections if s["type"] == "ARTICLE"]),
-                "subsections": len([s for s in sections if s["type"] == "SECTION"]),
-            },
-            "table_summary": {
-                "total_tables": len(tables),
-                "total_rows": sum(t["row_count"] for t in tables),
-                "tables_by_page": self._group_tables_by_page(tables),
-            },
-            "key_sections": self._identify_key_sections(sections),
-        }
+        sections = []
+        line_num = 0
+
+        for entry in entries:
+            title = entry["title"].lower()
+            found = next(
+                (i for i in range(line_num, len(lines)) if self._is_outline_heading(normalized[i], title)),
+                None
+            )
+
+            heading = entry["title"]
+            if found is not None:
+                line_num = found
+                heading = lines[found].strip()
+            elif sections:
+                continue
 
-        return enhanced_info
+            detected = self._detect_sections(heading, page_num) or self._detect_sections(entry["title"], page_num)
+            if detected:
+                section_type, number = detected[0]["type"], detected[0]["number"]
+                title, level = detected[0]["title"], detected[0]["level"]
+            else:
+                section_type, number, title, level = "HEADING", entry["number"], entry["title"], entry["level"]
+
+            sections.append({
+                "type": section_type,
+                "number": number,
+                "title": title,
+                "level": level,
+                "page": page_num,
+                "line": line_num,
+                "content": heading,  # Will be enriched later
+                "start_line": line_num
+            })
+
+        return sections
+
+    def _is_outline_heading(self, line: str, title: str) -> bool:
+        """
+        Whether a (normalized, lowercased) page line is the heading of an outline title.
+
+        The line may carry a numbering the bookmark lacks ("5.1 Capacité"),
+        or hold only the start of a heading wrapped over several lines.
+        """
+        if not line:
+            return False
+        if line == title or line.startswith(title):
+            return True
+        if line.endswith(" " + title) and len(line) - len(title) <= 16:
+            return True
+        return len(line) >= 16 and title.startswith(line)
 
     def _group_tables_by_page(self, tables: list[Dict]) -> Dict[int, int]:
         """Group tables by page number."""
@@ -638,68 +867,119 @@ class ParserService:
 
         return key_sections
 
-    def _extract_reference_numbers(self, text: str) -> list[str]:
-        """Extract tender reference numbers."""
-        # Common French tender reference patterns
-        patterns = [
-            r'\b\d{4}[-/]\d{2,4}[-/]\w+\b',  # 2024/123/AO
-            r'\bAO[-/]?\d{4}[-/]?\d+\b',      # AO-2024-123
-            r'\bMarché\s+n°\s*[\w-]+\b',      # Marché n° 2024-123
-        ]
-
-        references = []
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            references.extend(matches)
+    def _scan_structured_info(self, text: str) -> Dict[str, Any]:
+        """
+        Collect reference numbers, deadlines, emails and phones, one pass per pattern.
 
-        return list(set(references))
+        Deadlines are the dates of lines containing a deadline keyword, with
+        their normalized datetime. Every item only depends on the line it comes
+        from, so scans of separate pages merge exactly (streaming extraction).
 
-    def _extract_deadlines(self, text: str) -> list[Dict[str, str]]:
-        """Extract deadline dates."""
-        # Common French date patterns
-        date_pattern = r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b'
-        deadline_keywords = [
-            "date limite",
-            "avant le",
-            "échéance",
-            "remise des offres",
-            "dépôt des candidatures"
-        ]
+        Args:
+            text: Extracted text (whole document or a single page)
 
+        Returns:
+            {"reference_numbers", "deadlines", "email_addresses", "phone_numbers"},
+            unique values in order of appearance
+        """
+        found = {"reference": [], "email": [], "phone": []}
         deadlines = []
-        lines = text.split("\n")
+        line_start = line_end = 0
+        is_deadline_line = False
+
+        for pattern, kind in self._structured_info_res:
+            if kind == "email":
+                found[kind].extend(self._scan_emails(pattern, text))
+                continue
+            if kind != "date":
+                found[kind].extend((match.start(), match.group()) for match in pattern.finditer(text))
+                continue
+
+            for match in pattern.finditer(text):
+                start, end = match.span()
+                # Dates are only kept on lines announcing a deadline
+                if start >= line_end:
+                    line_start = text.rfind("\n", 0, start) + 1
+                    line_end = text.find("\n", end)
+                    if line_end < 0:
+                        line_end = len(text)
+                    line_lower = text[line_start:line_end].lower()
+                    is_deadline_line = any(keyword in line_lower for keyword in self.DEADLINE_KEYWORDS)
 
-        for line in lines:
-            line_lower = line.lower()
-            for keyword in deadline_keywords:
-                if keyword in line_lower:
-                    dates = re.findall(date_pattern, line)
-                    for date in dates:
-                        deadlines.append({
-                            "date": date,
-                            "context": line.strip()[:100]
-                        })
+                if is_deadline_line:
+                    deadlines.append(self._build_deadline(match.group(), text[line_start:line_end]))
 
-        return deadlines
+        # Ordered sets: several reference patterns may match, sort them back by position
+        unique = {kind: list(dict.fromkeys(value for _, value in sorted(matches, key=lambda m: m[0])))
+                  for kind, matches in found.items()}
+
+        return {
+            "reference_numbers": unique["reference"],
+            "deadlines": deadlines,
+            "email_addresses": unique["email"],
+            "phone_numbers": unique["phone"],
+        }
+
+    def _scan_emails(self, pattern: re.Pattern, text: str):
+        """
+        (start, email) of every email, as a left-to-right findall would return them.
+
+        The local part is the run of local characters before the "@", from its
+        first word boundary after the previous email (matches never overlap).
+        """
+        previous_end = 0
+        for match in pattern.finditer(text):
+            at, end = match.span()
+            run_start = at
+            while run_start > previous_end and text[run_start - 1] in self._email_local_chars:
+                run_start -= 1
+            local = self._email_local_re.search(text, run_start, at)
+            if local:
+                previous_end = end
+                yield local.start(), text[local.start():end]
+
+    def _build_deadline(self, date_text: str, line: str) -> Dict[str, Optional[str]]:
+        """Deadline entry: raw date, ISO datetime (None if not a valid date) and line context."""
+        value = self._parse_french_date(date_text)
+        return {
+            "date": date_text,
+            "datetime": value.isoformat() if value else None,
+            "context": line.strip()[:100]
+        }
+
+    def _parse_french_date(self, date_text: str) -> Optional[datetime]:
+        """
+        Parse a date matched by DATE_PATTERN ("15/03/24", "1er mars 2024 à 12h00").
+
+        Returns:
+            datetime, or None for impossible dates (31/02, year 202...)
+        """
+        match = self._date_re.match(date_text)
+        if not match:
+            return None
+
+        if match["month_name"]:
+            month = self.FRENCH_MONTHS[match["month_name"].lower()]
+            year = int(match["full_year"])
+        else:
+            month = int(match["month"])
+            year = int(match["year"])
+            if year < 100:
+                year += 2000
+
+        if not 1900 <= year <= 2100:
+            return None
+
+        try:
+            return datetime(year, month, int(match["day"]), int(match["hour"] or 0), int(match["minute"] or 0))
+        except ValueError:
+            return None
 
     def _extract_organizations(self, text: str) -> list[str]:
         """Extract organization names."""
         # TODO: Implement NER or pattern matching for organizations
         return []
 
-    def _extract_emails(self, text: str) -> list[str]:
-        """Extract email addresses."""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
-        return list(set(emails))
-
-    def _extract_phones(self, text: str) -> list[str]:
-        """Extract phone numbers."""
-        # French phone number patterns
-        phone_pattern = r'\b(?:0|\+33)[1-9](?:[\s.-]?\d{2}){4}\b'
-        phones = re.findall(phone_pattern, text)
-        return list(set(phones))
-
     def _format_table(self, table: list) -> str:
         """Format extracted table as text."""
         if not table:
@@ -718,31 +998,65 @@ class ParserService:
     def extract_from_pdf_sync(
         self,
         file_content: bytes,
-        use_ocr: bool = False
+        use_ocr: bool = False,
+        parallel: Optional[bool] = None,
+        ocr_cache: Optional["OcrPageCache"] = None,
+        fidelity: Optional[str] = None,
+        budget: Optional[ParseBudget] = None
     ) -> Dict[str, Any]:
         """
         Extract text and metadata from PDF with enhanced structure (sync version for Celery tasks).
 
         Args:
             file_content: PDF file content as bytes
-            use_ocr: Whether to use OCR for scanned PDFs
+            use_ocr: Whether to OCR pages without a usable text layer
+            parallel: Force (True) or disable (False) page-parallel extraction.
+                None = use settings.parser_parallel_enabled for documents of at
+                least settings.parser_parallel_min_pages pages.
+            ocr_cache: Optional per-page OCR cache (get/set by page image hash)
+            fidelity: One of FIDELITY_LEVELS (default: settings.parser_fidelity)
+            budget: Optional resource budget, checked between pages
 
         Returns:
             Extracted content and metadata including tables and sections
+
+        Raises:
+            ParseBudgetExceeded: budget given and exceeded
         """
-        pdf_file = io.BytesIO(file_content)
+        fidelity = self._resolve_fidelity(fidelity)
 
-        # IMPROVED: Use pdfplumber for better extraction
-        extraction = self._extract_with_pdfplumber_enhanced_sync(pdf_file)
+        # One pdfium document serves metadata and the text of serially extracted pages
+        pdf = self._open_pdfium_sync(file_content)
+        try:
+            # Extract metadata first: page count drives the serial/parallel choice
+            metadata = self._document_metadata_sync(pdf) if pdf is not None else {}
+            page_count = metadata.get("page_count", 0)
+
+            if parallel is None:
+                parallel = (
+                    settings.parser_parallel_enabled
+                    and page_count >= settings.parser_parallel_min_pages
+                )
+
+            # Bookmarks, when present, replace the regex section scan
+            outline = self._outline_by_page(metadata.get("outline"))
+
+            if pdf is None:
+                page_results = []
+            elif parallel and page_count > 1:
+                page_results = self._extract_page_results_parallel_sync(
+                    file_content, page_count, outline=outline, fidelity=fidelity, budget=budget
+                )
+            else:
+                page_results = self._extract_page_results_sync(file_content, outline, fidelity, pdf=pdf, budget=budget)
+        finally:
+            if pdf is not None:
+                pdf.close()
 
-        # If no text found, try OCR
-        if not extraction["text"].strip() and use_ocr:
-            pdf_file.seek(0)
-            extraction["text"] = self._extract_with_ocr_sync(pdf_file)
+        # OCR only the pages lacking a usable text layer (scanned annexes)
+        ocr_pages = self._ocr_missing_pages_sync(file_content, page_results, ocr_cache, budget, outline) if use_ocr else []
 
-        # Extract metadata
-        pdf_file.seek(0)
-        metadata = self._extract_metadata_sync(pdf_file)
+        extraction = self._merge_page_results(page_results, strip_boilerplate=settings.parser_strip_boilerplate)
 
         # Extract structured information (ENHANCED)
         structured_data = self._extract_structured_info_enhanced_sync(
@@ -755,12 +1069,487 @@ class ParserService:
             "text": extraction["text"],
             "tables": extraction["tables"],  # NEW: structured tables
             "sections": extraction["sections"],  # NEW: detected sections
+            "page_fingerprints": extraction.get("page_fingerprints", []),
+            "boilerplate": extraction["boilerplate"],
+            "metadata": metadata,
+            "structured": structured_data,
+            "page_count": metadata.get("page_count", 0),
+            "ocr_pages": ocr_pages,
+            "fidelity": fidelity,
+            "engines": self._count_engines(page_results),
+            "tables_skipped": self._count_tables_skipped(page_results),
+            "extraction_method": "pdfplumber_ocr" if ocr_pages else self.EXTRACTION_METHODS[fidelity]
+        }
+
+    def extract_changed_pages_sync(
+        self,
+        file_content: bytes,
+        previous: Dict[str, Any],
+        use_ocr: bool = False,
+        ocr_cache: Optional["OcrPageCache"] = None,
+        fidelity: Optional[str] = None,
+        budget: Optional[ParseBudget] = None
+    ) -> Dict[str, Any]:
+        """
+        Re-extract a new version of a document (e.g. a "rectificatif"),
+        re-running table extraction and section detection only on changed pages.
+
+        Every page's text is still read to compute its fingerprint; pages whose
+        fingerprint matches the previous version reuse the previous sections
+        and tables as-is (section content never spans pages). Unchanged pages
+        the previous version OCRed still get their OCR text (from ocr_cache,
+        by page image hash) for the document text. When the running
+        headers/footers changed (e.g. new document reference), the whole
+        document is re-extracted since stripping applies to every page.
+
+        Args:
+            file_content: PDF file content of the new version
+            previous: extraction_meta_data of the previous version
+                (page_fingerprints, boilerplate, fidelity, metadata.outline, sections, tables, ocr_pages)
+            use_ocr: Whether to OCR changed pages without a usable text layer
+            ocr_cache: Optional per-page OCR cache
+            fidelity: One of FIDELITY_LEVELS (default: settings.parser_fidelity)
+            budget: Optional resource budget, checked between pages
+
+        Returns:
+            Same as extract_from_pdf_sync, plus "changed_pages" (1-based page numbers)
+
+        Raises:
+            ParseBudgetExceeded: budget given and exceeded
+        """
+        fidelity = self._resolve_fidelity(fidelity)
+        previous_fingerprints = previous.get("page_fingerprints") or []
+
+        def full_extraction(reason: str) -> Dict[str, Any]:
+            print(f"  ♻️  {reason}: full re-extraction")
+            result = self.extract_from_pdf_sync(
+                file_content, use_ocr=use_ocr, ocr_cache=ocr_cache, fidelity=fidelity, budget=budget
+            )
+            return {**result, "changed_pages": list(range(1, result["page_count"] + 1))}
+
+        # Page text (hence fingerprints) and tables depend on the engines the fidelity picks
+        if previous.get("fidelity", "full") != fidelity:
+            return full_extraction("Fidelity changed")
+
+        text_parts = []
+        page_fingerprints = []
+        changed_results = []
+        rescanned_results = []  # Unchanged scanned pages: text layer is empty, their text comes from OCR
+        previous_ocr_pages = set(previous.get("ocr_pages") or []) if use_ocr else set()
+        engines = Counter()
+
+        try:
+            pdf = self._open_pdfium_sync(file_content, raise_errors=True)
+            try:
+                metadata = self._document_metadata_sync(pdf)
+                page_count = metadata["page_count"]
+
+                # Sections of unchanged pages can only be reused if they come from the same outline
+                if metadata["outline"] != (previous.get("metadata") or {}).get("outline", []):
+                    return full_extraction("Outline changed")
+                outline = self._outline_by_page(metadata["outline"])
+
+                for page_num, engine, page, page_text in self._iter_engine_pages(
+                    file_content, fidelity, pdf=pdf, budget=budget
+                ):
+                    if page_text is None:
+                        page_text = page.extract_text() or ""
+                    fingerprint = self._page_fingerprint(page_text)
+                    page_fingerprints.append(fingerprint)
+
+                    text_parts.append((page_num, page_text))
+
+                    unchanged = (
+                        page_num <= len(previous_fingerprints)
+                        and previous_fingerprints[page_num - 1] == fingerprint
+                    )
+                    if not unchanged:
+                        # Text map is cached by pdfplumber: extract_text() is not paid twice
+                        changed_results.append(self._extract_engine_page_sync(page_num, engine, page, page_text, outline))
+                        engines[engine] += 1
+                    elif page_num in previous_ocr_pages:
+                        rescanned_results.append(self._extract_engine_page_sync(page_num, engine, page, page_text, outline))
+            finally:
+                pdf.close()
+        except ParseBudgetExceeded:
+            raise
+        except Exception as e:
+            print(f"Incremental extraction error (sync): {e}")
+            return full_extraction("Incremental extraction failed")
+
+        # Fingerprints stay on the text layer so unchanged scanned pages are detected as such;
+        # those are OCRed again (normally a cache hit) only for their text, their sections are reused
+        ocr_results = changed_results + rescanned_results
+        ocr_pages = sorted(
+            self._ocr_missing_pages_sync(file_content, ocr_results, ocr_cache, budget, outline)
+        ) if use_ocr else []
+        if ocr_pages:
+            ocr_text = {r["page"]: r["text"] for r in ocr_results if r.get("ocr")}
+            text_parts = [(page_num, ocr_text.get(page_num, part)) for page_num, part in text_parts]
+
+        # Headers/footers are detected on every page, then stripped like extract_from_pdf_sync does
+        boilerplate = self._detect_boilerplate([part for _, part in text_parts]) if settings.parser_strip_boilerplate else set()
+        boilerplate_stats = self._boilerplate_stats(boilerplate, 0)
+        if boilerplate_stats["lines"] != (previous.get("boilerplate") or {}).get("lines", []):
+            return full_extraction("Running headers/footers changed")
+
+        if boilerplate:
+            changed_text = {}
+            for result in changed_results:
+                self._strip_boilerplate(result, boilerplate)
+                changed_text[result["page"]] = result["text"]
+
+            chars_removed = 0
+            for index, (page_num, part) in enumerate(text_parts):
+                stripped = changed_text.get(page_num)
+                if stripped is None:
+                    stripped, _ = self._strip_page_text(part, boilerplate)
+                chars_removed += len(part) - len(stripped)
+                text_parts[index] = (page_num, stripped)
+            boilerplate_stats = self._boilerplate_stats(boilerplate, chars_removed)
+
+        changed_pages = [r["page"] for r in changed_results]
+        reused_pages = set(range(1, len(page_fingerprints) + 1)) - set(changed_pages)
+
+        # Enrich only the sections of changed pages
+        new_sections = [s for r in changed_results for s in r["sections"]]
+        new_sections = self._extract_section_content_from_pages(
+            new_sections,
+            {r["page"]: r["text"] for r in changed_results if r["text"]}
+        )
+        new_sections = self._build_section_hierarchy(new_sections)
+
+        sections = [s for s in previous.get("sections", []) if s.get("page") in reused_pages] + new_sections
+        sections.sort(key=lambda s: (s["page"], s["line"]))
+
+        tables = [t for t in previous.get("tables", []) if t.get("page") in reused_pages]
+        tables += [t for r in changed_results for t in r["tables"]]
+        tables.sort(key=lambda t: t["page"])
+
+        text = "\n\n".join(part for _, part in text_parts if part)
+        structured_data = self._extract_structured_info_enhanced_sync(text, tables, sections)
+
+        print(f"  ♻️  Incremental extraction: {len(changed_pages)}/{len(page_fingerprints)} pages changed")
+
+        return {
+            "text": text,
+            "tables": tables,
+            "sections": sections,
+            "page_fingerprints": page_fingerprints,
+            "boilerplate": boilerplate_stats,
+            "changed_pages": changed_pages,
+            "metadata": metadata,
+            "structured": structured_data,
+            "page_count": page_count,
+            "ocr_pages": ocr_pages,
+            "fidelity": fidelity,
+            "engines": dict(engines),
+            "tables_skipped": self._count_tables_skipped(changed_results),
+            "extraction_method": self.EXTRACTION_METHODS[fidelity]
+        }
+
+    def iter_pages(
+        self,
+        source: Union[str, os.PathLike, bytes, BinaryIO],
+        use_ocr: bool = False,
+        ocr_cache: Optional["OcrPageCache"] = None,
+        strip_boilerplate: bool = False,
+        outline: Optional[list[Dict[str, Any]]] = None,
+        fidelity: Optional[str] = None,
+        budget: Optional[ParseBudget] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream per-page extraction results with bounded memory.
+
+        Each page is fully processed (text, tables, sections with content and
+        parent numbers) before being yielded, and its engine caches are
+        released right after, so memory does not grow with the page count.
+        Section content never spans pages, which makes per-page enrichment
+        equivalent to the whole-document path.
+
+        With strip_boilerplate, running headers/footers are detected on the
+        first settings.parser_boilerplate_sample_pages pages (buffered until
+        then) and stripped from every page. With use_ocr, scanned pages are
+        OCRed in batches across the OCR worker pool (see _ocr_in_batches).
+
+        Args:
+            source: File path (preferred: the PDF is read from disk on demand),
+                bytes or binary file object
+            use_ocr: Whether to OCR pages without a usable text layer (path or bytes source)
+            ocr_cache: Optional per-page OCR cache
+            strip_boilerplate: Remove running headers/footers
+            outline: Outline entries of the document (metadata["outline"]);
+                read from the PDF when not given
+            fidelity: One of FIDELITY_LEVELS (default: settings.parser_fidelity)
+            budget: Optional resource budget, checked between pages (raises ParseBudgetExceeded)
+
+        Yields:
+            {"page": int, "text": str, "tables": List[Dict], "sections": List[Dict], "fingerprint": str,
+             "engine": str, "boilerplate_chars": int}
+        """
+        fidelity = self._resolve_fidelity(fidelity)
+
+        pdf = self._open_pdfium_sync(source, raise_errors=True)
+        try:
+            if outline is None:
+                outline = self._extract_outline_sync(pdf)
+            outline = self._outline_by_page(outline)
+
+            sample = []
+            boilerplate = None if strip_boilerplate else set()
+
+            results = (
+                self._extract_engine_page_sync(page_num, engine, page, page_text, outline)
+                for page_num, engine, page, page_text in self._iter_engine_pages(source, fidelity, pdf=pdf, budget=budget)
+            )
+            if use_ocr:
+                results = self._ocr_in_batches(source, results, ocr_cache, budget, outline)
+
+            for result in results:
+                # Fingerprints are computed on the page text as extracted
+                result.setdefault("fingerprint", self._page_fingerprint(result["text"]))
+
+                if boilerplate is None:
+                    sample.append(result)
+                    if len(sample) < settings.parser_boilerplate_sample_pages:
+                        continue
+                    boilerplate = self._detect_boilerplate([r["text"] for r in sample])
+                    yield from (self._finish_page(r, boilerplate) for r in sample)
+                    sample = []
+                    continue
+
+                yield self._finish_page(result, boilerplate)
+
+            # Documents shorter than the sample
+            if sample:
+                boilerplate = self._detect_boilerplate([r["text"] for r in sample])
+                yield from (self._finish_page(r, boilerplate) for r in sample)
+        finally:
+            pdf.close()
+
+    def _ocr_in_batches(
+        self,
+        source: Union[str, os.PathLike, bytes, BinaryIO],
+        results: Iterator[Dict[str, Any]],
+        ocr_cache: Optional["OcrPageCache"] = None,
+        budget: Optional[ParseBudget] = None,
+        outline: Optional[Dict[int, list[Dict[str, Any]]]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        OCR streamed page results in batches, so scanned pages share one worker pool.
+
+        From the first page lacking a text layer on, results are held until
+        settings.parser_ocr_workers (default: os.cpu_count()) of them need OCR,
+        then OCRed together and yielded in page order. Text-layer pages held in
+        between count towards a cap of OCR_BATCH_HOLD_FACTOR batches, which
+        bounds the memory of documents with only a few scanned pages.
+        """
+        batch_size = settings.parser_ocr_workers or os.cpu_count() or 1
+        held, scanned = [], 0
+
+        for result in results:
+            if not held and not result["needs_ocr"]:
+                yield result
+                continue
+
+            held.append(result)
+            scanned += bool(result["needs_ocr"])
+            if scanned < batch_size and len(held) < batch_size * self.OCR_BATCH_HOLD_FACTOR:
+                continue
+
+            self._ocr_missing_pages_sync(source, held, ocr_cache, budget, outline)
+            yield from held
+            held, scanned = [], 0
+
+        if held:
+            self._ocr_missing_pages_sync(source, held, ocr_cache, budget, outline)
+            yield from held
+
+    def _finish_page(self, result: Dict[str, Any], boilerplate: set[str]) -> Dict[str, Any]:
+        """Strip boilerplate from a streamed page result and enrich its sections."""
+        result["boilerplate_chars"] = self._strip_boilerplate(result, boilerplate) if boilerplate else 0
+
+        if result["sections"]:
+            sections = self._extract_section_content_from_pages(
+                result["sections"],
+                {result["page"]: result["text"]}
+            )
+            result["sections"] = self._build_section_hierarchy(sections)
+
+        return result
+
+    def extract_from_pdf_streaming_sync(
+        self,
+        source: Union[str, os.PathLike, bytes, BinaryIO],
+        on_sections: Callable[[list[Dict[str, Any]]], None],
+        text_sink: TextIO,
+        use_ocr: bool = False,
+        ocr_cache: Optional["OcrPageCache"] = None,
+        fidelity: Optional[str] = None,
+        budget: Optional[ParseBudget] = None,
+        previous_fingerprints: Optional[list[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Streaming variant of extract_from_pdf_sync for very large documents.
+
+        Sections are handed to on_sections page by page (e.g. to persist them
+        incrementally) and the text is written to text_sink instead of being
+        accumulated, so only tables and structured info are kept in memory.
+
+        With previous_fingerprints (new version of a document), only the
+        sections of pages whose fingerprint changed are handed to on_sections;
+        "changed_pages" lists those pages.
+
+        Args:
+            source: File path, bytes or binary file object
+            on_sections: Called with the enriched sections of each page
+            text_sink: Writable text stream receiving the concatenated page text
+            use_ocr: Whether to OCR pages without a usable text layer
+            ocr_cache: Optional per-page OCR cache
+            fidelity: One of FIDELITY_LEVELS (default: settings.parser_fidelity)
+            budget: Optional resource budget, checked between pages
+            previous_fingerprints: page_fingerprints of the previous version
+
+        Returns:
+            Same as extract_from_pdf_sync, without "text", "sections" and the
+            boilerplate lines, plus "stats" (text_length, sections_count, sections_with_content)
+            and "changed_pages" (None without previous_fingerprints)
+
+        Raises:
+            ParseBudgetExceeded: budget given and exceeded (pages before it were handed to on_sections)
+            Exception: any page extraction error, also raised after earlier pages were handed over
+        """
+        fidelity = self._resolve_fidelity(fidelity)
+        metadata = self._extract_metadata_sync(source)
+
+        tables = []
+        text_length = 0
+        reference_numbers, email_addresses, phone_numbers = {}, {}, {}  # Ordered sets
+        deadlines = []
+        section_summary = {"total_sections": 0, "parts": 0, "articles": 0, "subsections": 0}
+        key_sections = {"exclusions": [], "obligations": [], "conditions": [], "evaluation_criteria": []}
+        sections_with_content = 0
+        boilerplate_chars = 0
+        ocr_pages = []
+        engines = Counter()
+        tables_skipped = 0
+        page_fingerprints = []
+
+        try:
+            pages = self.iter_pages(
+                source,
+                use_ocr=use_ocr,
+                ocr_cache=ocr_cache,
+                strip_boilerplate=settings.parser_strip_boilerplate,
+                outline=metadata.get("outline", []),
+                fidelity=fidelity,
+                budget=budget
+            )
+            for page in pages:
+                page_fingerprints.append(page["fingerprint"])
+                if page.get("ocr"):
+                    ocr_pages.append(page["page"])
+
+                engines[page["engine"]] += 1
+                tables_skipped += page["tables_skipped"]
+
+                boilerplate_chars += page["boilerplate_chars"]
+
+                tables.extend(page["tables"])
+
+                if page["text"]:
+                    if text_length:
+                        text_sink.write("\n\n")
+                        text_length += 2
+                    text_sink.write(page["text"])
+                    text_length += len(page["text"])
+
+                    # Structured info is line/regex based, so per-page results merge exactly
+                    page_info = self._scan_structured_info(page["text"])
+                    reference_numbers.update(dict.fromkeys(page_info["reference_numbers"]))
+                    deadlines.extend(page_info["deadlines"])
+                    email_addresses.update(dict.fromkeys(page_info["email_addresses"]))
+                    phone_numbers.update(dict.fromkeys(page_info["phone_numbers"]))
+
+                sections = page["sections"]
+                if sections:
+                    # Rows of unchanged pages (same text, hence same sections) are kept as they are
+                    if (
+                        previous_fingerprints is None
+                        or page["page"] > len(previous_fingerprints)
+                        or previous_fingerprints[page["page"] - 1] != page["fingerprint"]
+                    ):
+                        on_sections(sections)
+
+                    section_summary["total_sections"] += len(sections)
+                    section_summary["parts"] += len([s for s in sections if s["type"] == "PART"])
+                    section_summary["articles"] += len([s for s in sections if s["type"] == "ARTICLE"])
+                    section_summary["subsections"] += len([s for s in sections if s["type"] == "SECTION"])
+                    sections_with_content += len([s for s in sections if s.get("content_length", 0) > 0])
+
+                    for category, items in self._identify_key_sections(sections).items():
+                        key_sections[category].extend(items)
+        except ParseBudgetExceeded:
+            raise
+        except Exception as e:
+            # Partial text/sections must not pass for a complete extraction: let the task fail and retry
+            print(f"Streaming extraction error (sync): {e}")
+            raise
+
+        structured_data = {
+            "reference_numbers": list(reference_numbers),
+            "deadlines": deadlines,
+            "organizations": [],
+            "email_addresses": list(email_addresses),
+            "phone_numbers": list(phone_numbers),
+            "section_summary": section_summary,
+            "table_summary": {
+                "total_tables": len(tables),
+                "total_rows": sum(t["row_count"] for t in tables),
+                "tables_by_page": self._group_tables_by_page(tables),
+            },
+            "key_sections": key_sections,
+        }
+
+        return {
+            "tables": tables,
             "metadata": metadata,
             "structured": structured_data,
             "page_count": metadata.get("page_count", 0),
-            "extraction_method": "pdfplumber_enhanced"
+            "ocr_pages": ocr_pages,
+            "page_fingerprints": page_fingerprints,
+            "changed_pages": self.diff_page_fingerprints(previous_fingerprints, page_fingerprints)
+            if previous_fingerprints is not None else None,
+            "fidelity": fidelity,
+            "engines": dict(engines),
+            "tables_skipped": tables_skipped,
+            "extraction_method": "pdfplumber_streaming",
+            "boilerplate": {"chars_removed": boilerplate_chars, "tokens_saved": boilerplate_chars // 4},
+            "stats": {
+                "sections_count": section_summary["total_sections"],
+                "sections_with_content": sections_with_content,
+                "tables_count": len(tables),
+                "text_length": text_length
+            }
         }
 
+    def _as_pdf_source(
+        self,
+        source: Union[str, os.PathLike, bytes, BinaryIO]
+    ) -> Union[str, os.PathLike, BinaryIO]:
+        """Normalize a PDF source for pdfplumber/PyPDF2 (bytes are wrapped, streams rewound)."""
+        if isinstance(source, (bytes, bytearray)):
+            return io.BytesIO(source)
+        if hasattr(source, "seek"):
+            source.seek(0)
+        return source
+
+    def _release_page(self, page) -> None:
+        """Drop pdfplumber's cached layout objects and text map for a consumed page."""
+        page.flush_cache()
+        if hasattr(page, "get_textmap"):
+            page.get_textmap.cache_clear()
+
     def _extract_text_pypdf2_sync(self, pdf_file: io.BytesIO) -> str:
         """Extract text using PyPDF2 (sync)."""
         try:
@@ -777,35 +1566,219 @@ class ParserService:
             print(f"PyPDF2 extraction error: {e}")
             return ""
 
-    def _extract_with_ocr_sync(self, pdf_file: io.BytesIO) -> str:
-        """Extract text using OCR for scanned PDFs (sync)."""
+    def _extract_with_ocr_sync(self, pdf_file: Union[str, os.PathLike, io.BytesIO]) -> str:
+        """Extract text using OCR for scanned PDFs (sync): every page, in parallel."""
         try:
-            # TODO: Implement OCR extraction
-            # Would require pdf2image and pytesseract
-            return "OCR extraction not yet implemented"
+            source = pdf_file.getvalue() if isinstance(pdf_file, io.BytesIO) else pdf_file
+            with pdfplumber.open(self._as_pdf_source(source)) as pdf:
+                page_count = len(pdf.pages)
+
+            texts = self._ocr_pages_sync(source, list(range(1, page_count + 1)))
+            return "\n\n".join(text for _, text in sorted(texts.items()) if text)
         except Exception as e:
             print(f"OCR extraction error: {e}")
             return ""
 
-    def _extract_metadata_sync(self, pdf_file: io.BytesIO) -> Dict[str, Any]:
-        """Extract PDF metadata (sync)."""
+    def _extract_metadata_sync(self, source: Union[str, os.PathLike, bytes, BinaryIO]) -> Dict[str, Any]:
+        """Extract PDF metadata (sync), opening the document for that only."""
+        pdf = self._open_pdfium_sync(source)
+        if pdf is None:
+            return {}
+
         try:
-            reader = PyPDF2.PdfReader(pdf_file)
-            metadata = reader.metadata or {}
+            return self._document_metadata_sync(pdf)
+        finally:
+            pdf.close()
+
+    def _document_metadata_sync(self, pdf: pdfium.PdfDocument) -> Dict[str, Any]:
+        """Metadata (document info, page count, outline) of an open pdfium document."""
+        try:
+            metadata = pdf.get_metadata_dict()
 
             return {
-                "page_count": len(reader.pages),
-                "title": metadata.get("/Title", ""),
-                "author": metadata.get("/Author", ""),
-                "subject": metadata.get("/Subject", ""),
-                "creator": metadata.get("/Creator", ""),
-                "producer": metadata.get("/Producer", ""),
-                "creation_date": metadata.get("/CreationDate", ""),
+                "page_count": len(pdf),
+                "outline": self._extract_outline_sync(pdf),
+                "title": metadata.get("Title", ""),
+                "author": metadata.get("Author", ""),
+                "subject": metadata.get("Subject", ""),
+                "creator": metadata.get("Creator", ""),
+                "producer": metadata.get("Producer", ""),
+                "creation_date": metadata.get("CreationDate", ""),
             }
         except Exception as e:
             print(f"Metadata extraction error: {e}")
             return {}
 
+    def _open_pdfium_sync(
+        self,
+        source: Union[str, os.PathLike, bytes, BinaryIO],
+        raise_errors: bool = False
+    ) -> Optional[pdfium.PdfDocument]:
+        """
+        Open a PDF with pdfium: paths are read on demand, streams are read into memory
+        (pdfplumber may read the same stream: they must not share its position).
+
+        Returns:
+            Open document (to close), or None if it cannot be opened and not raise_errors
+        """
+        try:
+            if hasattr(source, "read"):
+                source.seek(0)
+                source = source.read()
+            elif isinstance(source, os.PathLike):
+                source = os.fspath(source)
+            return pdfium.PdfDocument(source)
+        except Exception as e:
+            if raise_errors:
+                raise
+            print(f"PDF open error (pdfium): {e}")
+            return None
+
+    def _resolve_fidelity(self, fidelity: Optional[str]) -> str:
+        """Validate a fidelity level (default: settings.parser_fidelity)."""
+        fidelity = fidelity or settings.parser_fidelity
+        if fidelity not in self.FIDELITY_LEVELS:
+            raise ValueError(f"Unknown parser fidelity '{fidelity}' (expected one of {', '.join(self.FIDELITY_LEVELS)})")
+        return fidelity
+
+    def _iter_engine_pages(
+        self,
+        source: Union[str, os.PathLike, bytes, BinaryIO],
+        fidelity: str,
+        page_numbers: Optional[list[int]] = None,
+        pdf: Optional[pdfium.PdfDocument] = None,
+        budget: Optional[ParseBudget] = None
+    ) -> Iterator[tuple[int, str, Any, Optional[str]]]:
+        """
+        Open each page with the engine the fidelity level picks for it.
+
+        pdfplumber (whose layout analysis is the costly part of extraction) is
+        only opened once a page needs it; pages are released after use.
+
+        Args:
+            source: PDF file path, bytes or binary file object
+            fidelity: One of FIDELITY_LEVELS
+            page_numbers: 1-based pages to open (default: all)
+            pdf: Already open pdfium document of source (left open)
+            budget: Optional resource budget, checked before each page
+
+        Yields:
+            (page_num, engine, page, text): engine "pdfium" with the page text,
+            or "pdfplumber" with a pdfplumber Page and text None
+        """
+        own_pdf = pdf is None
+        if own_pdf:
+            pdf = self._open_pdfium_sync(source, raise_errors=True)
+        plumber = None
+
+        try:
+            for page_num in page_numbers or range(1, len(pdf) + 1):
+                if budget is not None:
+                    budget.check("pages", page_num)
+
+                page = pdf[page_num - 1]
+                try:
+                    textpage = page.get_textpage()
+                    try:
+                        engine = self._page_engine(page, textpage, fidelity)
+                        text = self._pdfium_page_text(textpage) if engine == "pdfium" else None
+                    finally:
+                        textpage.close()
+                finally:
+                    page.close()
+
+                if engine == "pdfium":
+                    yield page_num, engine, None, text
+                    continue
+
+                if plumber is None:
+                    plumber = pdfplumber.open(self._as_pdf_source(source))
+                page = plumber.pages[page_num - 1]
+                try:
+                    yield page_num, engine, page, None
+                finally:
+                    self._release_page(page)
+        finally:
+            if plumber is not None:
+                plumber.close()
+            if own_pdf:
+                pdf.close()
+
+    def _page_engine(self, page: pdfium.PdfPage, textpage: pdfium.PdfTextPage, fidelity: str) -> str:
+        """
+        Engine for a page: "pdfplumber" when tables may be needed (or OCR), else "pdfium".
+
+        Counting page objects only walks the content stream: no layout analysis.
+        """
+        if fidelity == "full":
+            return "pdfplumber"
+
+        has_images = False
+        ruling_sizes = []  # (width, height) of vector paths
+        for obj in page.get_objects(max_depth=2):
+            if obj.type == pdfium_c.FPDF_PAGEOBJ_IMAGE:
+                has_images = True
+            elif obj.type == pdfium_c.FPDF_PAGEOBJ_PATH:
+                left, bottom, right, top = obj.get_bounds()
+                ruling_sizes.append((right - left, top - bottom))
+
+        # Scanned page: OCR renders and hashes it through pdfplumber
+        if has_images and textpage.count_chars() < settings.parser_ocr_min_chars:
+            return "pdfplumber"
+
+        if fidelity == "standard" and self._has_table_rulings(*self._count_ruling_edges(ruling_sizes)):
+            return "pdfplumber"
+
+        return "pdfium"
+
+    def _count_ruling_edges(self, sizes: list[tuple[float, float]]) -> tuple[int, int]:
+        """
+        Horizontal and vertical ruling edges drawn by vector paths of the given
+        (width, height): thin paths are lines, others rectangles (4 edges).
+        """
+        min_length = self.RULING_MIN_LENGTH
+        horizontal = vertical = 0
+
+        for width, height in sizes:
+            if height < min_length <= width:
+                horizontal += 1
+            elif width < min_length <= height:
+                vertical += 1
+            elif width >= min_length and height >= min_length:
+                horizontal += 2
+                vertical += 2
+
+        return horizontal, vertical
+
+    def _has_table_rulings(self, horizontal: int, vertical: int) -> bool:
+        """
+        Table pre-check: whether a page has enough ruling edges for extract_tables to find a table.
+
+        With the default "lines" strategy a table needs crossing horizontal and
+        vertical edges, so settings.parser_table_min_edges = 2 (per orientation)
+        never loses a table; higher values trade recall for speed, 0 disables the check.
+        """
+        return min(horizontal, vertical) >= settings.parser_table_min_edges
+
+    def _pdfium_page_text(self, textpage: pdfium.PdfTextPage) -> str:
+        """Page text from pdfium, in pdfplumber's line conventions."""
+        text = textpage.get_text_bounded()
+        # "\x02" marks a word hyphenated at the end of a line (joined by pdfium)
+        text = text.replace("\r\n", "\n").replace("\r", "\n").replace("\x02", "-")
+        text = self._pdfium_heading_gap_re.sub(r'\1 ', text)
+        return "\n".join(line.rstrip() for line in text.split("\n")).strip("\n")
+
+    def _count_engines(self, page_results: list[Dict[str, Any]]) -> Dict[str, int]:
+        """Number of pages extracted by each engine."""
+        return dict(Counter(r.get("engine", "pdfplumber") for r in page_results))
+
+    def _count_tables_skipped(self, page_results: list[Dict[str, Any]]) -> int:
+        """Number of pages whose table extraction was skipped (pre-check or text-only engine)."""
+        skipped = sum(1 for r in page_results if r.get("tables_skipped"))
+        if page_results:
+            print(f"  📊 Table pre-check: extract_tables skipped on {skipped}/{len(page_results)} pages")
+        return skipped
+
     def _extract_structured_info_sync(self, text: str) -> Dict[str, Any]:
         """
         Extract structured information from text (sync).
@@ -816,19 +1789,23 @@ class ParserService:
         Returns:
             Structured data (deadlines, reference numbers, etc.)
         """
+        scanned = self._scan_structured_info(text)
+
         structured = {
-            "reference_numbers": self._extract_reference_numbers(text),
-            "deadlines": self._extract_deadlines(text),
+            "reference_numbers": scanned["reference_numbers"],
+            "deadlines": scanned["deadlines"],
             "organizations": self._extract_organizations(text),
-            "email_addresses": self._extract_emails(text),
-            "phone_numbers": self._extract_phones(text),
+            "email_addresses": scanned["email_addresses"],
+            "phone_numbers": scanned["phone_numbers"],
         }
 
         return structured
 
     def _extract_with_pdfplumber_enhanced_sync(
         self,
-        pdf_file: io.BytesIO
+        pdf_file: io.BytesIO,
+        outline: Optional[Dict[int, list[Dict[str, Any]]]] = None,
+        fidelity: str = "full"
     ) -> Dict[str, Any]:
         """
         Enhanced extraction with pdfplumber (sync version for Celery) with full section content.
@@ -840,64 +1817,564 @@ class ParserService:
                 "sections": List[Dict]  # With full content
             }
         """
+        return self._merge_page_results(
+            self._extract_page_results_sync(pdf_file, outline, fidelity),
+            strip_boilerplate=settings.parser_strip_boilerplate
+        )
+
+    def _extract_page_results_sync(
+        self,
+        source: Union[bytes, BinaryIO],
+        outline: Optional[Dict[int, list[Dict[str, Any]]]] = None,
+        fidelity: str = "full",
+        page_numbers: Optional[list[int]] = None,
+        pdf: Optional[pdfium.PdfDocument] = None,
+        budget: Optional[ParseBudget] = None
+    ) -> list[Dict[str, Any]]:
+        """
+        Extract pages serially, each with the engine its fidelity level picks.
+
+        Args:
+            source: PDF file content or file object
+            outline: Outline entries by page (see _outline_by_page), None to scan for sections
+            fidelity: One of FIDELITY_LEVELS
+            page_numbers: 1-based pages to extract (default: all)
+            pdf: Already open pdfium document of source
+            budget: Optional resource budget, checked before each page
+
+        Returns:
+            Per-page results in page order (empty list on error)
+
+        Raises:
+            ParseBudgetExceeded: budget given and exceeded
+        """
         try:
-            text_parts = []
-            tables = []
-            sections = []
-            pages_text = {}  # Store text by page for content extraction
-
-            with pdfplumber.open(pdf_file) as pdf:
-                for page_num, page in enumerate(pdf.pages, start=1):
-                    # Extract text
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_parts.append(page_text)
-                        pages_text[page_num] = page_text
-
-                        # Detect sections in text
-                        detected_sections = self._detect_sections(page_text, page_num)
-                        sections.extend(detected_sections)
-
-                    # Extract tables as STRUCTURED data
-                    page_tables = page.extract_tables()
-                    for table_idx, table_data in enumerate(page_tables):
-                        if table_data and len(table_data) > 0:
-                            # Clean empty cells
-                            cleaned_table = [
-                                [cell.strip() if cell else "" for cell in row]
-                                for row in table_data
-                            ]
-
-                            # Skip empty tables
-                            if any(any(cell for cell in row) for row in cleaned_table):
-                                structured_table = {
-                                    "id": f"table_p{page_num}_{table_idx}",
-                                    "page": page_num,
-                                    "headers": cleaned_table[0] if len(cleaned_table) > 0 else [],
-                                    "rows": cleaned_table[1:] if len(cleaned_table) > 1 else [],
-                                    "row_count": len(cleaned_table) - 1,
-                                    "col_count": len(cleaned_table[0]) if cleaned_table else 0
-                                }
-                                tables.append(structured_table)
-
-            # IMPROVED: Extract full content for sections
-            sections = self._extract_section_content_from_pages(sections, pages_text)
-
-            # Build parent-child hierarchy
-            sections = self._build_section_hierarchy(sections)
+            return [
+                self._extract_engine_page_sync(page_num, engine, page, page_text, outline)
+                for page_num, engine, page, page_text in self._iter_engine_pages(
+                    source, fidelity, page_numbers, pdf, budget
+                )
+            ]
+        except ParseBudgetExceeded:
+            raise
+        except Exception as e:
+            print(f"Page extraction error (sync): {e}")
+            return []
 
-            return {
-                "text": "\n\n".join(text_parts),
-                "tables": tables,
-                "sections": sections
-            }
+    def _extract_engine_page_sync(
+        self,
+        page_num: int,
+        engine: str,
+        page,
+        page_text: Optional[str],
+        outline: Optional[Dict[int, list[Dict[str, Any]]]]
+    ) -> Dict[str, Any]:
+        """Extract one page yielded by _iter_engine_pages (see _extract_page_sync)."""
+        outline_entries = outline.get(page_num, []) if outline is not None else None
+
+        if engine == "pdfplumber":
+            return {**self._extract_page_sync(page, page_num, outline_entries), "engine": engine}
+
+        # Text-only engine: no tables, and no scanned pages (routed to pdfplumber)
+        return {
+            "page": page_num,
+            "text": page_text,
+            "tables": [],
+            "tables_skipped": True,
+            "sections": self._page_sections(page_text, page_num, outline_entries),
+            "needs_ocr": False,
+            "image_hash": None,
+            "engine": engine
+        }
+
+    def _page_sections(
+        self,
+        page_text: str,
+        page_num: int,
+        outline_entries: Optional[list[Dict[str, Any]]]
+    ) -> list[Dict[str, Any]]:
+        """Raw sections of a page: from its outline entries, or detected in the text."""
+        if outline_entries is not None:
+            return self._outline_sections(page_text, page_num, outline_entries)
+        return self._detect_sections(page_text, page_num) if page_text else []
+
+    def _extract_page_sync(
+        self,
+        page,
+        page_num: int,
+        outline_entries: Optional[list[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Extract text, structured tables and raw sections from a single page.
+
+        This is the unit of work shared by the serial and page-parallel paths:
+        it only depends on the page itself, so pages can be processed in any
+        order and merged afterwards with _merge_page_results().
+
+        Args:
+            page: pdfplumber Page
+            page_num: 1-based page number
+            outline_entries: Outline entries pointing to this page when the
+                document has an outline (sections then come from it), None
+                to scan the text for section headers
+
+        Returns:
+            {"page": int, "text": str, "tables": List[Dict], "tables_skipped": bool, "sections": List[Dict]}
+        """
+        # Extract text
+        page_text = page.extract_text()
+
+        # Sections from the outline, or detected in text
+        sections = self._page_sections(page_text or "", page_num, outline_entries)
+
+        # Extract tables as STRUCTURED data, on pages with ruling lines only
+        horizontal = sum(1 for e in page.edges if e["orientation"] == "h" and e["width"] >= self.RULING_MIN_LENGTH)
+        vertical = sum(1 for e in page.edges if e["orientation"] == "v" and e["height"] >= self.RULING_MIN_LENGTH)
+        tables_skipped = not self._has_table_rulings(horizontal, vertical)
+
+        tables = []
+        page_tables = page.extract_tables() if not tables_skipped else []
+        for table_idx, table_data in enumerate(page_tables):
+            if table_data and len(table_data) > 0:
+                # Clean empty cells
+                cleaned_table = [
+                    [cell.strip() if cell else "" for cell in row]
+                    for row in table_data
+                ]
+
+                # Skip empty tables
+                if any(any(cell for cell in row) for row in cleaned_table):
+                    tables.append({
+                        "id": f"table_p{page_num}_{table_idx}",
+                        "page": page_num,
+                        "headers": cleaned_table[0] if len(cleaned_table) > 0 else [],
+                        "rows": cleaned_table[1:] if len(cleaned_table) > 1 else [],
+                        "row_count": len(cleaned_table) - 1,
+                        "col_count": len(cleaned_table[0]) if cleaned_table else 0
+                    })
+
+        # Scanned page: (almost) no text layer but painted images
+        needs_ocr = len((page_text or "").strip()) < settings.parser_ocr_min_chars and bool(page.images)
+
+        return {
+            "page": page_num,
+            "text": page_text or "",
+            "tables": tables,
+            "tables_skipped": tables_skipped,
+            "sections": sections,
+            "needs_ocr": needs_ocr,
+            "image_hash": self._page_image_hash(page) if needs_ocr else None
+        }
+
+    def _page_image_hash(self, page) -> str:
+        """
+        Hash of a page's images and OCR settings, used as the OCR cache key.
+
+        Identical scans (same image streams rendered at the same resolution
+        and language) always produce the same OCR text.
+        """
+        digest = hashlib.sha256(
+            f"{settings.parser_ocr_language}:{settings.parser_ocr_resolution}:{page.width}x{page.height}".encode()
+        )
+        for image in page.images:
+            stream = image.get("stream")
+            data = stream.get_rawdata() if stream is not None else None
+            if data is None:
+                data = repr((image.get("x0"), image.get("top"), image.get("srcsize"))).encode()
+            digest.update(data)
+        return digest.hexdigest()
+
+    def _ocr_missing_pages_sync(
+        self,
+        source: Union[str, os.PathLike, bytes],
+        page_results: list[Dict[str, Any]],
+        ocr_cache: Optional["OcrPageCache"] = None,
+        budget: Optional[ParseBudget] = None,
+        outline: Optional[Dict[int, list[Dict[str, Any]]]] = None
+    ) -> list[int]:
+        """
+        OCR the pages flagged by _extract_page_sync as lacking a text layer.
+
+        Cached pages are served from ocr_cache; the rest are OCRed in parallel
+        and their text and sections replace the (empty) text-layer results in place.
+
+        Args:
+            source: PDF file path or bytes
+            page_results: Results of _extract_page_sync (updated in place)
+            ocr_cache: Optional cache with get(image_hash) / set(image_hash, text)
+            budget: Optional resource budget, checked before each OCRed page
+            outline: Outline entries by page (see _outline_by_page) when the
+                document has an outline: OCRed sections then come from it too
+
+        Returns:
+            1-based page numbers whose text now comes from OCR
+
+        Raises:
+            ParseBudgetExceeded: budget given and exceeded
+        """
+        candidates = [r for r in page_results if r.get("needs_ocr")]
+        if not candidates:
+            return []
+
+        pending = []
+        for result in candidates:
+            cached = ocr_cache.get(result["image_hash"]) if ocr_cache else None
+            if cached is not None:
+                self._apply_page_ocr(result, cached, outline)
+            else:
+                pending.append(result)
+
+        if pending:
+            texts = self._ocr_pages_sync(source, [r["page"] for r in pending], budget)
+            for result in pending:
+                text = texts.get(result["page"])
+                if text is None:
+                    continue  # OCR failed: keep the text layer
+                if ocr_cache:
+                    ocr_cache.set(result["image_hash"], text)
+                self._apply_page_ocr(result, text, outline)
+
+        ocr_pages = [r["page"] for r in candidates if r.get("ocr")]
+        print(f"  🔍 OCR: {len(ocr_pages)}/{len(candidates)} scanned pages ({len(candidates) - len(pending)} from cache)")
+        return ocr_pages
+
+    def _apply_page_ocr(
+        self,
+        result: Dict[str, Any],
+        ocr_text: str,
+        outline: Optional[Dict[int, list[Dict[str, Any]]]] = None
+    ) -> None:
+        """Replace a page's text layer with OCR output and re-detect its sections (like the text-layer pages)."""
+        # Fingerprints stay on the text layer, like the incremental path
+        result.setdefault("fingerprint", self._page_fingerprint(result["text"]))
+        result["text"] = ocr_text
+        outline_entries = outline.get(result["page"], []) if outline is not None else None
+        result["sections"] = self._page_sections(ocr_text, result["page"], outline_entries)
+        result["ocr"] = True
+
+    def _ocr_pages_sync(
+        self,
+        source: Union[str, os.PathLike, bytes],
+        page_numbers: list[int],
+        budget: Optional[ParseBudget] = None
+    ) -> Dict[int, Optional[str]]:
+        """
+        OCR pages with a process pool of Tesseract workers.
+
+        Each worker opens the PDF once and renders its pages itself, so only
+        page numbers and text cross process boundaries. Falls back to serial
+        OCR if the pool cannot be used (e.g. inside a daemonic worker process).
+
+        Args:
+            source: PDF file path or bytes
+            page_numbers: 1-based pages to OCR
+            budget: Optional resource budget, checked before each page
+                (after each one with the pool)
+
+        Returns:
+            {page_num: text or None if OCR failed}
+
+        Raises:
+            ParseBudgetExceeded: budget given and exceeded
+        """
+        max_workers = min(settings.parser_ocr_workers or os.cpu_count() or 1, len(page_numbers))
+
+        if max_workers > 1:
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=_init_ocr_worker,
+                    initargs=(source,)
+                ) as executor:
+                    texts = {}
+                    try:
+                        for page_num, text in executor.map(_ocr_page, page_numbers):
+                            texts[page_num] = text
+                            if budget is not None:
+                                budget.check("ocr", page_num)
+                    except ParseBudgetExceeded:
+                        # Pending pages are dropped instead of waited for
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        raise
+                    return texts
+            except ParseBudgetExceeded:
+                raise
+            except Exception as e:
+                print(f"⚠️  Parallel OCR failed ({e}), falling back to serial OCR")
+
+        texts = {}
+        with pdfplumber.open(self._as_pdf_source(source)) as pdf:
+            for page_num in page_numbers:
+                if budget is not None:
+                    budget.check("ocr", page_num)
+                texts[page_num] = self._ocr_pdf_page_sync(pdf, page_num)
+        return texts
+
+    def _ocr_pdf_page_sync(self, pdf, page_num: int) -> Optional[str]:
+        """Render one page of an open pdfplumber document and OCR it with Tesseract."""
+        try:
+            page = pdf.pages[page_num - 1]
+            image = page.to_image(resolution=settings.parser_ocr_resolution).original
+            text = pytesseract.image_to_string(
+                image,
+                lang=settings.parser_ocr_language,
+                config=self.tesseract_config
+            )
+            self._release_page(page)
+            return text.strip()
         except Exception as e:
-            print(f"Enhanced pdfplumber extraction error (sync): {e}")
-            return {
-                "text": "",
-                "tables": [],
-                "sections": []
-            }
+            print(f"OCR extraction error (page {page_num}): {e}")
+            return None
+
+    def _merge_page_results(
+        self,
+        page_results: list[Dict[str, Any]],
+        strip_boilerplate: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Merge per-page results in page order, then enrich sections with content
+        and hierarchy.
+
+        Args:
+            page_results: Results of _extract_page_sync, in any order
+            strip_boilerplate: Remove running headers/footers (PDF pages) before
+                enrichment; fingerprints stay computed on the original page text
+
+        Returns:
+            {"text": str, "tables": List[Dict], "sections": List[Dict], "page_fingerprints": List[str],
+             "boilerplate": Dict (see _boilerplate_stats)}
+        """
+        text_parts = []
+        tables = []
+        sections = []
+        pages_text = {}  # Store text by page for content extraction
+
+        page_results = sorted(page_results, key=lambda r: r["page"])
+        page_fingerprints = [r.get("fingerprint") or self._page_fingerprint(r["text"]) for r in page_results]
+
+        boilerplate = self._detect_boilerplate([r["text"] for r in page_results]) if strip_boilerplate else set()
+        chars_removed = sum(self._strip_boilerplate(r, boilerplate) for r in page_results) if boilerplate else 0
+
+        for result in page_results:
+            if result["text"]:
+                text_parts.append(result["text"])
+                pages_text[result["page"]] = result["text"]
+                sections.extend(result["sections"])
+            tables.extend(result["tables"])
+
+        # IMPROVED: Extract full content for sections
+        sections = self._extract_section_content_from_pages(sections, pages_text)
+
+        # Build parent-child hierarchy
+        sections = self._build_section_hierarchy(sections)
+
+        return {
+            "text": "\n\n".join(text_parts),
+            "tables": tables,
+            "sections": sections,
+            "page_fingerprints": page_fingerprints,
+            "boilerplate": self._boilerplate_stats(boilerplate, chars_removed)
+        }
+
+    def _detect_boilerplate(self, page_texts: list[str]) -> set[str]:
+        """
+        Find running headers and footers: lines found in the top or bottom zone
+        of at least settings.parser_boilerplate_min_ratio of the pages, digits
+        ignored ("Page 3/12" and "Page 4/12" are the same line). Either zone
+        counts: pdfium keeps content stream order, where footers often come first.
+        Lines detected as section headings are never boilerplate.
+
+        Args:
+            page_texts: Text of every page (or of a sample of pages)
+
+        Returns:
+            {normalized line}, empty for documents of less than 3 pages
+        """
+        pages = [text.split("\n") for text in page_texts if text]
+        min_pages = max(3, math.ceil(len(pages) * settings.parser_boilerplate_min_ratio))
+        if len(pages) < min_pages:
+            return set()
+
+        counts = Counter()
+        samples = {}  # One original line per key
+        for lines in pages:
+            zone = {key: index for index, key in self._boilerplate_zone(lines)}
+            counts.update(zone.keys())
+            for key, index in zone.items():
+                samples.setdefault(key, lines[index])
+
+        # Headings repeated at the top of pages ("Article 3", "Article 4"...) are content
+        return {
+            key for key, count in counts.items()
+            if count >= min_pages and not self._detect_sections(samples[key], 0)
+        }
+
+    def _boilerplate_zone(self, lines: list[str]) -> Iterator[tuple[int, str]]:
+        """(line index, normalized line) for the header and footer lines of a page."""
+        zone_lines = settings.parser_boilerplate_zone_lines
+        indexes = sorted(set(range(min(zone_lines, len(lines))))
+                         | set(range(max(len(lines) - zone_lines, 0), len(lines))))
+
+        for index in indexes:
+            normalized = " ".join(self._boilerplate_digits_re.sub("#", lines[index]).split())
+            if normalized:
+                yield index, normalized
+
+    def _strip_boilerplate(self, result: Dict[str, Any], boilerplate: set[str]) -> int:
+        """
+        Remove boilerplate lines from a page result, shifting the line numbers
+        of its (not yet enriched) sections; a section anchored on a removed line
+        (outline entry missing from the text) moves to the next line.
+
+        Returns:
+            Number of characters removed
+        """
+        text, removed = self._strip_page_text(result["text"], boilerplate)
+        if not removed:
+            return 0
+
+        chars_removed = len(result["text"]) - len(text)
+        result["text"] = text
+
+        for section in result["sections"]:
+            shift = sum(1 for index in removed if index < section["line"])
+            section["line"] -= shift
+            section["start_line"] = section.get("start_line", section["line"] + shift) - shift
+
+        return chars_removed
+
+    def _strip_page_text(self, text: str, boilerplate: set[str]) -> tuple[str, set[int]]:
+        """Page text without its boilerplate lines, and the indexes of the removed lines."""
+        lines = text.split("\n")
+        removed = {index for index, key in self._boilerplate_zone(lines) if key in boilerplate}
+        if not removed:
+            return text, removed
+
+        return "\n".join(line for index, line in enumerate(lines) if index not in removed), removed
+
+    def _boilerplate_stats(self, boilerplate: set[str], chars_removed: int) -> Dict[str, Any]:
+        """Boilerplate report stored with the extraction (tokens estimated as chars / 4)."""
+        if chars_removed:
+            print(f"  ✂️  Boilerplate: {len(boilerplate)} repeated lines, {chars_removed} chars (~{chars_removed // 4} tokens) removed")
+
+        return {
+            "lines": sorted(boilerplate),
+            "chars_removed": chars_removed,
+            "tokens_saved": chars_removed // 4
+        }
+
+    def diff_page_fingerprints(
+        self,
+        previous: list[str],
+        current: list[str]
+    ) -> list[int]:
+        """
+        Pages (1-based) of the current version whose content differs from the previous one.
+        """
+        return [
+            page_num
+            for page_num, fingerprint in enumerate(current, start=1)
+            if page_num > len(previous) or previous[page_num - 1] != fingerprint
+        ]
+
+    def _page_fingerprint(self, page_text: str) -> str:
+        """
+        Content fingerprint of a page.
+
+        Sections, their content and tables are all derived from the page text,
+        so two pages with the same fingerprint produce the same extraction.
+        """
+        return hashlib.sha256(page_text.encode("utf-8")).hexdigest()[:16]
+
+    def _extract_with_pdfplumber_parallel_sync(
+        self,
+        file_content: bytes,
+        page_count: int,
+        max_workers: Optional[int] = None,
+        pages_per_chunk: Optional[int] = None,
+        outline: Optional[Dict[int, list[Dict[str, Any]]]] = None,
+        fidelity: str = "full"
+    ) -> Dict[str, Any]:
+        """
+        Page-parallel variant of _extract_with_pdfplumber_enhanced_sync.
+
+        Splits the document into page ranges processed by a process pool, then
+        merges pages back in order. Output is identical to the serial path.
+        Falls back to the serial path if the pool cannot be used (e.g. inside
+        a daemonic worker process).
+
+        Args:
+            file_content: PDF file content as bytes
+            page_count: Number of pages in the document
+            max_workers: Worker processes (default: settings.parser_max_workers or CPU count)
+            pages_per_chunk: Pages per task (default: settings.parser_pages_per_chunk)
+            outline: Outline entries by page (see _outline_by_page), None to scan for sections
+            fidelity: One of FIDELITY_LEVELS
+
+        Returns:
+            {"text": str, "tables": List[Dict], "sections": List[Dict]}
+        """
+        return self._merge_page_results(
+            self._extract_page_results_parallel_sync(
+                file_content, page_count, max_workers, pages_per_chunk, outline, fidelity
+            ),
+            strip_boilerplate=settings.parser_strip_boilerplate
+        )
+
+    def _extract_page_results_parallel_sync(
+        self,
+        file_content: bytes,
+        page_count: int,
+        max_workers: Optional[int] = None,
+        pages_per_chunk: Optional[int] = None,
+        outline: Optional[Dict[int, list[Dict[str, Any]]]] = None,
+        fidelity: str = "full",
+        budget: Optional[ParseBudget] = None
+    ) -> list[Dict[str, Any]]:
+        """
+        Run _extract_page_sync on every page with a process pool.
+
+        The budget, if any, is checked as each page range comes back.
+
+        Returns:
+            Per-page results (see _extract_with_pdfplumber_parallel_sync)
+
+        Raises:
+            ParseBudgetExceeded: budget given and exceeded
+        """
+        max_workers = max_workers or settings.parser_max_workers or os.cpu_count() or 1
+        pages_per_chunk = max(1, pages_per_chunk or settings.parser_pages_per_chunk)
+
+        page_ranges = [
+            (first_page, min(first_page + pages_per_chunk - 1, page_count))
+            for first_page in range(1, page_count + 1, pages_per_chunk)
+        ]
+        max_workers = min(max_workers, len(page_ranges))
+
+        try:
+            page_results = []
+
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_page_worker,
+                initargs=(file_content, outline, fidelity)
+            ) as executor:
+                try:
+                    for (_, last_page), range_results in zip(page_ranges, executor.map(_extract_page_range, page_ranges)):
+                        page_results.extend(range_results)
+                        if budget is not None:
+                            budget.check("pages", last_page)
+                except ParseBudgetExceeded:
+                    # Pending page ranges are dropped instead of waited for
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+
+            return page_results
+        except ParseBudgetExceeded:
+            raise
+        except Exception as e:
+            print(f"⚠️  Parallel extraction failed ({e}), falling back to serial extraction")
+            return self._extract_page_results_sync(file_content, outline, fidelity, budget=budget)
 
     def _extract_structured_info_enhanced_sync(
         self,
@@ -916,14 +2393,8 @@ class ParserService:
         Returns:
             Enhanced structured data with section context
         """
-        # Basic extraction
-        basic_info = {
-            "reference_numbers": self._extract_reference_numbers(text),
-            "deadlines": self._extract_deadlines(text),
-            "organizations": self._extract_organizations(text),
-            "email_addresses": self._extract_emails(text),
-            "phone_numbers": self._extract_phones(text),
-        }
+        # Basic extraction (single scan)
+        basic_info = self._extract_structured_info_sync(text)
 
         # Enhanced with sections context
         enhanced_info = {
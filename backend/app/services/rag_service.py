@@ -1,6 +1,7 @@
 """
 RAG Service for semantic search using pgvector.
 """
+import asyncio
 from typing import List, Dict, Any, Optional
 from uuid import UUID
 from openai import OpenAI, AsyncOpenAI
@@ -11,11 +12,18 @@ from tenacity import retry, stop_after_attempt, wait_exponential
 
 from app.core.config import settings
 from app.models.document import DocumentEmbedding
+from app.models.vector import vector_param
+from app.services.centroid_service import centroid_service
+from app.services.embedding_cache_service import embedding_cache_service
+from app.services.reranker_service import reranker_service
+from app.services.vector_index_service import vector_index_service
 
 
 class RAGService:
     """Service for Retrieval Augmented Generation."""
 
+    RETRIEVAL_MODES = ("vector", "hybrid")
+
     def __init__(self):
         if settings.openai_api_key:
             # Sync client for Celery tasks
@@ -49,6 +57,114 @@ class RAGService:
         )
         return response.data[0].embedding
 
+    async def create_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        """
+        Create embedding vectors for many texts with few requests.
+
+        Texts are packed into requests (see _pack_embedding_batches) sent
+        concurrently, up to settings.embedding_batch_concurrency at a time;
+        a failed request is retried alone.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Embedding vectors, in the order of texts
+        """
+        if not texts:
+            return []
+        if not self.async_client:
+            raise ValueError("OpenAI API key not configured")
+
+        semaphore = asyncio.Semaphore(max(1, settings.embedding_batch_concurrency))
+
+        async def embed(batch: List[int]) -> List[List[float]]:
+            async with semaphore:
+                return await self._embed_batch([texts[i] for i in batch])
+
+        batches = self._pack_embedding_batches(texts)
+        results = await asyncio.gather(*(embed(batch) for batch in batches))
+
+        embeddings: List[List[float]] = [None] * len(texts)
+        for batch, batch_embeddings in zip(batches, results):
+            for i, embedding in zip(batch, batch_embeddings):
+                embeddings[i] = embedding
+        return embeddings
+
+    async def embed_texts_cached(self, db: AsyncSession, texts: List[str]) -> List[List[float]]:
+        """
+        Embedding vectors of texts, from the embedding cache when possible.
+
+        Only cache misses are sent to OpenAI (batched), then stored in the cache.
+
+        Args:
+            db: Database session (embedding_cache table)
+            texts: Texts to embed
+
+        Returns:
+            Embedding vectors, in the order of texts
+        """
+        if not settings.embedding_cache_enabled or not texts:
+            return await self.create_embeddings_batch(texts)
+
+        embeddings = await embedding_cache_service.get_many(db, texts)
+        missing = list(dict.fromkeys(text for text, embedding in zip(texts, embeddings) if embedding is None))
+
+        if missing:
+            created = dict(zip(missing, await self.create_embeddings_batch(missing)))
+            await embedding_cache_service.set_many(db, missing, list(created.values()))
+            embeddings = [embedding if embedding is not None else created[text] for text, embedding in zip(texts, embeddings)]
+
+        return embeddings
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=4, max=10)
+    )
+    async def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """One embeddings request for a packed batch (retried on its own)."""
+        response = await self.async_client.embeddings.create(
+            model=self.embedding_model,
+            input=texts
+        )
+        return self._embeddings_in_order(response, len(texts))
+
+    def _pack_embedding_batches(self, texts: List[str]) -> List[List[int]]:
+        """
+        Pack texts, in order, into embeddings requests.
+
+        A request holds at most settings.embedding_batch_max_items texts and
+        settings.embedding_batch_max_tokens estimated tokens (1 token ≈ 4 chars);
+        a text above the token limit on its own gets a request of its own.
+
+        Returns:
+            Batches of indices into texts
+        """
+        max_items = max(1, settings.embedding_batch_max_items)
+        max_tokens = settings.embedding_batch_max_tokens
+
+        batches: List[List[int]] = []
+        batch: List[int] = []
+        batch_tokens = 0
+
+        for i, chunk_text in enumerate(texts):
+            tokens = len(chunk_text) // 4 + 1
+            if batch and (len(batch) >= max_items or batch_tokens + tokens > max_tokens):
+                batches.append(batch)
+                batch, batch_tokens = [], 0
+            batch.append(i)
+            batch_tokens += tokens
+
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _embeddings_in_order(self, response, count: int) -> List[List[float]]:
+        """Embeddings of a batched response, in input order (items carry their input index)."""
+        if len(response.data) != count:
+            raise ValueError(f"Embeddings response has {len(response.data)} items for {count} inputs")
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
     def chunk_text(self, text: str) -> List[str]:
         """
         Split text into chunks with overlap.
@@ -69,6 +185,165 @@ class RAGService:
 
         return chunks
 
+    def _search_filters(
+        self,
+        document_ids: List[str] | None,
+        document_types: List[str] | None
+    ) -> tuple[str, Dict[str, Any]]:
+        """WHERE clause (and its parameters) of a retrieval."""
+        type_filter, params = vector_index_service.type_filter(document_types)
+        filters = [type_filter]
+
+        if document_ids:
+            filters.append("document_id = ANY(CAST(:document_ids AS uuid[]))")
+            params["document_ids"] = [str(document_id) for document_id in document_ids]
+
+        return " AND ".join(filters), params
+
+    def _search_sql(self, mode: str, where_clause: str, storage: str | None = None):
+        """
+        Retrieval statement of a mode.
+
+        vector: nearest chunks (the embedding is bound once, ORDER BY reuses the selected distance).
+        hybrid: nearest chunks and best full-text matches (settings.rag_hybrid_candidates each),
+        fused by reciprocal rank in the same statement. The full-text half accepts web search
+        syntax ("quoted phrases", -exclusions) and uses the GIN index of vector_index_service.
+
+        With a quantized storage (settings.vector_storage), nearest chunks come from the
+        halfvec/binary index and are re-scored on the full-precision embeddings.
+        """
+        storage = vector_index_service.resolve_storage(storage)
+
+        if mode == "vector" and storage != "full":
+            return text(f"""
+                WITH query_vector AS MATERIALIZED (
+                    SELECT CAST(:query_embedding AS vector) AS embedding
+                ),
+                nearest AS ({vector_index_service.nearest_sql(where_clause, storage)})
+                SELECT
+                    de.id,
+                    de.document_id,
+                    de.document_type,
+                    de.chunk_text,
+                    de.meta_data,
+                    n.distance
+                FROM nearest n
+                JOIN document_embeddings de ON de.id = n.id
+                ORDER BY n.distance
+            """).bindparams(vector_param())
+
+        if mode == "vector":
+            return text(f"""
+                SELECT
+                    id,
+                    document_id,
+                    document_type,
+                    chunk_text,
+                    meta_data,
+                    embedding <=> :query_embedding as distance
+                FROM document_embeddings
+                WHERE {where_clause}
+                ORDER BY distance
+                LIMIT :top_k
+            """).bindparams(vector_param())
+
+        if mode != "hybrid":
+            raise ValueError(f"Unknown retrieval mode '{mode}' (expected one of {', '.join(self.RETRIEVAL_MODES)})")
+
+        tsvector = vector_index_service.tsvector_sql()
+        return text(f"""
+            WITH query_vector AS MATERIALIZED (
+                SELECT CAST(:query_embedding AS vector) AS embedding
+            ),
+            vector_hits AS (
+                SELECT id, row_number() OVER (ORDER BY distance) AS rank
+                FROM ({vector_index_service.nearest_sql(where_clause, storage)}) nearest
+            ),
+            lexical_hits AS (
+                SELECT id, row_number() OVER (ORDER BY score DESC) AS rank
+                FROM (
+                    SELECT id, ts_rank_cd({tsvector}, tsq) AS score
+                    FROM document_embeddings, websearch_to_tsquery('{vector_index_service.fts_config()}', :query_text) tsq
+                    WHERE {tsvector} @@ tsq AND {where_clause}
+                    ORDER BY score DESC
+                    LIMIT :candidates
+                ) matching
+            ),
+            fused AS (
+                SELECT
+                    COALESCE(v.id, l.id) AS id,
+                    v.rank AS vector_rank,
+                    l.rank AS lexical_rank,
+                    COALESCE(1.0 / (:rrf_k + v.rank), 0) + COALESCE(1.0 / (:rrf_k + l.rank), 0) AS rrf_score
+                FROM vector_hits v
+                FULL OUTER JOIN lexical_hits l ON l.id = v.id
+                ORDER BY rrf_score DESC
+                LIMIT :top_k
+            )
+            SELECT
+                de.id,
+                de.document_id,
+                de.document_type,
+                de.chunk_text,
+                de.meta_data,
+                de.embedding <=> q.embedding as distance,
+                f.vector_rank,
+                f.lexical_rank,
+                f.rrf_score
+            FROM fused f
+            JOIN document_embeddings de ON de.id = f.id
+            CROSS JOIN query_vector q
+            ORDER BY f.rrf_score DESC
+        """).bindparams(vector_param())
+
+    def _search_params(
+        self,
+        mode: str,
+        query: str,
+        query_embedding: List[float],
+        top_k: int,
+        storage: str | None = None
+    ) -> Dict[str, Any]:
+        """Bind parameters of a retrieval statement (filters excluded)."""
+        params = {"query_embedding": query_embedding, "top_k": top_k}
+        if mode == "hybrid":
+            params.update({
+                "query_text": query,
+                "candidates": max(settings.rag_hybrid_candidates, top_k),
+                "rrf_k": settings.rag_rrf_k
+            })
+
+        shortlist = vector_index_service.shortlist_size(params.get("candidates", top_k), storage)
+        if shortlist:
+            params.update({"candidates": params.get("candidates", top_k), "shortlist": shortlist})
+        return params
+
+    @staticmethod
+    def _index_limit(params: Dict[str, Any]) -> int:
+        """Rows the ANN index must return for a retrieval (sizes hnsw.ef_search)."""
+        return params.get("shortlist") or params.get("candidates") or params["top_k"]
+
+    def _search_results(self, rows) -> List[Dict[str, Any]]:
+        """Result dicts of retrieval rows (hybrid rows also carry their ranks and fused score)."""
+        results = []
+        for row in rows:
+            result = {
+                "id": str(row.id),
+                "document_id": str(row.document_id),
+                "document_type": row.document_type,
+                "chunk_text": row.chunk_text,
+                "similarity_score": 1 - float(row.distance),
+                "metadata": row.meta_data
+            }
+            if "rrf_score" in row._fields:
+                result.update({
+                    "vector_rank": row.vector_rank,
+                    "lexical_rank": row.lexical_rank,
+                    "rrf_score": float(row.rrf_score)
+                })
+            results.append(result)
+        return results
+
     async def ingest_document(
         self,
         db: AsyncSession,
@@ -93,16 +368,16 @@ class RAGService:
         chunks = self.chunk_text(content)
         metadata = metadata or {}
 
-        count = 0
-        for idx, chunk in enumerate(chunks):
-            embedding = await self.create_embedding(chunk)
+        embeddings = await self.embed_texts_cached(db, chunks)
 
+        count = 0
+        for idx, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
             doc_embedding = DocumentEmbedding(
                 document_id=document_id,
                 document_type=document_type,
                 chunk_text=chunk,
                 embedding=embedding,
-                metadata={
+                meta_data={
                     **metadata,
                     "chunk_index": idx,
                     "total_chunks": len(chunks)
@@ -113,6 +388,7 @@ class RAGService:
             count += 1
 
         await db.commit()
+        await centroid_service.refresh_document(db, document_id)
         return count
 
     async def retrieve_relevant_content(
@@ -120,63 +396,43 @@ class RAGService:
         db: AsyncSession,
         query: str,
         top_k: int = 5,
-        document_types: List[str] | None = None
+        document_types: List[str] | None = None,
+        ef_search: int | None = None,
+        probes: int | None = None,
+        document_ids: List[str] | None = None,
+        mode: str | None = None,
+        storage: str | None = None
     ) -> List[Dict[str, Any]]:
         """
-        Retrieve relevant content using semantic search.
+        Retrieve relevant content using semantic (or hybrid) search.
 
         Args:
             db: Database session
             query: Search query
             top_k: Number of results to return
             document_types: Filter by document types
+            ef_search: HNSW candidate list size (default: settings.vector_hnsw_ef_search)
+            probes: IVFFlat lists visited (default: settings.vector_ivfflat_probes)
+            document_ids: Filter by specific document IDs
+            mode: "vector" or "hybrid" (default: settings.rag_retrieval_mode)
+            storage: "full", "halfvec" or "binary" first stage (default: settings.vector_storage)
 
         Returns:
             List of relevant chunks with similarity scores
         """
-        query_embedding = await self.create_embedding(query)
+        mode = mode or settings.rag_retrieval_mode
+        where_clause, params = self._search_filters(document_ids, document_types)
+        sql = self._search_sql(mode, where_clause, storage)
 
-        # Build SQL query for cosine similarity search
-        type_filter = ""
-        if document_types:
-            types_str = ", ".join([f"'{t}'" for t in document_types])
-            type_filter = f"AND document_type IN ({types_str})"
+        query_embedding = (await self.embed_texts_cached(db, [query]))[0]
+        params.update(self._search_params(mode, query, query_embedding, top_k, storage))
 
-        sql = text(f"""
-            SELECT
-                id,
-                document_id,
-                document_type,
-                chunk_text,
-                metadata,
-                1 - (embedding <=> :query_embedding) as similarity
-            FROM document_embeddings
-            WHERE 1=1 {type_filter}
-            ORDER BY embedding <=> :query_embedding
-            LIMIT :top_k
-        """)
-
-        result = await db.execute(
-            sql,
-            {
-                "query_embedding": str(query_embedding),
-                "top_k": top_k
-            }
+        await vector_index_service.apply_search_params(
+            db, self._index_limit(params), ef_search=ef_search, probes=probes
         )
+        result = await db.execute(sql, params)
 
-        rows = result.fetchall()
-
-        return [
-            {
-                "id": str(row.id),
-                "document_id": str(row.document_id),
-                "document_type": row.document_type,
-                "chunk_text": row.chunk_text,
-                "similarity_score": float(row.similarity),
-                "metadata": row.metadata
-            }
-            for row in rows
-        ]
+        return self._search_results(result.fetchall())
 
     async def find_similar_tenders(
         self,
@@ -195,48 +451,15 @@ class RAGService:
         Returns:
             List of similar tenders
         """
-        # Get current tender's embeddings
-        stmt = select(DocumentEmbedding).where(
-            DocumentEmbedding.document_id == tender_id,
-            DocumentEmbedding.document_type == "tender"
-        ).limit(1)
-
-        result = await db.execute(stmt)
-        current_embedding = result.scalar_one_or_none()
-
-        if not current_embedding:
-            return []
-
-        # Find similar tenders
-        sql = text("""
-            SELECT DISTINCT
-                document_id,
-                AVG(1 - (embedding <=> :query_embedding)) as avg_similarity
-            FROM document_embeddings
-            WHERE document_type = 'tender'
-            AND document_id != :current_id
-            GROUP BY document_id
-            ORDER BY avg_similarity DESC
-            LIMIT :limit
-        """)
-
-        result = await db.execute(
-            sql,
-            {
-                "query_embedding": str(current_embedding.embedding),
-                "current_id": str(tender_id),
-                "limit": limit
-            }
-        )
-
-        rows = result.fetchall()
+        # KNN over document centroids (maintained on ingestion)
+        neighbours = await centroid_service.nearest(db, "document", tender_id, limit=limit, document_type="tender")
 
         return [
             {
-                "document_id": str(row.document_id),
-                "similarity_score": float(row.avg_similarity)
+                "document_id": neighbour["entity_id"],
+                "similarity_score": neighbour["similarity_score"]
             }
-            for row in rows
+            for neighbour in neighbours
         ]
 
     async def rerank_results(
@@ -254,11 +477,9 @@ class RAGService:
             top_k: Number of top results to return
 
         Returns:
-            Reranked results
+            Reranked results, with their rerank_score (retrieval order without a reranker model)
         """
-        # TODO: Implement reranking logic
-        # Could use cross-encoder or other reranking model
-        return candidates[:top_k]
+        return await reranker_service.rerank(query, candidates, top_k=top_k)
 
     # ========== SYNCHRONOUS METHODS FOR CELERY TASKS ==========
 
@@ -289,6 +510,82 @@ class RAGService:
             print(f"❌ OpenAI embedding error: {e}")
             raise
 
+    def create_embeddings_batch_sync(self, texts: List[str]) -> List[List[float]]:
+        """
+        Create embedding vectors for many texts with few requests (SYNC version for Celery).
+
+        Texts are packed into requests (see _pack_embedding_batches); a
+        failed request is retried alone, earlier batches are not re-sent.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Embedding vectors, in the order of texts
+        """
+        if not texts:
+            return []
+        if not self.sync_client:
+            raise ValueError("OpenAI API key not configured")
+
+        batches = self._pack_embedding_batches(texts)
+
+        embeddings: List[List[float]] = [None] * len(texts)
+        for n, batch in enumerate(batches, 1):
+            batch_embeddings = self._embed_batch_sync([texts[i] for i in batch])
+            for i, embedding in zip(batch, batch_embeddings):
+                embeddings[i] = embedding
+
+            if len(batches) > 1:
+                print(f"    ✓ Embedding request {n}/{len(batches)} ({len(batch)} chunks)")
+
+        return embeddings
+
+    def embed_texts_cached_sync(self, db: Session, texts: List[str]) -> List[List[float]]:
+        """
+        Embedding vectors of texts, from the embedding cache when possible (SYNC for Celery).
+
+        Only cache misses are sent to OpenAI (batched), then stored in the cache.
+
+        Args:
+            db: Sync database session (embedding_cache table)
+            texts: Texts to embed
+
+        Returns:
+            Embedding vectors, in the order of texts
+        """
+        if not settings.embedding_cache_enabled or not texts:
+            return self.create_embeddings_batch_sync(texts)
+
+        embeddings = embedding_cache_service.get_many_sync(db, texts)
+        missing = list(dict.fromkeys(text for text, embedding in zip(texts, embeddings) if embedding is None))
+
+        if len(texts) > 1:
+            print(f"    ⚡ Embedding cache: {len(texts) - len(missing)}/{len(texts)} chunks reused")
+
+        if missing:
+            created = dict(zip(missing, self.create_embeddings_batch_sync(missing)))
+            embedding_cache_service.set_many_sync(db, missing, list(created.values()))
+            embeddings = [embedding if embedding is not None else created[text] for text, embedding in zip(texts, embeddings)]
+
+        return embeddings
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=4, max=10)
+    )
+    def _embed_batch_sync(self, texts: List[str]) -> List[List[float]]:
+        """One embeddings request for a packed batch (retried on its own)."""
+        try:
+            response = self.sync_client.embeddings.create(
+                model=self.embedding_model,
+                input=texts
+            )
+            return self._embeddings_in_order(response, len(texts))
+        except Exception as e:
+            print(f"❌ OpenAI embedding error ({len(texts)} inputs): {e}")
+            raise
+
     def chunk_sections_semantic(
         self,
         sections: List[Dict[str, Any]],
@@ -426,10 +723,10 @@ class RAGService:
 
         print(f"  📦 Creating embeddings for {len(chunks)} chunks...")
 
-        for chunk_data in chunks:
-            # Create embedding
-            embedding = self.create_embedding_sync(chunk_data["text"])
+        # Cached chunks are reused, the others embedded in batched requests (in chunk order)
+        embeddings = self.embed_texts_cached_sync(db, [chunk_data["text"] for chunk_data in chunks])
 
+        for chunk_data, embedding in zip(chunks, embeddings):
             # Prepare record
             doc_embedding = DocumentEmbedding(
                 document_id=document_id,
@@ -439,8 +736,8 @@ class RAGService:
                 meta_data={
                     **metadata,
                     **chunk_data.get("metadata", {}),
-                    "chunk_index": count,
-                    "total_chunks": len(chunks)
+                    "chunk_index": chunk_data.get("chunk_index", count),
+                    "total_chunks": chunk_data.get("total_chunks", len(chunks))
                 }
             )
 
@@ -459,19 +756,109 @@ class RAGService:
             db.bulk_save_objects(batch)
             db.commit()
 
+        centroid_service.refresh_document_sync(db, document_id)
+
         print(f"  ✅ Ingested {count} chunks")
         return count
 
+    def sync_document_chunks_sync(
+        self,
+        db: Session,
+        document_id: UUID,
+        chunks: List[Dict[str, Any]],
+        document_type: str,
+        metadata: Dict[str, Any] | None = None
+    ) -> Dict[str, int]:
+        """
+        Bring a document's embeddings in line with its current chunks (SYNC for Celery).
+
+        Chunks whose text is already embedded are kept (only their position
+        metadata is refreshed), embeddings of chunks that disappeared are
+        deleted, and only new or changed chunk texts are sent to OpenAI.
+        On first ingestion this is equivalent to ingest_document_sync().
+
+        Args:
+            db: Sync database session
+            document_id: Document UUID
+            chunks: Pre-chunked sections with metadata (current version)
+            document_type: Type (tender, proposal, etc.)
+            metadata: Additional metadata
+
+        Returns:
+            {"kept": int, "created": int, "deleted": int}
+        """
+        metadata = metadata or {}
+
+        existing_rows = db.execute(
+            select(DocumentEmbedding.id, DocumentEmbedding.chunk_text, DocumentEmbedding.meta_data)
+            .where(DocumentEmbedding.document_id == document_id)
+        ).fetchall()
+
+        existing_by_text: Dict[str, List[Any]] = {}
+        for row in existing_rows:
+            existing_by_text.setdefault(row.chunk_text, []).append(row)
+
+        kept_updates = []
+        new_chunks = []
+
+        for idx, chunk_data in enumerate(chunks):
+            matches = existing_by_text.get(chunk_data["text"])
+            if matches:
+                row = matches.pop()
+                kept_updates.append({
+                    "id": row.id,
+                    "meta_data": {
+                        **(row.meta_data or {}),
+                        **metadata,
+                        **chunk_data.get("metadata", {}),
+                        "chunk_index": idx,
+                        "total_chunks": len(chunks)
+                    }
+                })
+            else:
+                new_chunks.append({**chunk_data, "chunk_index": idx, "total_chunks": len(chunks)})
+
+        stale_ids = [row.id for rows in existing_by_text.values() for row in rows]
+
+        if stale_ids:
+            db.query(DocumentEmbedding).filter(
+                DocumentEmbedding.id.in_(stale_ids)
+            ).delete(synchronize_session=False)
+
+        if kept_updates:
+            db.bulk_update_mappings(DocumentEmbedding, kept_updates)
+
+        db.commit()
+
+        created = 0
+        if new_chunks:
+            created = self.ingest_document_sync(
+                db=db,
+                document_id=document_id,
+                chunks=new_chunks,
+                document_type=document_type,
+                metadata=metadata
+            )
+        elif stale_ids:
+            # Only deletions: ingest_document_sync() did not refresh the centroids
+            centroid_service.refresh_document_sync(db, document_id)
+
+        return {"kept": len(kept_updates), "created": created, "deleted": len(stale_ids)}
+
     def retrieve_relevant_content_sync(
         self,
         db: Session,
         query: str,
         top_k: int = 5,
         document_ids: List[str] | None = None,
-        document_types: List[str] | None = None
+        document_types: List[str] | None = None,
+        ef_search: int | None = None,
+        probes: int | None = None,
+        mode: str | None = None,
+        storage: str | None = None
     ) -> List[Dict[str, Any]]:
         """
-        Retrieve relevant content using semantic search (SYNC for Celery).
+        Retrieve relevant content using semantic (or hybrid) search (SYNC for Celery).
 
         Args:
             db: Sync database session
@@ -479,59 +866,47 @@ class RAGService:
             top_k: Number of results
             document_ids: Filter by specific document IDs
             document_types: Filter by types
+            ef_search: HNSW candidate list size (default: settings.vector_hnsw_ef_search)
+            probes: IVFFlat lists visited (default: settings.vector_ivfflat_probes)
+            mode: "vector" or "hybrid" (default: settings.rag_retrieval_mode)
+            storage: "full", "halfvec" or "binary" first stage (default: settings.vector_storage)
 
         Returns:
             List of relevant chunks with similarity scores
         """
-        # Create query embedding
-        query_embedding = self.create_embedding_sync(query)
-
-        # Build SQL filters
-        filters = []
+        mode = mode or settings.rag_retrieval_mode
+        where_clause, params = self._search_filters(document_ids, document_types)
+        sql = self._search_sql(mode, where_clause, storage)
 
-        if document_ids:
-            ids_str = ", ".join([f"'{id}'" for id in document_ids])
-            filters.append(f"document_id IN ({ids_str})")
+        # Create query embedding
+        query_embedding = self.embed_texts_cached_sync(db, [query])[0]
+        params.update(self._search_params(mode, query, query_embedding, top_k, storage))
 
-        if document_types:
-            types_str = ", ".join([f"'{t}'" for t in document_types])
-            filters.append(f"document_type IN ({types_str})")
+        vector_index_service.apply_search_params_sync(
+            db, self._index_limit(params), ef_search=ef_search, probes=probes
+        )
+        result = db.execute(sql, params)
 
-        where_clause = " AND ".join(filters) if filters else "1=1"
+        return self._search_results(result.fetchall())
 
-        # Execute vector search
-        # Convert embedding to string format for PostgreSQL
-        emb_str = str(query_embedding)
+    def rerank_results_sync(
+        self,
+        query: str,
+        candidates: List[Dict[str, Any]],
+        top_k: int = 5
+    ) -> List[Dict[str, Any]]:
+        """
+        Rerank search results for improved relevance (SYNC for Celery).
 
-        sql = text(f"""
-            SELECT
-                id,
-                document_id,
-                document_type,
-                chunk_text,
-                meta_data,
-                1 - (embedding <=> '{emb_str}'::vector) as similarity
-            FROM document_embeddings
-            WHERE {where_clause}
-            ORDER BY embedding <=> '{emb_str}'::vector
-            LIMIT :top_k
-        """)
-
-        result = db.execute(sql, {"top_k": top_k})
-
-        rows = result.fetchall()
+        Args:
+            query: Original search query
+            candidates: Initial search results
+            top_k: Number of top results to return
 
-        return [
-            {
-                "id": str(row.id),
-                "document_id": str(row.document_id),
-                "document_type": row.document_type,
-                "chunk_text": row.chunk_text,
-                "similarity_score": float(row.similarity),
-                "metadata": row.meta_data
-            }
-            for row in rows
-        ]
+        Returns:
+            Reranked results, with their rerank_score (retrieval order without a reranker model)
+        """
+        return reranker_service.rerank_sync(query, candidates, top_k=top_k)
 
     def find_similar_tenders_sync(
         self,
@@ -542,7 +917,8 @@ class RAGService:
         """
         Find similar past tenders (SYNC for Celery).
 
-        Uses first document of tender as representative for similarity.
+        KNN over tender centroids (mean of the tender's document centroids,
+        maintained on ingestion by centroid_service).
 
         Args:
             db: Sync database session
@@ -550,64 +926,16 @@ class RAGService:
             limit: Number of similar tenders
 
         Returns:
-            List of similar tenders with avg similarity
+            List of similar tenders with their centroid similarity
         """
-        from app.models.tender_document import TenderDocument
-
-        # Get first document ID of tender
-        stmt = select(TenderDocument.id).where(
-            TenderDocument.tender_id == tender_id
-        ).limit(1)
-
-        result = db.execute(stmt)
-        first_doc = result.scalar_one_or_none()
-
-        if not first_doc:
-            return []
-
-        # Get first embedding of this document
-        stmt = select(DocumentEmbedding.embedding).where(
-            DocumentEmbedding.document_id == first_doc
-        ).limit(1)
-
-        result = db.execute(stmt)
-        current_embedding_row = result.first()
-
-        if not current_embedding_row:
-            return []
-
-        current_embedding = current_embedding_row[0]
-
-        # Find similar tenders by avg embedding similarity
-        sql = text("""
-            SELECT DISTINCT
-                td.tender_id,
-                AVG(1 - (de.embedding <=> :query_embedding::vector)) as avg_similarity
-            FROM document_embeddings de
-            JOIN tender_documents td ON td.id = de.document_id
-            WHERE td.tender_id != :current_tender_id
-            GROUP BY td.tender_id
-            ORDER BY avg_similarity DESC
-            LIMIT :limit
-        """)
-
-        result = db.execute(
-            sql,
-            {
-                "query_embedding": current_embedding,
-                "current_tender_id": str(tender_id),
-                "limit": limit
-            }
-        )
-
-        rows = result.fetchall()
+        neighbours = centroid_service.nearest_sync(db, "tender", tender_id, limit=limit)
 
         return [
             {
-                "tender_id": str(row.tender_id),
-                "similarity_score": float(row.avg_similarity)
+                "tender_id": neighbour["entity_id"],
+                "similarity_score": neighbour["similarity_score"]
             }
-            for row in rows
+            for neighbour in neighbours
         ]
 
     def ingest_all_past_proposals_sync(
@@ -0,0 +1,211 @@
+"""
+Cross-encoder reranking of retrieved chunks, on CPU.
+"""
+import asyncio
+import hashlib
+import threading
+from typing import Dict, Any, List
+
+import redis.asyncio as redis
+import redis as redis_sync
+
+from app.core.config import settings
+
+
+class RerankerService:
+    """
+    Scores (query, chunk) pairs with a small cross-encoder (sentence-transformers).
+
+    The model is loaded on first use and runs on CPU in batches of
+    settings.reranker_batch_size pairs. Scores are cached in Redis per
+    (model + query hash, chunk id) for settings.reranker_cache_ttl seconds,
+    so asking again, or paging through the same candidates, only scores
+    the new chunks.
+
+    sentence-transformers is optional (it pulls in torch): without it, or
+    with settings.reranker_enabled off, rerank*() keep the retrieval order.
+    """
+
+    CACHE_PREFIX = "reranker"
+
+    def __init__(self):
+        self.redis_client: redis.Redis | None = None
+        self.redis_sync_client: redis_sync.Redis | None = None
+        self._model = None
+        self._model_lock = threading.Lock()
+        self._unavailable = False
+
+    def _load_model(self):
+        """Cross-encoder, loaded once (None when disabled or not installed)."""
+        if not settings.reranker_enabled or self._unavailable:
+            return None
+        if self._model is not None:
+            return self._model
+
+        with self._model_lock:
+            if self._model is None:
+                try:
+                    from sentence_transformers import CrossEncoder
+                    import torch
+                except ImportError:
+                    print("⚠️  sentence-transformers not installed: reranking disabled (retrieval order kept)")
+                    self._unavailable = True
+                    return None
+
+                if settings.reranker_threads:
+                    torch.set_num_threads(settings.reranker_threads)
+
+                print(f"🧠 Loading reranker {settings.reranker_model} (CPU)...")
+                self._model = CrossEncoder(
+                    settings.reranker_model,
+                    max_length=settings.reranker_max_length,
+                    device="cpu"
+                )
+        return self._model
+
+    @property
+    def available(self) -> bool:
+        """Whether rerank*() actually rerank (loads the model)."""
+        return self._load_model() is not None
+
+    def _cache_key(self, query: str) -> str:
+        """Redis hash holding the chunk scores of a query, for the configured model."""
+        digest = hashlib.sha256(f"{settings.reranker_model}\0{query.strip()}".encode()).hexdigest()[:32]
+        return f"{self.CACHE_PREFIX}:{digest}"
+
+    def _predict(self, query: str, texts: List[str]) -> List[float]:
+        """Cross-encoder scores of (query, text) pairs, batched."""
+        scores = self._load_model().predict(
+            [(query, text) for text in texts],
+            batch_size=settings.reranker_batch_size,
+            show_progress_bar=False,
+            convert_to_numpy=True
+        )
+        return [float(score) for score in scores]
+
+    def _ranked(
+        self,
+        candidates: List[Dict[str, Any]],
+        scores: Dict[str, float],
+        top_k: int
+    ) -> List[Dict[str, Any]]:
+        """Candidates sorted by score (stable: ties keep the retrieval order), with rerank_score."""
+        ranked = sorted(
+            ({**candidate, "rerank_score": scores[candidate["id"]]} for candidate in candidates),
+            key=lambda candidate: candidate["rerank_score"],
+            reverse=True
+        )
+        return ranked[:top_k]
+
+    @staticmethod
+    def _decode(ids: List[str], values: List[Any]) -> Dict[str, float]:
+        """Cached scores found by HMGET."""
+        return {chunk_id: float(value) for chunk_id, value in zip(ids, values) if value is not None}
+
+    # ========== SYNCHRONOUS METHODS FOR CELERY TASKS ==========
+
+    def _get_redis_sync(self) -> redis_sync.Redis:
+        """Get or create sync Redis client."""
+        if self.redis_sync_client is None:
+            self.redis_sync_client = redis_sync.from_url(settings.redis_url)
+        return self.redis_sync_client
+
+    def _cached_scores_sync(self, key: str, ids: List[str]) -> Dict[str, float]:
+        """Scores already computed for these chunks (never fails the caller)."""
+        try:
+            return self._decode(ids, self._get_redis_sync().hmget(key, ids))
+        except Exception as e:
+            print(f"⚠️  Reranker cache error: {e}")
+            return {}
+
+    def _store_scores_sync(self, key: str, scores: Dict[str, float]) -> None:
+        """Cache new scores (never fails the caller)."""
+        try:
+            pipeline = self._get_redis_sync().pipeline()
+            pipeline.hset(key, mapping=scores)
+            pipeline.expire(key, settings.reranker_cache_ttl)
+            pipeline.execute()
+        except Exception as e:
+            print(f"⚠️  Reranker cache error: {e}")
+
+    def rerank_sync(self, query: str, candidates: List[Dict[str, Any]], top_k: int = 5) -> List[Dict[str, Any]]:
+        """
+        Keep the top_k candidates by cross-encoder score.
+
+        Args:
+            query: Search query
+            candidates: Retrieved chunks ({"id", "chunk_text", ...})
+            top_k: Number of results to keep
+
+        Returns:
+            Best candidates with their rerank_score (retrieval order without a model)
+        """
+        if not candidates or not self.available:
+            return candidates[:top_k]
+
+        key = self._cache_key(query)
+        ids = [candidate["id"] for candidate in candidates]
+        scores = self._cached_scores_sync(key, ids)
+
+        missing = [candidate for candidate in candidates if candidate["id"] not in scores]
+        if missing:
+            new_scores = dict(zip(
+                [candidate["id"] for candidate in missing],
+                self._predict(query, [candidate["chunk_text"] for candidate in missing])
+            ))
+            self._store_scores_sync(key, new_scores)
+            scores.update(new_scores)
+
+        return self._ranked(candidates, scores, top_k)
+
+    # ========== ASYNC METHODS FOR API ENDPOINTS ==========
+
+    async def _get_redis(self) -> redis.Redis:
+        """Get or create async Redis client."""
+        if self.redis_client is None:
+            self.redis_client = await redis.from_url(settings.redis_url)
+        return self.redis_client
+
+    async def _cached_scores(self, key: str, ids: List[str]) -> Dict[str, float]:
+        """Async variant of _cached_scores_sync."""
+        try:
+            client = await self._get_redis()
+            return self._decode(ids, await client.hmget(key, ids))
+        except Exception as e:
+            print(f"⚠️  Reranker cache error: {e}")
+            return {}
+
+    async def _store_scores(self, key: str, scores: Dict[str, float]) -> None:
+        """Async variant of _store_scores_sync."""
+        try:
+            client = await self._get_redis()
+            pipeline = client.pipeline()
+            pipeline.hset(key, mapping=scores)
+            pipeline.expire(key, settings.reranker_cache_ttl)
+            await pipeline.execute()
+        except Exception as e:
+            print(f"⚠️  Reranker cache error: {e}")
+
+    async def rerank(self, query: str, candidates: List[Dict[str, Any]], top_k: int = 5) -> List[Dict[str, Any]]:
+        """Async variant of rerank_sync (the model runs in a thread: the event loop stays free)."""
+        if not candidates or not await asyncio.to_thread(lambda: self.available):
+            return candidates[:top_k]
+
+        key = self._cache_key(query)
+        ids = [candidate["id"] for candidate in candidates]
+        scores = await self._cached_scores(key, ids)
+
+        missing = [candidate for candidate in candidates if candidate["id"] not in scores]
+        if missing:
+            new_scores = dict(zip(
+                [candidate["id"] for candidate in missing],
+                await asyncio.to_thread(self._predict, query, [candidate["chunk_text"] for candidate in missing])
+            ))
+            await self._store_scores(key, new_scores)
+            scores.update(new_scores)
+
+        return self._ranked(candidates, scores, top_k)
+
+
+# Global instance
+reranker_service = RerankerService()
@@ -0,0 +1,229 @@
+"""
+Spreadsheet parsing service for BPU/DQE/DPGF workbooks (.xlsx).
+"""
+import io
+import os
+from datetime import date, datetime, time
+from typing import Dict, Any, Optional, Union, BinaryIO
+
+import openpyxl
+
+from app.services.parser_service import parser_service
+
+
+class SpreadsheetParserService:
+    """
+    Service for parsing tender spreadsheets without converting them to PDF.
+
+    Workbooks are read in read-only mode, row by row, so memory stays bounded
+    by the extracted tables rather than the workbook size. The output has the
+    same shape as ParserService.extract_from_pdf_sync: each worksheet plays
+    the role of a page, blocks of rows become structured tables, and sheets
+    and table titles become sections (enriched by ParserService so TOC and
+    key-section flags work the same way).
+
+    Bump PARSER_VERSION (parser_service) whenever the output changes.
+    """
+
+    # Header keywords marking a price table (BPU/DQE/DPGF lines)
+    PRICE_KEYWORDS = ("prix", "€", "tjm", "montant", "total", "ht", "ttc", "coût", "tarif")
+
+    # ========== SYNCHRONOUS METHODS FOR CELERY TASKS ==========
+
+    def extract_from_xlsx_sync(
+        self,
+        source: Union[str, os.PathLike, bytes, BinaryIO]
+    ) -> Dict[str, Any]:
+        """
+        Extract tables, sections and text from an .xlsx workbook (sync version for Celery tasks).
+
+        Args:
+            source: File path, bytes or binary file object
+
+        Returns:
+            Same structure as ParserService.extract_from_pdf_sync, with
+            page_count = number of worksheets. Tables also carry "sheet",
+            "typed_rows" (native numbers, ISO dates) and "is_price_table".
+        """
+        if isinstance(source, (bytes, bytearray)):
+            source = io.BytesIO(source)
+
+        workbook = openpyxl.load_workbook(source, read_only=True, data_only=True)
+
+        try:
+            metadata = self._extract_metadata(workbook)
+            page_results = [
+                self._extract_sheet(worksheet, sheet_num)
+                for sheet_num, worksheet in enumerate(workbook.worksheets, start=1)
+            ]
+        finally:
+            workbook.close()
+
+        extraction = parser_service._merge_page_results(page_results)
+
+        structured_data = parser_service._extract_structured_info_enhanced_sync(
+            extraction["text"],
+            extraction["tables"],
+            extraction["sections"]
+        )
+
+        return {
+            "text": extraction["text"],
+            "tables": extraction["tables"],
+            "sections": extraction["sections"],
+            "page_fingerprints": extraction["page_fingerprints"],
+            "metadata": metadata,
+            "structured": structured_data,
+            "page_count": len(page_results),
+            "extraction_method": "openpyxl"
+        }
+
+    def _extract_sheet(self, worksheet, sheet_num: int) -> Dict[str, Any]:
+        """
+        Extract one worksheet as a page result (see ParserService._extract_page_sync).
+
+        Rows are streamed and grouped into blocks separated by empty rows. A
+        block whose first row has fewer filled cells than the next one is a
+        titled table; other multi-row blocks are untitled tables; single rows
+        are plain text (notices, document titles).
+
+        The page text has one line per non-empty row (cells joined with " | "),
+        preceded by the sheet title, so section line numbers index into it.
+        """
+        lines = [worksheet.title]
+        sections = [self._section("SHEET", str(sheet_num), worksheet.title, 1, sheet_num, 0)]
+        tables = []
+
+        block = []  # [(line_num, row)] of the current block
+        for row in worksheet.iter_rows(values_only=True):
+            values = [self._cell_value(value) for value in row]
+
+            if all(value is None for value in values):
+                self._flush_block(block, sheet_num, worksheet.title, sections, tables)
+                block = []
+                continue
+
+            block.append((len(lines), values))
+            lines.append(" | ".join(self._cell_text(value) for value in values if value is not None))
+
+        self._flush_block(block, sheet_num, worksheet.title, sections, tables)
+
+        return {
+            "page": sheet_num,
+            "text": "\n".join(lines),
+            "tables": tables,
+            "sections": sections
+        }
+
+    def _flush_block(
+        self,
+        block: list[tuple[int, list]],
+        sheet_num: int,
+        sheet_title: str,
+        sections: list[Dict[str, Any]],
+        tables: list[Dict[str, Any]]
+    ) -> None:
+        """Turn a block of consecutive non-empty rows into a table (and title section)."""
+        if len(block) < 2:
+            return
+
+        filled = [sum(value is not None for value in row) for _, row in block]
+
+        title = None
+        if filled[0] < filled[1]:
+            title_line, title_row = block[0]
+            title = " ".join(self._cell_text(value) for value in title_row if value is not None)
+            block = block[1:]
+
+        # Keep only the columns used by the block
+        used = [index for index in range(max(len(row) for _, row in block)) if any(
+            index < len(row) and row[index] is not None for _, row in block
+        )]
+        typed_rows = [[row[index] if index < len(row) else None for index in used] for _, row in block]
+        text_rows = [[self._cell_text(value) for value in row] for row in typed_rows]
+
+        table_idx = len(tables)
+        headers = text_rows[0]
+        tables.append({
+            "id": f"table_s{sheet_num}_{table_idx}",
+            "page": sheet_num,
+            "sheet": sheet_title,
+            "title": title,
+            "headers": headers,
+            "rows": text_rows[1:],
+            "typed_rows": typed_rows[1:],
+            "row_count": len(text_rows) - 1,
+            "col_count": len(headers),
+            "is_price_table": self._is_price_table(title, headers)
+        })
+
+        if title:
+            sections.append(self._section(
+                "TABLE", f"{sheet_num}.{table_idx + 1}", title, 2, sheet_num, title_line
+            ))
+
+    def _section(
+        self,
+        section_type: str,
+        number: str,
+        title: str,
+        level: int,
+        page: int,
+        line: int
+    ) -> Dict[str, Any]:
+        """Raw section, in the shape produced by ParserService._detect_sections."""
+        return {
+            "type": section_type,
+            "number": number,
+            "title": title,
+            "level": level,
+            "page": page,
+            "line": line,
+            "content": title,  # Will be enriched later
+            "start_line": line
+        }
+
+    def _is_price_table(self, title: Optional[str], headers: list[str]) -> bool:
+        """A table is a price table if its title or headers mention prices/amounts."""
+        words = " ".join([title or ""] + headers).lower().split()
+        return any(word.startswith(self.PRICE_KEYWORDS) for word in words)
+
+    def _cell_value(self, value: Any) -> Any:
+        """
+        JSON-friendly typed cell value: numbers and booleans are kept,
+        dates become ISO strings, text is cleaned (None if blank).
+        """
+        if value is None or isinstance(value, (bool, int, float)):
+            return value
+        if isinstance(value, (datetime, date, time)):
+            return value.isoformat()
+
+        text = str(value).replace("\u200b", "").strip()
+        return text or None
+
+    def _cell_text(self, value: Any) -> str:
+        """Single-line text of a typed cell value."""
+        if value is None:
+            return ""
+        if isinstance(value, float) and value.is_integer():
+            return str(int(value))
+        return " ".join(str(value).split())
+
+    def _extract_metadata(self, workbook) -> Dict[str, Any]:
+        """Extract workbook metadata."""
+        properties = workbook.properties
+
+        return {
+            "page_count": len(workbook.worksheets),
+            "sheets": workbook.sheetnames,
+            "title": properties.title or "",
+            "author": properties.creator or "",
+            "subject": properties.subject or "",
+            "creator": properties.creator or "",
+            "producer": properties.lastModifiedBy or "",
+            "creation_date": properties.created.isoformat() if properties.created else "",
+        }
+
+
+# Global instance
+spreadsheet_parser_service = SpreadsheetParserService()
@@ -89,6 +89,25 @@ class StorageService:
             print(f"❌ MinIO download error: {e}")
             raise
 
+    def download_to_file(self, object_name: str, file_path: str) -> str:
+        """
+        Download a file from MinIO straight to disk, without holding it in memory.
+
+        Args:
+            object_name: Object name/path in bucket
+            file_path: Local destination path
+
+        Returns:
+            Local file path
+        """
+        try:
+            self.client.fget_object(self.bucket_name, object_name, file_path)
+            return file_path
+
+        except S3Error as e:
+            print(f"❌ MinIO download error: {e}")
+            raise
+
     def delete_file(self, object_name: str) -> None:
         """
         Delete a file from MinIO.
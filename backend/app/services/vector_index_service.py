@@ -0,0 +1,374 @@
+"""
+Search index management for document_embeddings (pgvector HNSW / IVFFlat, full-text GIN).
+"""
+import math
+import re
+from typing import Dict, Any, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.vector import EMBEDDING_DIMENSIONS
+
+
+class VectorIndexService:
+    """
+    Builds and tunes the approximate nearest neighbour indexes of document_embeddings.
+
+    One index covers the whole table; partial indexes (one per type of
+    settings.vector_filtered_index_types_list) keep filtered searches on an
+    index whose every candidate passes the filter, instead of post-filtering
+    the candidates of the global index. Queries reach them through
+    type_filter(), which writes the single-type condition as a literal the
+    planner can match against the partial index predicate.
+
+    Search breadth (hnsw.ef_search / ivfflat.probes) is set per transaction
+    with apply_search_params*().
+
+    With settings.vector_storage "halfvec" or "binary", the ANN indexes are
+    expression indexes on the half-precision or binary-quantized embedding
+    (2x / 32x smaller than full float32 vectors, so they stay in memory):
+    nearest_sql() searches them for settings.vector_rescore_candidates
+    chunks, then orders those on the exact distance of the stored vectors.
+
+    The GIN index on to_tsvector(settings.rag_fts_config, chunk_text) serves
+    the lexical half of hybrid retrieval; queries must use tsvector_sql() to
+    match its expression.
+    """
+
+    METHODS = ("hnsw", "ivfflat")
+    STORAGES = ("full", "halfvec", "binary")
+    TABLE = "document_embeddings"
+    INDEX_PREFIX = "idx_document_embeddings_ann"
+    FTS_INDEX = "idx_document_embeddings_fts"
+
+    # document_type values are written into DDL and predicates: keep them to identifiers
+    TYPE_PATTERN = re.compile(r'^[a-z0-9_]+$')
+
+    # Indexed expression, operator class and distance operator of each storage
+    STORAGE_SQL = {
+        "full": ("{vector}", "vector_cosine_ops", "<=>"),
+        "halfvec": (f"CAST({{vector}} AS halfvec({EMBEDDING_DIMENSIONS}))", "halfvec_cosine_ops", "<=>"),
+        "binary": (f"CAST(binary_quantize({{vector}}) AS bit({EMBEDDING_DIMENSIONS}))", "bit_hamming_ops", "<~>"),
+    }
+
+    def _resolve_method(self, method: Optional[str]) -> str:
+        """Validate an index method (default: settings.vector_index_method)."""
+        method = method or settings.vector_index_method
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown vector index method '{method}' (expected one of {', '.join(self.METHODS)})")
+        return method
+
+    def resolve_storage(self, storage: Optional[str] = None) -> str:
+        """Validate a vector storage (default: settings.vector_storage)."""
+        storage = storage or settings.vector_storage
+        if storage not in self.STORAGES:
+            raise ValueError(f"Unknown vector storage '{storage}' (expected one of {', '.join(self.STORAGES)})")
+        return storage
+
+    def filtered_types(self) -> List[str]:
+        """document_type values with a partial index."""
+        types = settings.vector_filtered_index_types_list
+        for document_type in types:
+            if not self.TYPE_PATTERN.match(document_type):
+                raise ValueError(f"Invalid document_type for a partial vector index: '{document_type}'")
+        return types
+
+    def fts_config(self) -> str:
+        """Text search configuration of the full-text index (validated: written into SQL)."""
+        config = settings.rag_fts_config
+        if not self.TYPE_PATTERN.match(config):
+            raise ValueError(f"Invalid text search configuration: '{config}'")
+        return config
+
+    def tsvector_sql(self, column: str = "chunk_text") -> str:
+        """Indexed tsvector expression of chunk texts."""
+        return f"to_tsvector('{self.fts_config()}', {column})"
+
+    def fts_definition(self) -> Dict[str, Any]:
+        """Full-text index definition (same shape as index_definitions() entries)."""
+        return {
+            "name": self.FTS_INDEX,
+            "document_type": None,
+            "columns_sql": f"USING gin ({self.tsvector_sql()})",
+            "where_sql": "",
+        }
+
+    def ivfflat_lists(self, row_count: int) -> int:
+        """IVFFlat list count: rows / 1000 up to 1M rows, sqrt(rows) above (pgvector guidance)."""
+        if settings.vector_ivfflat_lists:
+            return settings.vector_ivfflat_lists
+        if row_count <= 1_000_000:
+            return max(10, row_count // 1000)
+        return int(math.sqrt(row_count))
+
+    def index_definitions(
+        self,
+        method: Optional[str] = None,
+        row_counts: Optional[Dict[str, int]] = None,
+        storage: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Indexes the table should have.
+
+        Args:
+            method: "hnsw" or "ivfflat" (default: settings.vector_index_method)
+            row_counts: Rows per document_type and in total (key None), to size IVFFlat lists
+            storage: "full", "halfvec" or "binary" (default: settings.vector_storage)
+
+        Returns:
+            [{"name": str, "document_type": str or None, "columns_sql": str, "where_sql": str}]
+        """
+        method = self._resolve_method(method)
+        storage = self.resolve_storage(storage)
+        row_counts = row_counts or {}
+
+        expression, ops, _ = self.STORAGE_SQL[storage]
+        indexed = "embedding" if storage == "full" else f"({expression.format(vector='embedding')})"
+        suffix = "" if storage == "full" else f"_{storage}"
+
+        definitions = []
+        for document_type in [None] + self.filtered_types():
+            if method == "hnsw":
+                options = f"m = {settings.vector_hnsw_m}, ef_construction = {settings.vector_hnsw_ef_construction}"
+            else:
+                options = f"lists = {self.ivfflat_lists(row_counts.get(document_type, 0))}"
+
+            definitions.append({
+                "name": f"{self.INDEX_PREFIX}_{method}{suffix}" + (f"_{document_type}" if document_type else ""),
+                "document_type": document_type,
+                "columns_sql": f"USING {method} ({indexed} {ops}) WITH ({options})",
+                "where_sql": f" WHERE document_type = '{document_type}'" if document_type else "",
+            })
+        return definitions
+
+    def create_index_sql(self, definition: Dict[str, Any], name: Optional[str] = None, concurrently: bool = True) -> str:
+        """CREATE INDEX statement of a definition (optionally under another name)."""
+        return (
+            f"CREATE INDEX {'CONCURRENTLY ' if concurrently else ''}{name or definition['name']} "
+            f"ON {self.TABLE} {definition['columns_sql']}{definition['where_sql']}"
+        )
+
+    def type_filter(self, document_types: Optional[List[str]], column: str = "document_type") -> Tuple[str, Dict[str, Any]]:
+        """
+        SQL condition (and bind parameters) restricting a search to document types.
+
+        A single type with a partial index is written as a literal so the
+        planner can use that index (a bind parameter only matches it with
+        custom plans); anything else is a bound array.
+
+        Returns:
+            (condition, params); condition is "TRUE" without document_types
+        """
+        if not document_types:
+            return "TRUE", {}
+        if len(document_types) == 1 and document_types[0] in self.filtered_types():
+            return f"{column} = '{document_types[0]}'", {}
+        return f"{column} = ANY(:document_types)", {"document_types": list(document_types)}
+
+    def distance_sql(self, storage: Optional[str] = None, query: str = "(SELECT embedding FROM query_vector)") -> str:
+        """Distance of the embedding column to a query vector, on the expression the ANN indexes of a storage hold."""
+        expression, _, operator = self.STORAGE_SQL[self.resolve_storage(storage)]
+        return f"{expression.format(vector='embedding')} {operator} {expression.format(vector=query)}"
+
+    def nearest_sql(
+        self,
+        where_clause: str = "TRUE",
+        storage: Optional[str] = None,
+        query: str = "(SELECT embedding FROM query_vector)"
+    ) -> str:
+        """
+        Nearest chunks (id, exact cosine distance), closest first, LIMIT :candidates.
+
+        "full" storage searches the vector indexes directly. Quantized storages
+        take :shortlist chunks (see shortlist_size()) from their index, then
+        re-score them on the full-precision embeddings.
+
+        Args:
+            where_clause: Filters (from type_filter(), ...)
+            storage: "full", "halfvec" or "binary" (default: settings.vector_storage)
+            query: SQL of the query vector (default: the query_vector CTE)
+        """
+        storage = self.resolve_storage(storage)
+        if storage == "full":
+            return f"""
+                SELECT id, embedding <=> {query} AS distance
+                FROM {self.TABLE}
+                WHERE {where_clause}
+                ORDER BY distance
+                LIMIT :candidates
+            """
+
+        return f"""
+            SELECT rescored.id, rescored.embedding <=> {query} AS distance
+            FROM (
+                SELECT id
+                FROM {self.TABLE}
+                WHERE {where_clause}
+                ORDER BY {self.distance_sql(storage, query)}
+                LIMIT :shortlist
+            ) shortlist
+            JOIN {self.TABLE} rescored ON rescored.id = shortlist.id
+            ORDER BY distance
+            LIMIT :candidates
+        """
+
+    def shortlist_size(self, candidates: int, storage: Optional[str] = None) -> Optional[int]:
+        """First-stage candidates of a quantized search (None for "full" storage)."""
+        if self.resolve_storage(storage) == "full":
+            return None
+        return max(settings.vector_rescore_candidates, candidates)
+
+    def _search_params(self, top_k: int, ef_search: Optional[int], probes: Optional[int]) -> Dict[str, str]:
+        """Transaction-local pgvector settings for one search."""
+        # HNSW returns at most ef_search rows: never less than the requested results
+        ef_search = max(ef_search or settings.vector_hnsw_ef_search, top_k)
+        params = {
+            "hnsw.ef_search": str(ef_search),
+            "ivfflat.probes": str(probes or settings.vector_ivfflat_probes),
+        }
+        if settings.vector_iterative_scan:
+            # pgvector >= 0.8: keep scanning the index until enough rows pass the filters
+            params["hnsw.iterative_scan"] = settings.vector_iterative_scan
+            params["ivfflat.iterative_scan"] = settings.vector_iterative_scan
+        return params
+
+    def _set_config_sql(self, params: Dict[str, str]) -> Tuple[Any, Dict[str, str]]:
+        """One SELECT setting every parameter for the current transaction."""
+        calls = ", ".join(f"set_config('{name}', :p{i}, true)" for i, name in enumerate(params))
+        return text(f"SELECT {calls}"), {f"p{i}": value for i, value in enumerate(params.values())}
+
+    # ========== SYNCHRONOUS METHODS FOR CELERY TASKS ==========
+
+    def apply_search_params_sync(
+        self,
+        db: Session,
+        top_k: int,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None
+    ) -> None:
+        """
+        Set the search breadth of the next vector queries of the current transaction.
+
+        Args:
+            db: Sync database session
+            top_k: Results the query asks for
+            ef_search: HNSW candidate list size (default: settings.vector_hnsw_ef_search)
+            probes: IVFFlat lists visited (default: settings.vector_ivfflat_probes)
+        """
+        sql, params = self._set_config_sql(self._search_params(top_k, ef_search, probes))
+        db.execute(sql, params)
+
+    def row_counts_sync(self, db: Session) -> Dict[Optional[str], int]:
+        """Embeddings per document_type, plus the total under key None."""
+        rows = db.execute(text(f"SELECT document_type, count(*) FROM {self.TABLE} GROUP BY document_type")).fetchall()
+        counts = {document_type: count for document_type, count in rows}
+        counts[None] = sum(counts.values())
+        return counts
+
+    def status_sync(self, db: Session) -> List[Dict[str, Any]]:
+        """
+        ANN and full-text indexes of the table with their size.
+
+        Returns:
+            [{"name": str, "size_mb": float, "valid": bool, "definition": str}]
+        """
+        rows = db.execute(text(f"""
+            SELECT
+                c.relname AS name,
+                pg_relation_size(c.oid) / 1048576.0 AS size_mb,
+                i.indisvalid AS valid,
+                pg_get_indexdef(c.oid) AS definition
+            FROM pg_index i
+            JOIN pg_class c ON c.oid = i.indexrelid
+            JOIN pg_am am ON am.oid = c.relam
+            WHERE i.indrelid = '{self.TABLE}'::regclass
+              AND (am.amname IN ('hnsw', 'ivfflat') OR c.relname = :fts_index)
+            ORDER BY c.relname
+        """), {"fts_index": self.FTS_INDEX}).fetchall()
+
+        return [
+            {"name": row.name, "size_mb": round(float(row.size_mb), 1), "valid": row.valid, "definition": row.definition}
+            for row in rows
+        ]
+
+    def rebuild_sync(
+        self,
+        engine: Engine,
+        method: Optional[str] = None,
+        concurrently: bool = True,
+        dry_run: bool = False,
+        storage: Optional[str] = None
+    ) -> List[str]:
+        """
+        Bring the search indexes in line with the settings, rebuilding the existing ANN ones.
+
+        Each index is built under a temporary name then swapped in, so
+        searches keep an index throughout; indexes of the other method or
+        storage, or of types no longer configured, are dropped. IVFFlat lists are sized on
+        the current row counts. The full-text index is only (re)built when
+        missing or on another text search configuration.
+
+        Args:
+            engine: Sync engine (statements run in autocommit: CONCURRENTLY needs it)
+            method: "hnsw" or "ivfflat" (default: settings.vector_index_method)
+            concurrently: Build without blocking writes
+            dry_run: Only return the statements
+            storage: "full", "halfvec" or "binary" (default: settings.vector_storage)
+
+        Returns:
+            Statements executed (or to execute, with dry_run)
+        """
+        concurrent = "CONCURRENTLY " if concurrently else ""
+
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            indexes = {index["name"]: index for index in self.status_sync(conn)}
+            existing = set(indexes)
+            definitions = self.index_definitions(method, self.row_counts_sync(conn), storage)
+
+            fts = indexes.get(self.FTS_INDEX)
+            if not fts or f"'{self.fts_config()}'::regconfig" not in fts["definition"]:
+                definitions.append(self.fts_definition())
+
+            statements = [f"SET maintenance_work_mem = '{settings.vector_index_build_memory}'"]
+            for definition in definitions:
+                name = definition["name"]
+                if name in existing:
+                    statements += [
+                        f"DROP INDEX {concurrent}IF EXISTS {name}_rebuild",
+                        self.create_index_sql(definition, name=f"{name}_rebuild", concurrently=concurrently),
+                        f"DROP INDEX {concurrent}{name}",
+                        f"ALTER INDEX {name}_rebuild RENAME TO {name}",
+                    ]
+                else:
+                    statements.append(self.create_index_sql(definition, concurrently=concurrently))
+
+            wanted = {definition["name"] for definition in definitions} | {self.FTS_INDEX}
+            statements += [f"DROP INDEX {concurrent}{name}" for name in sorted(existing - wanted)]
+
+            if not dry_run:
+                for statement in statements:
+                    print(f"  🔧 {statement}")
+                    conn.execute(text(statement))
+
+        return statements
+
+    # ========== ASYNC METHODS FOR API ENDPOINTS ==========
+
+    async def apply_search_params(
+        self,
+        db: AsyncSession,
+        top_k: int,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None
+    ) -> None:
+        """Async variant of apply_search_params_sync."""
+        sql, params = self._set_config_sql(self._search_params(top_k, ef_search, probes))
+        await db.execute(sql, params)
+
+
+# Global instance
+vector_index_service = VectorIndexService()
@@ -1,12 +1,16 @@
 """
 Celery tasks for tender processing.
 """
+import os
 from uuid import UUID
 
+from celery.exceptions import SoftTimeLimitExceeded
+
 from app.core.celery_app import celery_app
+from app.core.config import settings
 from app.services.llm_service import llm_service
 from app.services.rag_service import rag_service
-from app.services.parser_service import parser_service
+from app.services.parser_service import parser_service, ParseBudget, ParseBudgetExceeded
 from app.models.base import get_celery_session
 
 
@@ -67,18 +71,27 @@ def ingest_knowledge_base_document(document_id: str, document_type: str):
 
 
 @celery_app.task(bind=True, max_retries=3)
-def process_tender_document(self, document_id: str):
+def process_tender_document(self, document_id: str, quarantined: bool = False):
     """
     Process a single tender document (extract text, OCR if needed).
     SYNCHRONOUS version for Celery tasks.
 
+    PDF extraction runs under a per-document budget (settings.parser_budget_*):
+    over budget, the document is re-extracted text-only; if that is over
+    budget too (or the soft time limit hits), it is sent to the quarantine
+    queue with its diagnostics instead of being retried here.
+
     Args:
         document_id: TenderDocument UUID
+        quarantined: Running on the quarantine queue: no budget, failures are final
     """
     from datetime import datetime
     from sqlalchemy import select
     from app.models.tender_document import TenderDocument
     from app.services.storage_service import storage_service
+    from app.services.extraction_cache_service import extraction_cache_service
+    from app.services.spreadsheet_parser_service import spreadsheet_parser_service
+    from app.services.docx_parser_service import docx_parser_service
 
     try:
         print(f"📄 Processing document {document_id}")
@@ -93,25 +106,78 @@ def process_tender_document(self, document_id: str):
             if not document:
                 raise ValueError(f"Document {document_id} not found")
 
+            # Previous extraction (re-processing a new version of the document)
+            previous_meta = document.extraction_meta_data or {}
+            previous_fingerprints = previous_meta.get("page_fingerprints")
+
             document.extraction_status = "processing"
             db.commit()
 
-            # 2. Download file from MinIO
-            file_content = storage_service.download_file(document.file_path)
-
-            # 3. Extract text using parser_service (sync version)
-            extraction_result = parser_service.extract_from_pdf_sync(
-                file_content=file_content,
-                use_ocr=False  # Try without OCR first
+            # 2-3. Download file from MinIO and extract text using parser_service (sync version)
+            file_format = os.path.splitext(document.filename.lower())[1]
+            streamed = bool(
+                file_format == ".pdf"
+                and document.file_size
+                and document.file_size >= settings.parser_streaming_min_bytes
             )
 
-            # If no text extracted, try with OCR
-            if not extraction_result["text"].strip():
-                print(f"⚠️  No text found, trying OCR for {document.filename}")
-                extraction_result = parser_service.extract_from_pdf_sync(
-                    file_content=file_content,
-                    use_ocr=True
+            if streamed:
+                # Huge documents: stream from disk page by page, persisting sections as we go
+                extraction_result, sections_saved = _extract_document_streaming(
+                    db, document, enforce_budget=not quarantined, previous_fingerprints=previous_fingerprints
                 )
+            else:
+                file_content = storage_service.download_file(document.file_path)
+                content_hash = extraction_cache_service.hash_content(file_content)
+
+                # Same bytes + same parser version = same extraction: skip pdfplumber entirely
+                extraction_result = extraction_cache_service.get_sync(db, content_hash)
+
+                # Scanned pages are OCRed individually; their text is cached by page image hash
+                ocr_cache = extraction_cache_service.ocr_page_cache(db)
+
+                if extraction_result is not None:
+                    print(f"⚡ Extraction cache hit for {document.filename} ({content_hash[:12]})")
+                elif file_format == ".xlsx":
+                    # BPU/DQE/DPGF workbooks: native tables, no PDF conversion
+                    extraction_result = spreadsheet_parser_service.extract_from_xlsx_sync(file_content)
+                    extraction_cache_service.set_sync(db, content_hash, extraction_result)
+                elif file_format == ".docx":
+                    # Acte d'engagement / templates: sections from heading styles, no PDF conversion
+                    extraction_result = docx_parser_service.extract_from_docx_sync(file_content)
+                    extraction_cache_service.set_sync(db, content_hash, extraction_result)
+                elif previous_fingerprints:
+                    # New version: only changed pages go through section detection
+                    extraction_result = _extract_within_budget(
+                        parser_service.extract_changed_pages_sync,
+                        enforce=not quarantined,
+                        file_content=file_content,
+                        previous=_with_full_section_content(db, document.id, previous_meta),
+                        use_ocr=settings.parser_ocr_enabled,
+                        ocr_cache=ocr_cache
+                    )
+
+                    # Degraded (text-only) extractions are not what the cache key promises
+                    if "budget" not in extraction_result:
+                        extraction_cache_service.set_sync(
+                            db,
+                            content_hash,
+                            {k: v for k, v in extraction_result.items() if k != "changed_pages"}
+                        )
+                else:
+                    extraction_result = _extract_within_budget(
+                        parser_service.extract_from_pdf_sync,
+                        enforce=not quarantined,
+                        file_content=file_content,
+                        use_ocr=settings.parser_ocr_enabled,
+                        ocr_cache=ocr_cache
+                    )
+
+                    if extraction_result["text"].strip() and "budget" not in extraction_result:
+                        extraction_cache_service.set_sync(db, content_hash, extraction_result)
+
+                extraction_result["content_hash"] = content_hash
+                sections_saved = 0
 
             # 4. Update document with extracted text AND structured data
             document.extracted_text = extraction_result["text"]
@@ -120,11 +186,19 @@ def process_tender_document(self, document_id: str):
 
             # Store COMPLETE extraction results (metadata + sections + tables + structured)
             document.extraction_meta_data = {
+                "content_hash": extraction_result.get("content_hash"),
+                "page_fingerprints": extraction_result.get("page_fingerprints"),
+                "boilerplate": extraction_result.get("boilerplate"),
+                "fidelity": extraction_result.get("fidelity"),
+                "engines": extraction_result.get("engines"),
+                "tables_skipped": extraction_result.get("tables_skipped"),
+                "budget": extraction_result.get("budget"),
+                "ocr_pages": extraction_result.get("ocr_pages", []),
                 "metadata": extraction_result.get("metadata", {}),
-                "sections": extraction_result.get("sections", []),
+                "sections": _section_previews(extraction_result.get("sections", [])),
                 "tables": extraction_result.get("tables", []),
                 "structured": extraction_result.get("structured", {}),
-                "stats": {
+                "stats": extraction_result.get("stats") or {
                     "sections_count": len(extraction_result.get("sections", [])),
                     "sections_with_content": len([s for s in extraction_result.get("sections", []) if s.get("content_length", 0) > 0]),
                     "tables_count": len(extraction_result.get("tables", [])),
@@ -138,47 +212,36 @@ def process_tender_document(self, document_id: str):
             db.commit()
 
             # 5. Save structured sections to document_sections table
-            from app.models.document_section import DocumentSection
-            sections_data = extraction_result.get("sections", [])
-            sections_saved = 0
+            if not streamed:
+                sections_data = extraction_result.get("sections", [])
+
+                # None = full replace; otherwise only rows of changed pages are touched
+                changed_pages = extraction_result.get("changed_pages")
+                if changed_pages is None and previous_fingerprints and extraction_result.get("page_fingerprints"):
+                    changed_pages = parser_service.diff_page_fingerprints(
+                        previous_fingerprints,
+                        extraction_result["page_fingerprints"]
+                    )
 
-            if sections_data:
-                print(f"💾 Saving {len(sections_data)} sections to database...")
+                if changed_pages is not None:
+                    changed = set(changed_pages)
+                    sections_data = [s for s in sections_data if s.get("page") in changed]
+                    print(f"💾 Replacing sections of {len(changed)} changed pages ({len(sections_data)} sections)...")
+                else:
+                    print(f"💾 Saving {len(sections_data)} sections to database...")
 
                 # PASS 1: Insert sections with parent_number
-                for section_data in sections_data:
-                    section = DocumentSection(
-                        document_id=document.id,
-                        section_type=section_data.get("type", "UNKNOWN"),
-                        section_number=section_data.get("number"),
-                        parent_number=section_data.get("parent_number"),  # NEW: for hierarchy
-                        title=section_data.get("title", ""),
-                        content=section_data.get("content"),
-                        content_length=section_data.get("content_length", 0),
-                        content_truncated=section_data.get("content_truncated", False),
-                        page=section_data.get("page", 1),
-                        line=section_data.get("line"),
-                        level=section_data.get("level", 1),
-                        is_toc=section_data.get("is_toc", False),
-                        is_key_section=section_data.get("is_key_section", False),
-                    )
-                    db.add(section)
-                    sections_saved += 1
-
+                sections_saved = _replace_sections(
+                    db,
+                    document.id,
+                    sections_data,
+                    changed_pages=changed_pages,
+                    page_count=extraction_result["page_count"]
+                )
                 db.commit()
 
                 # PASS 2: Resolve parent_id via SQL JOIN on parent_number
-                from sqlalchemy import text
-                db.execute(text("""
-                    UPDATE document_sections AS child
-                    SET parent_id = parent.id
-                    FROM document_sections AS parent
-                    WHERE child.document_id = :doc_id
-                      AND child.parent_number IS NOT NULL
-                      AND child.parent_number = parent.section_number
-                      AND parent.document_id = :doc_id
-                """), {"doc_id": str(document.id)})
-
+                _resolve_section_parents(db, document.id)
                 db.commit()
                 print(f"   ✓ Saved {sections_saved} sections to database (with hierarchy)")
 
@@ -191,33 +254,351 @@ def process_tender_document(self, document_id: str):
             return {
                 "status": "success",
                 "document_id": document_id,
-                "text_length": len(extraction_result["text"]),
+                "text_length": len(document.extracted_text or ""),
                 "page_count": extraction_result["page_count"]
             }
         finally:
             db.close()
 
+    except (ParseBudgetExceeded, SoftTimeLimitExceeded) as exc:
+        diagnostics = getattr(exc, "diagnostics", None) or {
+            "resource": "soft_time_limit",
+            "limit": celery_app.conf.task_soft_time_limit
+        }
+
+        if quarantined:
+            print(f"❌ Quarantined document {document_id} failed again: {exc}")
+            _mark_document_failed(document_id, str(exc))
+            return {"status": "failed", "document_id": document_id, "budget": diagnostics}
+
+        _quarantine_document(document_id, str(exc), diagnostics)
+        return {"status": "quarantined", "document_id": document_id, "budget": diagnostics}
+
     except Exception as exc:
         print(f"❌ Error processing document {document_id}: {exc}")
 
-        # Update status to failed
+        _mark_document_failed(document_id, str(exc))
+
+        raise self.retry(exc=exc, countdown=2 ** self.request.retries)
+
+
+def _extract_within_budget(extract, enforce: bool = True, **options) -> dict:
+    """
+    Run a PDF extraction under the per-document budget (settings.parser_budget_*).
+
+    Over budget, the document is extracted again text-only (fidelity "fast",
+    no OCR) with a fresh budget; the result then carries the diagnostics
+    under "budget".
+
+    Args:
+        extract: ParserService extraction method accepting use_ocr, fidelity and budget
+        enforce: False runs extract once without budget (quarantine queue)
+        options: Arguments of extract
+
+    Returns:
+        Extraction result
+
+    Raises:
+        ParseBudgetExceeded: the text-only extraction went over budget too
+            (diagnostics of both attempts)
+    """
+    if not enforce:
+        return extract(**options)
+
+    try:
+        return extract(**options, budget=ParseBudget.from_settings())
+    except ParseBudgetExceeded as exc:
+        first_attempt = {"fidelity": options.get("fidelity") or settings.parser_fidelity, **exc.diagnostics}
+        print(f"⏱️  {exc}: retrying text-only")
+
+    try:
+        result = extract(**{**options, "fidelity": "fast", "use_ocr": False}, budget=ParseBudget.from_settings())
+    except ParseBudgetExceeded as exc:
+        exc.diagnostics = {"degraded": True, "attempts": [first_attempt, {"fidelity": "fast", **exc.diagnostics}]}
+        raise
+
+    result["budget"] = {"degraded": True, "attempts": [first_attempt]}
+    return result
+
+
+def _quarantine_document(document_id: str, error: str, diagnostics: dict) -> None:
+    """
+    Park a document that went over its extraction budget and hand it to the quarantine queue.
+
+    The document is marked "quarantined" with the diagnostics in
+    extraction_meta_data["budget"], then re-processed without budget by the
+    workers of settings.celery_quarantine_queue, away from the main workers.
+    """
+    from sqlalchemy import select
+    from app.models.tender_document import TenderDocument
+
+    print(f"🚧 Document {document_id} over budget ({error}): sent to the {settings.celery_quarantine_queue} queue")
+
+    db = get_celery_session()
+    try:
+        document = db.execute(
+            select(TenderDocument).where(TenderDocument.id == document_id)
+        ).scalar_one_or_none()
+
+        if document:
+            document.extraction_status = "quarantined"
+            document.extraction_error = error
+            document.extraction_meta_data = {**(document.extraction_meta_data or {}), "budget": diagnostics}
+            db.commit()
+    finally:
+        db.close()
+
+    process_tender_document.apply_async(
+        args=[document_id],
+        kwargs={"quarantined": True},
+        queue=settings.celery_quarantine_queue
+    )
+
+
+def _mark_document_failed(document_id: str, error: str) -> None:
+    """Set extraction_status to "failed" with the error (best effort)."""
+    from sqlalchemy import select
+    from app.models.tender_document import TenderDocument
+
+    try:
+        db = get_celery_session()
         try:
-            db = get_celery_session()
-            try:
-                stmt = select(TenderDocument).where(TenderDocument.id == document_id)
-                result = db.execute(stmt)
-                document = result.scalar_one_or_none()
+            stmt = select(TenderDocument).where(TenderDocument.id == document_id)
+            result = db.execute(stmt)
+            document = result.scalar_one_or_none()
 
-                if document:
-                    document.extraction_status = "failed"
-                    document.extraction_error = str(exc)
-                    db.commit()
-            finally:
-                db.close()
-        except:
-            pass
+            if document:
+                document.extraction_status = "failed"
+                document.extraction_error = error
+                db.commit()
+        finally:
+            db.close()
+    except:
+        pass
 
-        raise self.retry(exc=exc, countdown=2 ** self.request.retries)
+
+def _build_section_rows(document_id, sections_data: list) -> list:
+    """
+    Build DocumentSection rows from extracted sections (parent_id resolved later).
+
+    Returns:
+        List of DocumentSection objects (not added to any session)
+    """
+    from app.models.document_section import DocumentSection
+
+    rows = []
+    for section_data in sections_data:
+        section = DocumentSection(
+            document_id=document_id,
+            section_type=section_data.get("type", "UNKNOWN"),
+            section_number=section_data.get("number"),
+            parent_number=section_data.get("parent_number"),  # NEW: for hierarchy
+            title=section_data.get("title", ""),
+            page=section_data.get("page", 1),
+            line=section_data.get("line"),
+            level=section_data.get("level", 1),
+            is_toc=section_data.get("is_toc", False),
+            is_key_section=section_data.get("is_key_section", False),
+        )
+        section.set_full_content(section_data.get("content"))
+        rows.append(section)
+
+    return rows
+
+
+def _section_previews(sections_data: list) -> list:
+    """
+    Sections for extraction_meta_data: metadata and content preview only.
+
+    Full content lives compressed in DocumentSection (see _with_full_section_content).
+    """
+    from app.models.document_section import DocumentSection
+
+    preview_length = DocumentSection.CONTENT_PREVIEW_LENGTH
+    return [
+        {**section, "content": section["content"][:preview_length]}
+        if len(section.get("content") or "") > preview_length else section
+        for section in sections_data
+    ]
+
+
+def _with_full_section_content(db, document_id, extraction_meta_data: dict) -> dict:
+    """
+    Previous extraction with the full content of its sections, for incremental reuse.
+
+    Sections in extraction_meta_data only carry a preview: truncated ones get
+    their content back from DocumentSection.full_content, matched on page, line and number.
+    """
+    from sqlalchemy.orm import undefer
+    from app.models.document_section import DocumentSection
+
+    sections = extraction_meta_data.get("sections") or []
+    if not any(section.get("content_length", 0) > len(section.get("content") or "") for section in sections):
+        return extraction_meta_data
+
+    rows = (
+        db.query(DocumentSection)
+        .options(undefer(DocumentSection.content_compressed))
+        .filter(DocumentSection.document_id == document_id, DocumentSection.content_truncated.is_(True))
+        .all()
+    )
+    full_content = {(row.page, row.line, row.section_number): row.full_content for row in rows}
+
+    return {
+        **extraction_meta_data,
+        "sections": [
+            {**section, "content": full_content.get(
+                (section.get("page"), section.get("line"), section.get("number")), section.get("content")
+            )}
+            for section in sections
+        ]
+    }
+
+
+def _replace_sections(
+    db,
+    document_id,
+    sections_data: list,
+    changed_pages: list | None = None,
+    page_count: int | None = None
+) -> int:
+    """
+    Replace DocumentSection rows of a document.
+
+    Args:
+        sections_data: New sections (only those of changed pages when changed_pages is given)
+        changed_pages: Pages whose rows are replaced; None replaces every row
+        page_count: Rows beyond the last page (shorter new version) are removed too
+
+    Returns:
+        Number of sections inserted
+    """
+    from sqlalchemy import or_
+    from app.models.document_section import DocumentSection
+
+    query = db.query(DocumentSection).filter(DocumentSection.document_id == document_id)
+    if changed_pages is not None:
+        page_filter = DocumentSection.page.in_(changed_pages)
+        if page_count is not None:
+            page_filter = or_(page_filter, DocumentSection.page > page_count)
+        query = query.filter(page_filter)
+    query.delete(synchronize_session=False)
+
+    db.add_all(_build_section_rows(document_id, sections_data))
+    return len(sections_data)
+
+
+def _resolve_section_parents(db, document_id) -> None:
+    """Resolve DocumentSection.parent_id via SQL JOIN on parent_number."""
+    from sqlalchemy import text
+
+    db.execute(text("""
+        UPDATE document_sections AS child
+        SET parent_id = parent.id
+        FROM document_sections AS parent
+        WHERE child.document_id = :doc_id
+          AND child.parent_number IS NOT NULL
+          AND child.parent_number = parent.section_number
+          AND parent.document_id = :doc_id
+    """), {"doc_id": str(document_id)})
+
+
+def _extract_document_streaming(
+    db,
+    document,
+    enforce_budget: bool = True,
+    previous_fingerprints: list | None = None
+) -> tuple[dict, int]:
+    """
+    Extract a huge PDF page by page with flat memory usage.
+
+    The file is downloaded to a temporary file (never held as bytes), sections
+    are flushed to the database every page and the text is spooled to disk
+    until it is assigned to the document.
+
+    For a new version (previous_fingerprints given), only the rows of pages
+    whose fingerprint changed are replaced, like the non-streamed path.
+
+    Args:
+        enforce_budget: Extract under the per-document budget (see _extract_within_budget)
+        previous_fingerprints: page_fingerprints of the previous extraction
+
+    Returns:
+        (extraction_result with "text", number of sections saved)
+    """
+    import os
+    import tempfile
+    from app.services.storage_service import storage_service
+    from app.services.extraction_cache_service import extraction_cache_service
+
+    print(f"🌊 Streaming extraction for {document.filename} ({document.file_size} bytes)")
+
+    fd, pdf_path = tempfile.mkstemp(suffix=".pdf")
+    os.close(fd)
+    sections_saved = 0
+    persisted_pages = set()
+
+    def persist_sections(sections: list) -> None:
+        nonlocal sections_saved
+        if previous_fingerprints:
+            # Changed page of a new version: its previous rows go first
+            page = sections[0]["page"]
+            _replace_sections(db, document.id, [], changed_pages=[page])
+            persisted_pages.add(page)
+        # Bulk insert: rows are written immediately and not kept in the session
+        db.bulk_save_objects(_build_section_rows(document.id, sections))
+        sections_saved += len(sections)
+
+    try:
+        storage_service.download_to_file(document.file_path, pdf_path)
+
+        with tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024, mode="w+", encoding="utf-8") as text_buffer:
+            def extract(**options) -> dict:
+                nonlocal sections_saved
+                # Each attempt (text-only retry after a budget overrun) starts over
+                if not previous_fingerprints:
+                    _replace_sections(db, document.id, [])
+                sections_saved = 0
+                persisted_pages.clear()
+                text_buffer.seek(0)
+                text_buffer.truncate()
+
+                return parser_service.extract_from_pdf_streaming_sync(
+                    source=pdf_path,
+                    on_sections=persist_sections,
+                    text_sink=text_buffer,
+                    ocr_cache=extraction_cache_service.ocr_page_cache(db),
+                    previous_fingerprints=previous_fingerprints or None,
+                    **options
+                )
+
+            extraction_result = _extract_within_budget(
+                extract,
+                enforce=enforce_budget,
+                use_ocr=settings.parser_ocr_enabled
+            )
+            text_buffer.seek(0)
+            extraction_result["text"] = text_buffer.read()
+    finally:
+        os.remove(pdf_path)
+
+    changed_pages = extraction_result.get("changed_pages")
+    if changed_pages is not None:
+        # Changed pages without sections any more, and pages past the end of a shorter version
+        _replace_sections(
+            db,
+            document.id,
+            [],
+            changed_pages=[page for page in changed_pages if page not in persisted_pages],
+            page_count=extraction_result["page_count"]
+        )
+        print(f"   ✓ {len(changed_pages)} changed pages")
+
+    if sections_saved or changed_pages:
+        _resolve_section_parents(db, document.id)
+        print(f"   ✓ Streamed {sections_saved} sections to database (with hierarchy)")
+
+    return extraction_result, sections_saved
 
 
 @celery_app.task(bind=True, max_retries=3)
@@ -298,16 +679,20 @@ def process_tender_documents(self, tender_id: str):
             # STEP 2: Create embeddings
             print(f"🔍 Step 2/6: Creating embeddings for {len(documents)} documents")
 
+            from sqlalchemy.orm import undefer
             from app.models.document_section import DocumentSection
 
             total_chunks = 0
+            all_sections = []  # Full sections of every document, for the structured analysis
 
             for doc in documents:
-                # Load sections from DB
-                sections_query = db.query(DocumentSection).filter_by(
+                # Load sections from DB (with their full, compressed content)
+                sections_query = db.query(DocumentSection).options(
+                    undefer(DocumentSection.content_compressed)
+                ).filter_by(
                     document_id=doc.id,
                     is_toc=False  # Skip TOC
-                ).all()
+                ).order_by(DocumentSection.page, DocumentSection.line).all()
 
                 if not sections_query:
                     print(f"  ⚠️  No sections found for {doc.filename}, skipping embeddings")
@@ -318,7 +703,7 @@ def process_tender_documents(self, tender_id: str):
                     {
                         "section_number": s.section_number,
                         "title": s.title,
-                        "content": s.content or "",
+                        "content": s.full_content or "",
                         "page": s.page,
                         "is_key_section": s.is_key_section,
                         "parent_number": s.parent_number,
@@ -327,6 +712,7 @@ def process_tender_documents(self, tender_id: str):
                     }
                     for s in sections_query
                 ]
+                all_sections.extend(sections_data)
 
                 # Semantic chunking
                 chunks = rag_service.chunk_sections_semantic(
@@ -335,9 +721,9 @@ def process_tender_documents(self, tender_id: str):
                     min_tokens=100
                 )
 
-                # Ingest with embeddings
+                # Ingest with embeddings (only chunks whose text changed since last run)
                 try:
-                    chunks_created = rag_service.ingest_document_sync(
+                    sync_result = rag_service.sync_document_chunks_sync(
                         db=db,
                         document_id=doc.id,
                         chunks=chunks,
@@ -348,8 +734,11 @@ def process_tender_documents(self, tender_id: str):
                             "document_type": doc.document_type
                         }
                     )
-                    total_chunks += chunks_created
-                    print(f"  ✓ {doc.filename}: {len(sections_data)} sections → {chunks_created} chunks")
+                    total_chunks += sync_result["created"]
+                    print(
+                        f"  ✓ {doc.filename}: {len(sections_data)} sections → {len(chunks)} chunks "
+                        f"({sync_result['created']} embedded, {sync_result['kept']} kept, {sync_result['deleted']} deleted)"
+                    )
 
                 except Exception as e:
                     print(f"  ❌ Failed to create embeddings for {doc.filename}: {e}")
@@ -359,7 +748,17 @@ def process_tender_documents(self, tender_id: str):
 
             # STEP 3: AI Analysis
             print(f"🤖 Step 3/6: Running AI analysis")
-            analysis_result = llm_service.analyze_tender_sync(full_content)
+            if all_sections:
+                # Exact sections (key sections in full) instead of the truncated raw text
+                analysis_result = llm_service.analyze_tender_structured_sync(
+                    all_sections,
+                    metadata={"documents": [
+                        {"filename": doc.filename, "document_type": doc.document_type, "page_count": doc.page_count}
+                        for doc in documents
+                    ]}
+                )
+            else:
+                analysis_result = llm_service.analyze_tender_sync(full_content)
 
             # Save analysis results
             analysis.summary = analysis_result.get("summary", "")
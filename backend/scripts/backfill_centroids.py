@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Recompute every per-document and per-tender centroid embedding.
+
+Centroids are maintained on ingestion; run this once after deploying the
+embedding_centroids table (documents ingested before it have none), or
+after bulk changes made outside RAGService.
+
+Usage:
+    python scripts/backfill_centroids.py
+"""
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.services.centroid_service import centroid_service
+
+
+def main():
+    engine = create_engine(settings.database_url_sync)
+    Session = sessionmaker(bind=engine)
+    db = Session()
+
+    try:
+        print("=" * 80)
+        print("🎯 CENTROID BACKFILL")
+        print("=" * 80)
+
+        start = time.perf_counter()
+        result = centroid_service.refresh_all_sync(db)
+
+        print(f"✅ {result['documents']} document centroids, {result['tenders']} tender centroids "
+              f"in {time.perf_counter() - start:.1f}s")
+
+    finally:
+        db.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Measure event-loop lag while PDFs are parsed from async code.
+
+Simulates concurrent uploads parsed API-side, with a ticker coroutine that
+wakes up every --interval ms and records how late it was. Two modes:
+
+    inline    extract_from_pdf_sync called from the coroutine (what the former
+              async extract_from_pdf did): the loop is frozen while parsing
+    executor  await ParserService.extract_from_pdf (process pool sized by
+              settings.parser_async_workers)
+
+Usage:
+    python scripts/benchmark_event_loop_lag.py
+    python scripts/benchmark_event_loop_lag.py --pdf ../Examples/VSGP-AO/CCTP.pdf --concurrency 8
+"""
+import sys
+import time
+import asyncio
+import argparse
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.config import settings
+from app.services.parser_service import parser_service
+
+
+async def monitor_lag(stop: asyncio.Event, interval: float, samples: list[float]) -> None:
+    """Record, every interval seconds, how late the loop woke the ticker up."""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        start = loop.time()
+        await asyncio.sleep(interval)
+        samples.append(max(loop.time() - start - interval, 0.0))
+
+
+async def parse_inline(file_content: bytes) -> dict:
+    """Blocking parse on the event loop (reference)."""
+    return parser_service.extract_from_pdf_sync(file_content, parallel=False)
+
+
+async def run(mode: str, file_content: bytes, concurrency: int, interval: float) -> dict:
+    """Parse concurrency copies of the document while measuring loop lag."""
+    parse = parse_inline if mode == "inline" else parser_service.extract_from_pdf
+
+    samples: list[float] = []
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(monitor_lag(stop, interval, samples))
+
+    # Let the ticker take a few undisturbed samples first
+    await asyncio.sleep(interval * 5)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(parse(file_content) for _ in range(concurrency)))
+    seconds = time.perf_counter() - start
+
+    stop.set()
+    await monitor
+
+    samples.sort()
+    return {
+        "seconds": seconds,
+        "pages": sum(result["page_count"] for result in results),
+        "lag_max_ms": samples[-1] * 1000,
+        "lag_p99_ms": samples[min(int(len(samples) * 0.99), len(samples) - 1)] * 1000,
+        "lag_p50_ms": samples[len(samples) // 2] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure event-loop lag during async PDF extraction")
+    parser.add_argument(
+        "--pdf",
+        type=Path,
+        default=Path(__file__).parent.parent.parent / "Examples" / "VSGP-AO" / "RC.pdf",
+        help="PDF parsed by every simulated upload (default: Examples/VSGP-AO/RC.pdf)"
+    )
+    parser.add_argument("--concurrency", type=int, default=4, help="Concurrent uploads (default: 4)")
+    parser.add_argument("--interval", type=float, default=10, help="Ticker interval in ms (default: 10)")
+    parser.add_argument(
+        "--mode",
+        choices=["inline", "executor", "both"],
+        default="both",
+        help="Extraction mode to measure (default: both)"
+    )
+
+    args = parser.parse_args()
+
+    if not args.pdf.exists():
+        print(f"❌ PDF not found: {args.pdf}")
+        sys.exit(1)
+
+    file_content = args.pdf.read_bytes()
+    modes = ["inline", "executor"] if args.mode == "both" else [args.mode]
+
+    print("=" * 80)
+    print(f"⏱️  EVENT-LOOP LAG ({args.pdf.name} x {args.concurrency}, {settings.parser_async_workers or 'cpu_count'} async workers)")
+    print("=" * 80)
+    print(f"{'Mode':<10} {'Time (s)':>9} {'Pages/s':>8} {'Lag p50 (ms)':>13} {'Lag p99 (ms)':>13} {'Lag max (ms)':>13}")
+    print("-" * 80)
+
+    try:
+        for mode in modes:
+            if mode == "executor":
+                # Warm the pool up: worker start-up is not what is being measured
+                asyncio.run(parser_service.extract_from_pdf(file_content))
+
+            result = asyncio.run(run(mode, file_content, args.concurrency, args.interval / 1000))
+            print(
+                f"{mode:<10} {result['seconds']:>9.2f} {result['pages'] / result['seconds']:>8.1f} "
+                f"{result['lag_p50_ms']:>13.1f} {result['lag_p99_ms']:>13.1f} {result['lag_max_ms']:>13.1f}"
+            )
+    finally:
+        parser_service.shutdown_async_executor()
+
+
+if __name__ == "__main__":
+    main()
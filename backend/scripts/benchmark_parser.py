@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Benchmark ParserService throughput on the sample DCEs and synthetic large PDFs.
+
+Each document is parsed in a fresh process (so peak RSS is per document) with
+the serial pipeline of extract_from_pdf_sync, whose stages are timed by
+wrapping the methods they go through:
+
+    text        pdfplumber Page.extract_text, ParserService._pdfium_page_text
+    tables      pdfplumber Page.extract_tables
+    sections    ParserService._detect_sections
+    enrichment  ParserService._extract_section_content_from_pages + _build_section_hierarchy
+    structured  ParserService._extract_structured_info_enhanced_sync
+    other       everything else (PDF opening, metadata, fingerprints...)
+
+Results can be written as JSON and compared with a previous run: the script
+exits with status 1 when a document gets slower (pages/sec) or bigger (peak
+RSS) than the allowed regression.
+
+Usage:
+    python scripts/benchmark_parser.py
+    python scripts/benchmark_parser.py --synthetic-pages 500 2000 --output bench.json
+    python scripts/benchmark_parser.py --baseline bench.json --max-slowdown 0.15
+"""
+import sys
+import json
+import time
+import platform
+import argparse
+import resource
+import subprocess
+import tempfile
+import multiprocessing
+from datetime import datetime
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from PyPDF2 import PdfReader, PdfWriter
+
+
+STAGES = ("text", "tables", "sections", "enrichment", "structured")
+
+
+# ========== CHILD PROCESS ==========
+
+def _peak_rss_mb() -> float:
+    """Peak resident set size of the current process, in MB (ru_maxrss is in KB on Linux)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _install_stage_timers(parser_service, timings: dict) -> None:
+    """Wrap the methods of each stage so their cumulated wall time lands in timings."""
+    from pdfplumber.page import Page
+
+    def timed(stage, func):
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                timings[stage] += time.perf_counter() - start
+        return wrapper
+
+    Page.extract_text = timed("text", Page.extract_text)
+    Page.extract_tables = timed("tables", Page.extract_tables)
+
+    # Instance attributes shadow the bound methods of the singleton
+    parser_service._pdfium_page_text = timed("text", parser_service._pdfium_page_text)
+    parser_service._detect_sections = timed("sections", parser_service._detect_sections)
+    parser_service._extract_section_content_from_pages = timed(
+        "enrichment", parser_service._extract_section_content_from_pages
+    )
+    parser_service._build_section_hierarchy = timed("enrichment", parser_service._build_section_hierarchy)
+    parser_service._extract_structured_info_enhanced_sync = timed(
+        "structured", parser_service._extract_structured_info_enhanced_sync
+    )
+
+
+def run_document(path: str, repeat: int, parallel: bool, fidelity: str) -> dict:
+    """
+    Parse one PDF repeat times (in a dedicated process) and keep the fastest run.
+
+    Returns:
+        Measurements of the fastest run, plus the peak RSS over all runs
+    """
+    from app.services.parser_service import parser_service
+
+    file_content = Path(path).read_bytes()
+    baseline_rss = _peak_rss_mb()
+
+    timings = dict.fromkeys(STAGES, 0.0)
+    if not parallel:
+        _install_stage_timers(parser_service, timings)
+
+    best = None
+    for _ in range(repeat):
+        for stage in timings:
+            timings[stage] = 0.0
+
+        start = time.perf_counter()
+        result = parser_service.extract_from_pdf_sync(
+            file_content, use_ocr=False, parallel=parallel, fidelity=fidelity
+        )
+        seconds = time.perf_counter() - start
+
+        if best is None or seconds < best["seconds"]:
+            stages = {stage: round(value, 4) for stage, value in timings.items()} if not parallel else {}
+            if stages:
+                stages["other"] = round(max(seconds - sum(timings.values()), 0.0), 4)
+            best = {
+                "seconds": round(seconds, 4),
+                "pages": result["page_count"],
+                "sections": len(result["sections"]),
+                "tables": len(result["tables"]),
+                "text_length": len(result["text"]),
+                "engines": result["engines"],
+                "stages": stages,
+            }
+
+    best["pages_per_sec"] = round(best["pages"] / best["seconds"], 2) if best["seconds"] else 0.0
+    best["baseline_rss_mb"] = round(baseline_rss, 1)
+    best["peak_rss_mb"] = round(_peak_rss_mb(), 1)
+    return best
+
+
+# ========== CORPUS ==========
+
+def build_synthetic_pdf(sources: list[Path], pages: int, output_dir: Path) -> Path:
+    """Concatenate pages of the sample PDFs (cycling through them) into a pages-long PDF."""
+    readers = [PdfReader(str(path)) for path in sources]
+    source_pages = [page for reader in readers for page in reader.pages]
+
+    writer = PdfWriter()
+    for index in range(pages):
+        writer.add_page(source_pages[index % len(source_pages)])
+
+    output_path = output_dir / f"synthetic_{pages}p.pdf"
+    with open(output_path, "wb") as f:
+        writer.write(f)
+    return output_path
+
+
+def git_commit() -> str:
+    """Current commit of the repository (empty outside a git checkout)."""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).parent,
+            stderr=subprocess.DEVNULL,
+            text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+# ========== REGRESSIONS ==========
+
+def compare_with_baseline(
+    results: dict,
+    baseline: dict,
+    max_slowdown: float,
+    max_rss_growth: float
+) -> list[str]:
+    """
+    Compare documents present in both runs.
+
+    Returns:
+        Human-readable regressions (empty if none)
+    """
+    regressions = []
+    previous = {doc["name"]: doc for doc in baseline.get("documents", [])}
+
+    for doc in results["documents"]:
+        old = previous.get(doc["name"])
+        if not old:
+            continue
+
+        if old["pages_per_sec"] and doc["pages_per_sec"] < old["pages_per_sec"] * (1 - max_slowdown):
+            regressions.append(
+                f"{doc['name']}: {doc['pages_per_sec']:.1f} pages/s "
+                f"(was {old['pages_per_sec']:.1f}, -{1 - doc['pages_per_sec'] / old['pages_per_sec']:.0%})"
+            )
+
+        if old["peak_rss_mb"] and doc["peak_rss_mb"] > old["peak_rss_mb"] * (1 + max_rss_growth):
+            regressions.append(
+                f"{doc['name']}: peak RSS {doc['peak_rss_mb']:.0f} MB "
+                f"(was {old['peak_rss_mb']:.0f} MB, +{doc['peak_rss_mb'] / old['peak_rss_mb'] - 1:.0%})"
+            )
+
+    return regressions
+
+
+# ========== MAIN ==========
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ParserService throughput, stage times and memory")
+    parser.add_argument(
+        "--examples-dir",
+        type=Path,
+        default=Path(__file__).parent.parent.parent / "Examples",
+        help="Directory scanned recursively for PDFs (default: repository Examples/)"
+    )
+    parser.add_argument(
+        "--synthetic-pages",
+        type=int,
+        nargs="*",
+        default=[500],
+        help="Sizes of synthetic PDFs built from the sample pages (default: 500; none to skip)"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per document, fastest is kept (default: 3)")
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Use page-parallel extraction (end-to-end time only, no stage breakdown)"
+    )
+    parser.add_argument(
+        "--fidelity",
+        choices=["fast", "standard", "full"],
+        default="full",
+        help="Parser fidelity level (default: full, the pdfplumber-only reference)"
+    )
+    parser.add_argument("--output", type=Path, help="Write results as JSON to this file")
+    parser.add_argument("--baseline", type=Path, help="Previous JSON results to check for regressions")
+    parser.add_argument(
+        "--max-slowdown",
+        type=float,
+        default=0.10,
+        help="Allowed pages/sec drop vs baseline, as a fraction (default: 0.10)"
+    )
+    parser.add_argument(
+        "--max-rss-growth",
+        type=float,
+        default=0.20,
+        help="Allowed peak RSS growth vs baseline, as a fraction (default: 0.20)"
+    )
+
+    args = parser.parse_args()
+
+    pdf_paths = sorted(args.examples_dir.rglob("*.pdf"))
+    if not pdf_paths:
+        print(f"❌ No PDF found in {args.examples_dir}")
+        sys.exit(1)
+
+    from app.services.parser_service import PARSER_VERSION
+
+    results = {
+        "parser_version": PARSER_VERSION,
+        "git_commit": git_commit(),
+        "timestamp": datetime.utcnow().isoformat(),
+        "python": platform.python_version(),
+        "cpu_count": multiprocessing.cpu_count(),
+        "parallel": args.parallel,
+        "fidelity": args.fidelity,
+        "repeat": args.repeat,
+        "documents": [],
+    }
+
+    print("=" * 100)
+    print(f"⏱️  PARSER BENCHMARK (fidelity: {args.fidelity})")
+    print("=" * 100)
+    header = f"{'Document':<26} {'Pages':>6} {'Time (s)':>9} {'Pages/s':>8} {'Peak RSS':>9}"
+    if not args.parallel:
+        header += "".join(f" {stage[:10]:>10}" for stage in STAGES + ("other",))
+    print(header)
+    print("-" * 100)
+
+    # A fresh process per document: peak RSS is not inherited from previous documents
+    context = multiprocessing.get_context("spawn")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        documents = [(f"{path.parent.name.strip()}/{path.name}", path) for path in pdf_paths]
+        for pages in args.synthetic_pages:
+            documents.append((f"synthetic/{pages}p", build_synthetic_pdf(pdf_paths, pages, Path(tmp_dir))))
+
+        for name, path in documents:
+            with context.Pool(1) as pool:
+                measurement = pool.apply(run_document, (str(path), args.repeat, args.parallel, args.fidelity))
+
+            measurement = {"name": name, "bytes": path.stat().st_size, **measurement}
+            results["documents"].append(measurement)
+
+            line = (
+                f"{name[:26]:<26} {measurement['pages']:>6} {measurement['seconds']:>9.2f} "
+                f"{measurement['pages_per_sec']:>8.1f} {measurement['peak_rss_mb']:>6.0f} MB"
+            )
+            if measurement["stages"]:
+                line += "".join(f" {measurement['stages'][stage]:>10.3f}" for stage in STAGES + ("other",))
+            print(line)
+
+    total_pages = sum(doc["pages"] for doc in results["documents"])
+    total_seconds = sum(doc["seconds"] for doc in results["documents"])
+    results["totals"] = {
+        "pages": total_pages,
+        "seconds": round(total_seconds, 4),
+        "pages_per_sec": round(total_pages / total_seconds, 2) if total_seconds else 0.0,
+        "peak_rss_mb": max(doc["peak_rss_mb"] for doc in results["documents"]),
+    }
+
+    print("-" * 100)
+    print(
+        f"{'TOTAL':<26} {total_pages:>6} {total_seconds:>9.2f} "
+        f"{results['totals']['pages_per_sec']:>8.1f} {results['totals']['peak_rss_mb']:>6.0f} MB"
+    )
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+        print(f"\n💾 Results written to {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        regressions = compare_with_baseline(results, baseline, args.max_slowdown, args.max_rss_growth)
+
+        print(f"\n📊 Compared with {args.baseline} (parser {baseline.get('parser_version')}, commit {baseline.get('git_commit') or '?'})")
+        if baseline.get("fidelity", "full") != args.fidelity:
+            print(f"⚠️  Baseline fidelity is {baseline.get('fidelity', 'full')}, not {args.fidelity}")
+        if regressions:
+            for regression in regressions:
+                print(f"❌ {regression}")
+            sys.exit(1)
+
+        print("✅ No regression")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Benchmark section detection and key-section classification.
+
+Compares the precompiled single-pass engine of ParserService against the
+previous implementation (4 regexes per line, 2 searches per key pattern and
+section) on the sample DCEs, and checks that both produce the same sections.
+
+Usage:
+    python scripts/benchmark_section_detection.py
+    python scripts/benchmark_section_detection.py --examples-dir ../Examples --repeat 20
+"""
+import sys
+import re
+import time
+import argparse
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pdfplumber
+
+from app.services.parser_service import parser_service
+
+
+# ========== PREVIOUS IMPLEMENTATION (reference) ==========
+
+LEGACY_SECTION_PATTERNS = [
+    (r'^PARTIE\s+([IVX\d]+)\s*[–-]\s*(.+)$', 'PART', 1),
+    (r'^Article\s+(\d+)\s*[–-]\s*(.+)$', 'ARTICLE', 2),
+    (r'^(\d+(?:\.\d+)+)\s+(.+)$', 'SECTION', 3),
+    (r'^(\d+)\.\s+([A-ZÀÂÄÆÇÉÈÊËÏÎÔŒÙÛÜ].+)$', 'NUMBERED_ITEM', 4),
+]
+
+
+def legacy_detect_sections(text: str, page_num: int) -> list[dict]:
+    """Previous _detect_sections: every pattern tried on every line."""
+    sections = []
+
+    for line_num, line in enumerate(text.split('\n')):
+        line_stripped = line.strip()
+
+        if len(line_stripped) < 3:
+            continue
+
+        for pattern, section_type, level in LEGACY_SECTION_PATTERNS:
+            match = re.match(pattern, line_stripped, re.IGNORECASE | re.MULTILINE)
+            if match:
+                sections.append({
+                    "type": section_type,
+                    "number": match.group(1),
+                    "title": match.group(2).strip() if len(match.groups()) > 1 else "",
+                    "level": level,
+                    "page": page_num,
+                    "line": line_num,
+                    "content": line_stripped,
+                    "start_line": line_num
+                })
+                break
+
+    return sections
+
+
+def legacy_is_key_section(section: dict) -> tuple[bool, str]:
+    """Previous _is_key_section: two searches per pattern, in pattern order."""
+    title = section.get("title", "").lower()
+    content = section.get("content", "").lower()
+
+    for pattern, category in parser_service.KEY_SECTION_PATTERNS:
+        if re.search(pattern, title, re.IGNORECASE):
+            return True, category
+
+        if len(content) > 100 and re.search(pattern, content, re.IGNORECASE):
+            return True, category
+
+    return False, None
+
+
+# ========== BENCHMARK ==========
+
+def load_pages(examples_dir: Path) -> dict[str, list[str]]:
+    """Page texts of every sample PDF (extracted once, outside the timings)."""
+    documents = {}
+    for pdf_path in sorted(examples_dir.rglob("*.pdf")):
+        with pdfplumber.open(pdf_path) as pdf:
+            documents[f"{pdf_path.parent.name}/{pdf_path.name}"] = [
+                page.extract_text() or "" for page in pdf.pages
+            ]
+    return documents
+
+
+def enrich(pages: list[str], detect) -> list[dict]:
+    """Detect sections on every page and attach their content (not timed separately)."""
+    sections = []
+    for page_num, text in enumerate(pages, start=1):
+        sections.extend(detect(text, page_num))
+
+    pages_text = {page_num: text for page_num, text in enumerate(pages, start=1) if text}
+    return parser_service._extract_section_content_from_pages(sections, pages_text)
+
+
+def timed(func, repeat: int) -> float:
+    """Best wall time of repeat runs, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark section detection and key-section classification")
+    parser.add_argument(
+        "--examples-dir",
+        type=Path,
+        default=Path(__file__).parent.parent.parent / "Examples",
+        help="Directory scanned recursively for PDFs (default: repository Examples/)"
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=10,
+        help="Runs per measurement, best time is kept (default: 10)"
+    )
+
+    args = parser.parse_args()
+
+    documents = load_pages(args.examples_dir)
+    if not documents:
+        print(f"❌ No PDF found in {args.examples_dir}")
+        sys.exit(1)
+
+    print("=" * 80)
+    print("⏱️  SECTION DETECTION BENCHMARK")
+    print("=" * 80)
+    print(f"{'Document':<24} {'Pages':>5} {'Sections':>8} {'Detect old/new (ms)':>22} {'Classify old/new (ms)':>24}")
+    print("-" * 80)
+
+    totals = [0.0, 0.0, 0.0, 0.0]
+    mismatches = 0
+
+    for name, pages in documents.items():
+        # Same sections and categories, or the benchmark is meaningless
+        sections = enrich(pages, parser_service._detect_sections)
+        legacy_sections = enrich(pages, legacy_detect_sections)
+        if sections != legacy_sections:
+            mismatches += 1
+            print(f"❌ {name}: section detection differs from the previous implementation")
+
+        # Classification runs on the start of the content (KEY_SECTION_SCAN_CHARS)
+        scanned = [{**s, "content": s["content"][:parser_service.KEY_SECTION_SCAN_CHARS]} for s in sections]
+
+        categories = [(s["is_key_section"], s["key_category"]) for s in sections]
+        legacy_categories = [legacy_is_key_section(s) for s in scanned]
+        legacy_categories = [(is_key, category if is_key else None) for is_key, category in legacy_categories]
+        if categories != legacy_categories:
+            mismatches += 1
+            print(f"❌ {name}: key-section classification differs from the previous implementation")
+
+        timings = [
+            timed(lambda: [legacy_detect_sections(text, n) for n, text in enumerate(pages, 1)], args.repeat),
+            timed(lambda: [parser_service._detect_sections(text, n) for n, text in enumerate(pages, 1)], args.repeat),
+            timed(lambda: [legacy_is_key_section(s) for s in scanned], args.repeat),
+            timed(lambda: [parser_service._is_key_section(s) for s in scanned], args.repeat),
+        ]
+        totals = [total + timing for total, timing in zip(totals, timings)]
+
+        print(
+            f"{name[:24]:<24} {len(pages):>5} {len(sections):>8} "
+            f"{timings[0]:>10.2f} / {timings[1]:>8.2f} {timings[2]:>12.2f} / {timings[3]:>8.2f}"
+        )
+
+    print("-" * 80)
+    print(f"{'TOTAL':<24} {'':>5} {'':>8} {totals[0]:>10.2f} / {totals[1]:>8.2f} {totals[2]:>12.2f} / {totals[3]:>8.2f}")
+    print(f"\n🚀 Detection speedup: {totals[0] / totals[1]:.1f}x")
+    print(f"🚀 Classification speedup: {totals[2] / totals[3]:.1f}x")
+
+    if mismatches:
+        print(f"\n❌ {mismatches} mismatch(es) with the previous implementation")
+        sys.exit(1)
+
+    print("\n✅ Output identical to the previous implementation")
+
+
+if __name__ == "__main__":
+    main()
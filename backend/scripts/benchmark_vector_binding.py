@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark of how a query embedding is sent with a similarity search.
+
+    literal   str(embedding) formatted twice into the SQL text (former
+              retrieve_relevant_content_sync): a new statement per query
+    text      one bound parameter, float32 text literal (psycopg2 path, see
+              app.models.vector.format_vector)
+    binary    one bound parameter, pgvector binary format (asyncpg path,
+              codec registered in app.models.base)
+
+Without a database, only the client side is measured: encoding time and
+bytes sent per query. With --database, the searches also run against
+document_embeddings (psycopg2 for literal/text, asyncpg for binary, plus the
+asyncpg literal for reference) and the round-trip latency is reported.
+
+Usage:
+    python scripts/benchmark_vector_binding.py
+    python scripts/benchmark_vector_binding.py --database --queries 200
+"""
+import sys
+import time
+import random
+import asyncio
+import argparse
+import statistics
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pgvector.utils import to_db_binary
+
+from app.core.config import settings
+from app.models.vector import EMBEDDING_DIMENSIONS, format_vector
+
+
+LITERAL_SQL = """
+    SELECT id, 1 - (embedding <=> '{emb}'::vector) as similarity
+    FROM document_embeddings
+    ORDER BY embedding <=> '{emb}'::vector
+    LIMIT 5
+"""
+
+PARAM_SQL = """
+    SELECT id, embedding <=> {param} as distance
+    FROM document_embeddings
+    ORDER BY distance
+    LIMIT 5
+"""
+
+
+def random_embeddings(count: int) -> list[list[float]]:
+    """Unit-norm vectors shaped like OpenAI embeddings (float64 values in JSON)."""
+    embeddings = []
+    for _ in range(count):
+        values = [random.gauss(0, 1) for _ in range(EMBEDDING_DIMENSIONS)]
+        norm = sum(v * v for v in values) ** 0.5
+        embeddings.append([v / norm for v in values])
+    return embeddings
+
+
+# ========== CLIENT SIDE ==========
+
+ENCODERS = {
+    "literal": lambda emb: LITERAL_SQL.format(emb=str(emb)).encode(),
+    "text": lambda emb: format_vector(emb).encode(),
+    "binary": to_db_binary,
+}
+
+
+def measure_encoding(embeddings: list[list[float]]) -> dict:
+    """Per query: microseconds to build what is sent, and its size."""
+    results = {}
+    for name, encode in ENCODERS.items():
+        start = time.perf_counter()
+        payloads = [encode(emb) for emb in embeddings]
+        seconds = time.perf_counter() - start
+        results[name] = {
+            "encode_us": seconds / len(embeddings) * 1e6,
+            "bytes": statistics.mean(len(payload) for payload in payloads),
+        }
+    return results
+
+
+# ========== DATABASE ==========
+
+def _percentiles(samples: list[float]) -> dict:
+    samples = sorted(samples)
+    return {
+        "p50_ms": samples[len(samples) // 2] * 1000,
+        "p95_ms": samples[min(int(len(samples) * 0.95), len(samples) - 1)] * 1000,
+    }
+
+
+def measure_psycopg2(embeddings: list[list[float]]) -> dict:
+    """Round trips of the literal and text variants through psycopg2."""
+    import psycopg2
+
+    conn = psycopg2.connect(settings.database_url_sync.replace("postgresql+psycopg2://", "postgresql://"))
+    results = {}
+    try:
+        with conn.cursor() as cur:
+            variants = {
+                "literal": lambda emb: cur.execute(LITERAL_SQL.format(emb=str(emb))),
+                "text": lambda emb: cur.execute(PARAM_SQL.format(param="%s"), (format_vector(emb),)),
+            }
+            for name, run in variants.items():
+                samples = []
+                for emb in embeddings:
+                    start = time.perf_counter()
+                    run(emb)
+                    cur.fetchall()
+                    samples.append(time.perf_counter() - start)
+                results[name] = _percentiles(samples)
+        conn.rollback()
+    finally:
+        conn.close()
+    return results
+
+
+async def measure_asyncpg(embeddings: list[list[float]]) -> dict:
+    """Round trips of the literal and binary variants through asyncpg."""
+    import asyncpg
+    from pgvector.asyncpg import register_vector
+
+    conn = await asyncpg.connect(settings.database_url.replace("postgresql+asyncpg://", "postgresql://"))
+    results = {}
+    try:
+        await register_vector(conn)
+        variants = {
+            "literal (asyncpg)": lambda emb: conn.fetch(LITERAL_SQL.format(emb=str(emb))),
+            "binary": lambda emb: conn.fetch(PARAM_SQL.format(param="$1"), emb),
+        }
+        for name, run in variants.items():
+            samples = []
+            for emb in embeddings:
+                start = time.perf_counter()
+                await run(emb)
+                samples.append(time.perf_counter() - start)
+            results[name] = _percentiles(samples)
+    finally:
+        await conn.close()
+    return results
+
+
+# ========== MAIN ==========
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark query embedding binding (literal vs text vs binary)")
+    parser.add_argument("--queries", type=int, default=500, help="Query embeddings per variant (default: 500)")
+    parser.add_argument(
+        "--database",
+        action="store_true",
+        help="Also run the searches against DATABASE_URL / DATABASE_URL_SYNC"
+    )
+
+    args = parser.parse_args()
+
+    random.seed(42)
+    embeddings = random_embeddings(args.queries)
+
+    print("=" * 80)
+    print(f"⏱️  VECTOR BINDING ({args.queries} queries, {EMBEDDING_DIMENSIONS} dimensions)")
+    print("=" * 80)
+    print(f"{'Variant':<20} {'Encode (µs)':>12} {'Bytes sent':>12}")
+    print("-" * 80)
+
+    encoding = measure_encoding(embeddings)
+    for name, result in encoding.items():
+        print(f"{name:<20} {result['encode_us']:>12.1f} {result['bytes']:>12.0f}")
+
+    if not args.database:
+        return
+
+    # Warm the caches up: the first searches read the index from disk
+    warmup = embeddings[:20]
+    measure_psycopg2(warmup)
+
+    latencies = {**measure_psycopg2(embeddings), **asyncio.run(measure_asyncpg(embeddings))}
+
+    print()
+    print(f"{'Variant':<20} {'p50 (ms)':>12} {'p95 (ms)':>12}")
+    print("-" * 80)
+    for name, result in latencies.items():
+        print(f"{name:<20} {result['p50_ms']:>12.2f} {result['p95_ms']:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Recall / latency / size report of the vector storages on document_embeddings.
+
+    full      ANN indexes on the float32 embeddings
+    halfvec   ANN indexes on half-precision embeddings, exact re-scoring
+    binary    ANN indexes on binary-quantized embeddings, exact re-scoring
+
+Query vectors are embeddings sampled from the table itself (no OpenAI call);
+each sampled chunk is excluded from its own results. Ground truth is an exact
+search (sequential scan, index scans disabled). For each storage the report
+gives the size of its ANN indexes, recall@k against the exact top k, and the
+search latency with the current VECTOR_HNSW_EF_SEARCH / VECTOR_IVFFLAT_PROBES
+and VECTOR_RESCORE_CANDIDATES.
+
+Storages without indexes are skipped unless --build creates them (concurrently,
+next to the configured ones); scripts/rebuild_vector_indexes.py drops the
+indexes of the storages other than VECTOR_STORAGE again.
+
+Usage:
+    python scripts/benchmark_vector_storage.py
+    python scripts/benchmark_vector_storage.py --build --queries 200 --top-k 10
+    python scripts/benchmark_vector_storage.py --document-type tender --rescore 200
+"""
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, select, func, text
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.models.document import DocumentEmbedding
+from app.models.vector import vector_param
+from app.services.vector_index_service import vector_index_service
+
+
+QUERY_VECTOR = "WITH query_vector AS MATERIALIZED (SELECT CAST(:query_embedding AS vector) AS embedding)"
+
+
+def _percentiles(samples: list[float]) -> dict:
+    samples = sorted(samples)
+    return {
+        "p50_ms": samples[len(samples) // 2] * 1000,
+        "p95_ms": samples[min(int(len(samples) * 0.95), len(samples) - 1)] * 1000,
+    }
+
+
+def sample_queries(db, count: int, document_type: str | None) -> list:
+    """(id, embedding) of random chunks."""
+    statement = select(DocumentEmbedding.id, DocumentEmbedding.embedding).where(DocumentEmbedding.embedding.is_not(None))
+    if document_type:
+        statement = statement.where(DocumentEmbedding.document_type == document_type)
+    rows = db.execute(statement.order_by(func.random()).limit(count)).fetchall()
+    return [(str(row.id), row.embedding.tolist()) for row in rows]
+
+
+def search(db, storage: str, where_clause: str, params: dict, top_k: int, exact: bool = False) -> tuple[list[str], float]:
+    """Ids of the top_k nearest chunks, and the seconds the statement took."""
+    sql = text(f"{QUERY_VECTOR} {vector_index_service.nearest_sql(where_clause, storage)}").bindparams(vector_param())
+    params = {**params, "candidates": top_k}
+    shortlist = vector_index_service.shortlist_size(top_k, storage)
+    if shortlist:
+        params["shortlist"] = shortlist
+
+    if exact:
+        db.execute(text("SELECT set_config('enable_indexscan', 'off', true)"))
+    else:
+        vector_index_service.apply_search_params_sync(db, shortlist or top_k)
+
+    start = time.perf_counter()
+    ids = [str(row.id) for row in db.execute(sql, params).fetchall()]
+    seconds = time.perf_counter() - start
+
+    db.rollback()
+    return ids, seconds
+
+
+def index_sizes(db, storages: list[str]) -> dict:
+    """MB of the ANN indexes of each storage (None when it has none)."""
+    existing = {index["name"]: index["size_mb"] for index in vector_index_service.status_sync(db)}
+    sizes = {}
+    for storage in storages:
+        names = [d["name"] for d in vector_index_service.index_definitions(storage=storage)]
+        present = [existing[name] for name in names if name in existing]
+        sizes[storage] = round(sum(present), 1) if present else None
+    return sizes
+
+
+def build_missing(engine, storages: list[str]) -> None:
+    """Create the indexes of the compared storages that do not exist yet."""
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        existing = {index["name"] for index in vector_index_service.status_sync(conn)}
+        row_counts = vector_index_service.row_counts_sync(conn)
+        conn.execute(text(f"SET maintenance_work_mem = '{settings.vector_index_build_memory}'"))
+        for storage in storages:
+            for definition in vector_index_service.index_definitions(row_counts=row_counts, storage=storage):
+                if definition["name"] not in existing:
+                    statement = vector_index_service.create_index_sql(definition)
+                    print(f"  🔧 {statement}")
+                    conn.execute(text(statement))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare full, halfvec and binary vector storage (recall, latency, size)")
+    parser.add_argument(
+        "--storages",
+        default=",".join(vector_index_service.STORAGES),
+        help="Comma-separated storages to compare (default: all)"
+    )
+    parser.add_argument("--queries", type=int, default=100, help="Sampled query vectors (default: 100)")
+    parser.add_argument("--top-k", type=int, default=10, help="Results per search, recall@k (default: 10)")
+    parser.add_argument("--document-type", help="Search (and sample) a single document type")
+    parser.add_argument("--rescore", type=int, help="Override VECTOR_RESCORE_CANDIDATES")
+    parser.add_argument("--build", action="store_true", help="Create the missing indexes of the compared storages")
+
+    args = parser.parse_args()
+    storages = [vector_index_service.resolve_storage(s.strip()) for s in args.storages.split(",") if s.strip()]
+    if args.rescore:
+        settings.vector_rescore_candidates = args.rescore
+
+    engine = create_engine(settings.database_url_sync)
+    Session = sessionmaker(bind=engine)
+
+    try:
+        if args.build:
+            build_missing(engine, storages)
+
+        db = Session()
+        try:
+            where_clause, params = vector_index_service.type_filter([args.document_type] if args.document_type else None)
+            where_clause += " AND id != CAST(:query_id AS uuid)"
+
+            queries = sample_queries(db, args.queries, args.document_type)
+            if not queries:
+                print("No embeddings to sample queries from")
+                return
+
+            table_mb = db.execute(text(f"SELECT pg_table_size('{vector_index_service.TABLE}') / 1048576.0")).scalar()
+            shared_buffers = db.execute(text("SHOW shared_buffers")).scalar()
+            sizes = index_sizes(db, storages)
+
+            print("=" * 80)
+            print(f"📏 VECTOR STORAGE ({len(queries)} queries, recall@{args.top_k}, "
+                  f"{settings.vector_index_method}, rescore {settings.vector_rescore_candidates})")
+            print(f"   {vector_index_service.TABLE}: {float(table_mb):.0f} MB, shared_buffers: {shared_buffers}")
+            print("=" * 80)
+
+            truth, exact_samples = {}, []
+            for query_id, embedding in queries:
+                ids, seconds = search(
+                    db, "full", where_clause, {**params, "query_id": query_id, "query_embedding": embedding},
+                    args.top_k, exact=True
+                )
+                truth[query_id] = set(ids)
+                exact_samples.append(seconds)
+
+            print(f"{'Storage':<12} {'Index (MB)':>12} {'Recall':>10} {'p50 (ms)':>10} {'p95 (ms)':>10}")
+            print("-" * 80)
+            exact = _percentiles(exact_samples)
+            print(f"{'exact scan':<12} {'-':>12} {1:>10.3f} {exact['p50_ms']:>10.2f} {exact['p95_ms']:>10.2f}")
+
+            for storage in storages:
+                if sizes[storage] is None:
+                    print(f"{storage:<12} {'no index':>12}   (run with --build)")
+                    continue
+
+                # Warm the caches up: the first searches read the index from disk
+                for query_id, embedding in queries[:10]:
+                    search(db, storage, where_clause, {**params, "query_id": query_id, "query_embedding": embedding}, args.top_k)
+
+                recalls, samples = [], []
+                for query_id, embedding in queries:
+                    ids, seconds = search(
+                        db, storage, where_clause, {**params, "query_id": query_id, "query_embedding": embedding},
+                        args.top_k
+                    )
+                    expected = truth[query_id]
+                    recalls.append(len(expected & set(ids)) / len(expected) if expected else 1.0)
+                    samples.append(seconds)
+
+                latency = _percentiles(samples)
+                print(f"{storage:<12} {sizes[storage]:>12.1f} {sum(recalls) / len(recalls):>10.3f} "
+                      f"{latency['p50_ms']:>10.2f} {latency['p95_ms']:>10.2f}")
+
+        finally:
+            db.close()
+
+    finally:
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Create or rebuild the search indexes of document_embeddings from the VECTOR_* settings.
+
+ANN indexes (HNSW or IVFFlat, global and per document type) are rebuilt on
+every run; the full-text index of hybrid retrieval (RAG_FTS_CONFIG) is only
+created when missing or on another text search configuration.
+
+Run it after a bulk ingestion (IVFFlat lists are sized on the rows present at
+build time), after changing VECTOR_INDEX_METHOD / VECTOR_HNSW_* /
+VECTOR_FILTERED_INDEX_TYPES / VECTOR_STORAGE, or to switch between HNSW and
+IVFFlat. Indexes are built concurrently under a temporary name then swapped
+in: searches and ingestion keep running meanwhile. When switching storage,
+the indexes of the previous one are only dropped once the new ones are built;
+restart the API and workers with the new VECTOR_STORAGE in between.
+
+Usage:
+    python scripts/rebuild_vector_indexes.py --status
+    python scripts/rebuild_vector_indexes.py --dry-run
+    python scripts/rebuild_vector_indexes.py --method ivfflat
+    python scripts/rebuild_vector_indexes.py --storage halfvec
+"""
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine
+
+from app.core.config import settings
+from app.services.vector_index_service import vector_index_service
+
+
+def print_status(engine) -> None:
+    """List the search indexes of document_embeddings."""
+    with engine.connect() as conn:
+        indexes = vector_index_service.status_sync(conn)
+
+    if not indexes:
+        print("No search index on document_embeddings")
+        return
+
+    for index in indexes:
+        print(f"{'✅' if index['valid'] else '❌'} {index['name']} ({index['size_mb']} MB)")
+        print(f"   {index['definition']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Create or rebuild the search indexes of document_embeddings")
+    parser.add_argument(
+        "--method",
+        choices=vector_index_service.METHODS,
+        default=settings.vector_index_method,
+        help=f"Index method (default: VECTOR_INDEX_METHOD, {settings.vector_index_method})"
+    )
+    parser.add_argument(
+        "--storage",
+        choices=vector_index_service.STORAGES,
+        default=settings.vector_storage,
+        help=f"Vectors held by the indexes (default: VECTOR_STORAGE, {settings.vector_storage})"
+    )
+    parser.add_argument("--status", action="store_true", help="Only list the current indexes")
+    parser.add_argument("--dry-run", action="store_true", help="Print the statements without running them")
+    parser.add_argument(
+        "--blocking",
+        action="store_true",
+        help="Build without CONCURRENTLY (faster, but blocks writes to document_embeddings)"
+    )
+
+    args = parser.parse_args()
+
+    engine = create_engine(settings.database_url_sync)
+
+    try:
+        if args.status:
+            print_status(engine)
+            return
+
+        print("=" * 80)
+        print(f"🔧 VECTOR INDEX REBUILD ({args.method}, {args.storage}, filtered types: {', '.join(vector_index_service.filtered_types()) or 'none'})")
+        print("=" * 80)
+
+        start = time.perf_counter()
+        statements = vector_index_service.rebuild_sync(
+            engine,
+            method=args.method,
+            concurrently=not args.blocking,
+            dry_run=args.dry_run,
+            storage=args.storage
+        )
+
+        if args.dry_run:
+            for statement in statements:
+                print(f"{statement};")
+            return
+
+        print(f"\n✅ {len(statements)} statements in {time.perf_counter() - start:.1f}s\n")
+        print_status(engine)
+
+    finally:
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
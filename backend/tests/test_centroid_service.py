@@ -0,0 +1,80 @@
+"""
+Tests for Centroid Service.
+"""
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.models.embedding_centroid import EmbeddingCentroid
+from app.services.centroid_service import centroid_service
+from app.services.rag_service import rag_service
+
+
+class FakeSession:
+    """Sync session recording statements, returning canned rows."""
+
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.executed = []
+        self.commits = 0
+
+    def execute(self, statement, params=None):
+        self.executed.append((str(statement), params))
+        return SimpleNamespace(fetchall=lambda: self.rows, rowcount=len(self.rows))
+
+    def commit(self):
+        self.commits += 1
+
+
+@pytest.mark.unit
+class TestCentroids:
+    """Test suite for centroid maintenance and KNN."""
+
+    def test_refresh_document_then_tender(self):
+        """Document centroid first (the tender one averages document centroids), one commit."""
+        db = FakeSession()
+        document_id = uuid4()
+
+        centroid_service.refresh_document_sync(db, document_id)
+
+        statements = [sql for sql, _ in db.executed]
+        assert "AVG(embedding)" in statements[0] and "'document'" in statements[0]
+        assert "DELETE FROM embedding_centroids" in statements[1]
+        assert "AVG(c.embedding)" in statements[2] and "'tender'" in statements[2]
+        assert "DELETE FROM embedding_centroids" in statements[3]
+        assert all(params == {"document_id": str(document_id)} for _, params in db.executed)
+        assert db.commits == 1
+
+    def test_knn_statement_uses_scope_index(self):
+        """The scope is a literal matching the partial HNSW index predicate."""
+        sql, params = centroid_service._nearest_sql("tender", None)
+
+        predicates = {str(index.dialect_options["postgresql"]["where"]) for index in EmbeddingCentroid.__table__.indexes}
+        assert "scope = 'tender'" in predicates
+        assert "WHERE scope = 'tender'" in str(sql)
+        assert "ORDER BY distance" in str(sql)
+        assert params == {}
+
+        with pytest.raises(ValueError):
+            centroid_service._nearest_sql("chunk", None)
+
+    def test_find_similar_tenders_is_a_centroid_knn(self):
+        """One KNN statement; a reference without centroid yields no neighbour."""
+        other = uuid4()
+        db = FakeSession([
+            SimpleNamespace(entity_id=other, document_type=None, distance=0.125),
+        ])
+
+        similar = rag_service.find_similar_tenders_sync(db, uuid4(), limit=3)
+
+        assert similar == [{"tender_id": str(other), "similarity_score": 0.875}]
+        assert "GROUP BY" not in db.executed[-1][0]
+        assert db.executed[-1][1]["limit"] == 3
+
+        db = FakeSession([SimpleNamespace(entity_id=other, document_type=None, distance=None)])
+        assert rag_service.find_similar_tenders_sync(db, uuid4()) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,78 @@
+"""
+Tests for DOCX Parser Service.
+"""
+import io
+import json
+import pytest
+from pathlib import Path
+
+import docx
+
+from app.services.docx_parser_service import docx_parser_service
+
+
+EXAMPLES_DIR = Path(__file__).parent.parent.parent / "Examples" / "VSGP-AO"
+
+
+@pytest.fixture
+def heading_docx_content():
+    """Document with built-in heading styles, explicit numbering and a table."""
+    document = docx.Document()
+    document.add_paragraph("Acte d'engagement", style="Title")
+    document.add_heading("Objet de l'accord-cadre", level=1)
+    document.add_paragraph("Prestations d'infogérance.")
+    document.add_heading("Nomenclature", level=2)
+    document.add_paragraph("CPV 72510000-3")
+    document.add_heading("Prix", level=1)
+    document.add_heading("4.2 Pénalités de retard", level=2)
+    table = document.add_table(rows=2, cols=2)
+    table.rows[0].cells[0].text = "Profil"
+    table.rows[0].cells[1].text = "TJM"
+    table.rows[1].cells[0].text = "Chef de projet"
+    table.rows[1].cells[1].text = "650"
+
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+@pytest.mark.unit
+class TestDocxExtraction:
+    """Test suite for the heading-style driven DOCX extraction path."""
+
+    def test_sections_from_heading_styles(self, heading_docx_content):
+        """Levels come from styles, numbers from the title or the outline position."""
+        result = docx_parser_service.extract_from_docx_sync(heading_docx_content)
+
+        assert result["extraction_method"] == "python-docx"
+        assert [(s["number"], s["title"], s["level"], s["parent_number"]) for s in result["sections"]] == [
+            ("1", "Objet de l'accord-cadre", 1, None),
+            ("1.1", "Nomenclature", 2, "1"),
+            ("2", "Prix", 1, None),
+            ("4.2", "Pénalités de retard", 2, "4"),
+        ]
+        assert result["sections"][1]["content"] == "CPV 72510000-3"
+        assert result["sections"][3]["key_category"] == "penalty"
+
+        assert result["tables"][0]["headers"] == ["Profil", "TJM"]
+        assert result["tables"][0]["rows"] == [["Chef de projet", "650"]]
+
+        json.dumps(result)
+
+    def test_example_acte_engagement(self):
+        """Custom template heading styles (based on outline levels) are recognized."""
+        path = EXAMPLES_DIR / "AE.docx"
+        if not path.exists():
+            pytest.skip(f"Sample document not found: {path}")
+
+        result = docx_parser_service.extract_from_docx_sync(str(path))
+
+        assert result["page_count"] > 1
+        assert any(s["title"] == "Prix" and s["level"] == 1 for s in result["sections"])
+        assert any(s["level"] == 2 and s["parent_number"] for s in result["sections"])
+
+        print(f"✅ AE.docx: {len(result['sections'])} sections, {result['page_count']} pages")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
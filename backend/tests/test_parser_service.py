@@ -0,0 +1,791 @@
+"""
+Tests for Parser Service.
+"""
+import io
+import re
+import asyncio
+import pytest
+from pathlib import Path
+
+from app.services.parser_service import parser_service
+
+
+EXAMPLES_DIR = Path(__file__).parent.parent.parent / "Examples" / "VSGP-AO"
+
+
+@pytest.fixture(scope="module")
+def scanned_pdf_content():
+    """Two image-only pages (no text layer), like a scanned annex."""
+    from PIL import Image, ImageDraw
+
+    pages = []
+    for label in ("Article 1 - Objet", "Article 2 - Delais"):
+        image = Image.new("RGB", (600, 300), "white")
+        ImageDraw.Draw(image).text((20, 20), label, fill="black")
+        pages.append(image)
+
+    buffer = io.BytesIO()
+    pages[0].save(buffer, "PDF", save_all=True, append_images=pages[1:])
+    return buffer.getvalue()
+
+
+class DictOcrCache:
+    """In-memory OCR cache with the get/set interface of OcrPageCache."""
+
+    def __init__(self):
+        self.entries = {}
+
+    def get(self, image_hash):
+        return self.entries.get(image_hash)
+
+    def set(self, image_hash, text):
+        self.entries[image_hash] = text
+
+
+@pytest.fixture(scope="module")
+def rc_pdf_content():
+    """RC.pdf bytes from the VSGP-AO sample tender (12 pages)."""
+    pdf_path = EXAMPLES_DIR / "RC.pdf"
+
+    if not pdf_path.exists():
+        pytest.skip(f"Sample PDF not found: {pdf_path}")
+
+    return pdf_path.read_bytes()
+
+
+@pytest.mark.unit
+class TestPageParallelExtraction:
+    """Test suite for page-parallel PDF extraction."""
+
+    def test_parallel_matches_serial(self, rc_pdf_content):
+        """Parallel extraction must produce exactly the serial output."""
+        serial = parser_service.extract_from_pdf_sync(rc_pdf_content, parallel=False, fidelity="full")
+
+        page_count = serial["page_count"]
+        parallel = parser_service._extract_with_pdfplumber_parallel_sync(
+            rc_pdf_content,
+            page_count,
+            max_workers=2,
+            pages_per_chunk=5  # Uneven last chunk on purpose
+        )
+
+        assert parallel["text"] == serial["text"]
+        assert parallel["tables"] == serial["tables"]
+        assert parallel["sections"] == serial["sections"]
+
+        print(f"✅ Parallel == serial: {page_count} pages, {len(serial['sections'])} sections")
+
+    def test_merge_page_results_orders_pages(self):
+        """Page results arriving out of order are merged in page order."""
+        page_results = [
+            {"page": 2, "text": "Article 2 – Durée\nQuatre ans.", "tables": [], "sections": []},
+            {"page": 1, "text": "Article 1 – Objet\nInfogérance.", "tables": [], "sections": []},
+        ]
+        for result in page_results:
+            result["sections"] = parser_service._detect_sections(result["text"], result["page"])
+
+        merged = parser_service._merge_page_results(page_results)
+
+        assert merged["text"].startswith("Article 1")
+        assert [s["number"] for s in merged["sections"]] == ["1", "2"]
+        assert merged["sections"][0]["content"] == "Infogérance."
+
+
+@pytest.mark.unit
+class TestAsyncExtraction:
+    """Test suite for the executor-backed async extraction API."""
+
+    @pytest.mark.asyncio
+    async def test_extraction_does_not_block_event_loop(self, rc_pdf_content):
+        """The async API returns the sync output while the loop keeps running."""
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker_task = asyncio.create_task(ticker())
+        try:
+            result = await parser_service.extract_from_pdf(rc_pdf_content)
+        finally:
+            ticker_task.cancel()
+            parser_service.shutdown_async_executor()
+
+        expected = parser_service.extract_from_pdf_sync(rc_pdf_content, parallel=False)
+        assert result["text"] == expected["text"]
+        assert result["sections"] == expected["sections"]
+
+        # Parsing RC.pdf takes seconds: a blocked loop would barely tick
+        assert ticks > 50
+
+        print(f"✅ Async extraction: {ticks} loop ticks during parsing")
+
+
+@pytest.mark.unit
+class TestSectionClassification:
+    """Test suite for the precompiled section detector and key-section classifier."""
+
+    def test_detect_sections_single_pass(self):
+        """Header types, line numbers and stripping match the per-line semantics."""
+        text = (
+            "Sommaire\n"
+            "  PARTIE II – Clauses techniques  \n"
+            "Article 3 - Pénalités\n"
+            "4.1.2 Gestion des incidents\n"
+            "1.   \n"
+            "2. Objet du marché\n"
+            "3.1\n"
+            "12. suite en minuscules"
+        )
+
+        sections = parser_service._detect_sections(text, 7)
+
+        assert [(s["type"], s["number"], s["title"], s["line"]) for s in sections] == [
+            ("PART", "II", "Clauses techniques", 1),
+            ("ARTICLE", "3", "Pénalités", 2),
+            ("SECTION", "4.1.2", "Gestion des incidents", 3),
+            ("NUMBERED_ITEM", "2", "Objet du marché", 5),
+            ("NUMBERED_ITEM", "12", "suite en minuscules", 7),
+        ]
+        assert sections[0]["content"] == "PARTIE II – Clauses techniques"
+        assert all(s["page"] == 7 for s in sections)
+
+    def test_key_section_lowest_pattern_wins(self):
+        """The first pattern of KEY_SECTION_PATTERNS found in title or content wins."""
+        long_content = "Le titulaire est soumis à une obligation de moyens. " * 3
+
+        # 'pénalités' in the title, but 'obligation' comes first in the pattern list
+        assert parser_service._is_key_section(
+            {"title": "Pénalités de retard", "content": long_content}
+        ) == (True, "obligation")
+
+        # Short content is ignored
+        assert parser_service._is_key_section(
+            {"title": "Pénalités de retard", "content": "obligation"}
+        ) == (True, "penalty")
+
+        assert parser_service._is_key_section(
+            {"title": "Présentation", "content": "Rien de particulier."}
+        ) == (False, None)
+
+    def test_section_content_is_not_truncated(self):
+        """Full section bodies are kept; DocumentSection stores a preview and the compressed body."""
+        from app.models.document_section import DocumentSection
+
+        body = "\n".join(f"Ligne {i} du cahier des clauses techniques." for i in range(200))
+        sections = parser_service._extract_section_content_from_pages(
+            parser_service._detect_sections(f"2. Objet du marché\n{body}", 1),
+            {1: f"2. Objet du marché\n{body}"}
+        )
+
+        assert sections[0]["content"] == body
+        assert sections[0]["content_length"] == len(body)
+
+        row = DocumentSection(title=sections[0]["title"], page=1)
+        row.set_full_content(sections[0]["content"])
+
+        assert row.content == body[:DocumentSection.CONTENT_PREVIEW_LENGTH]
+        assert row.content_truncated and row.content_length == len(body)
+        assert row.full_content == body
+
+        row.set_full_content("Court.")
+        assert (row.content, row.content_compressed, row.full_content) == ("Court.", None, "Court.")
+
+    def test_section_copies_only_keep_previews(self):
+        """extraction_meta_data keeps previews (full content comes back from the rows); the cache compresses."""
+        from types import SimpleNamespace
+        from app.models.document_section import DocumentSection
+        from app.services.extraction_cache_service import extraction_cache_service
+        from app.tasks.tender_tasks import _section_previews, _with_full_section_content
+
+        body = "Clause de révision des prix. " * 200
+        sections = [
+            {"type": "ARTICLE", "number": "4", "title": "Prix", "page": 2, "line": 7,
+             "content": body, "content_length": len(body)},
+            {"type": "ARTICLE", "number": "5", "title": "Délais", "page": 3, "line": 1,
+             "content": "Court.", "content_length": 6},
+        ]
+        preview_length = DocumentSection.CONTENT_PREVIEW_LENGTH
+
+        meta = {"page_fingerprints": ["a", "b", "c"], "sections": _section_previews(sections)}
+        assert meta["sections"][0]["content"] == body[:preview_length]
+        assert meta["sections"][0]["content_length"] == len(body)
+        assert meta["sections"][1] == sections[1]
+
+        row = DocumentSection(title="Prix", page=2, line=7, section_number="4")
+        row.set_full_content(body)
+
+        class FakeQuery:
+            def options(self, *args):
+                return self
+
+            def filter(self, *args):
+                return self
+
+            def all(self):
+                return [row]
+
+        previous = _with_full_section_content(SimpleNamespace(query=lambda model: FakeQuery()), None, meta)
+        assert previous["sections"] == sections
+        assert previous["page_fingerprints"] == meta["page_fingerprints"]
+
+        packed = extraction_cache_service._pack_sections({"text": body, "sections": sections})
+        assert packed["sections"][0]["content"] == body[:preview_length]
+        assert len(packed["sections"][0]["content_compressed"]) < len(body) / 10
+        assert extraction_cache_service._unpack_sections(packed)["sections"] == sections
+
+    def test_cache_key_follows_extraction_settings(self, monkeypatch):
+        """Settings that change the output change the key; OCR page keys only follow the OCR settings."""
+        from app.core.config import settings
+        from app.services.extraction_cache_service import extraction_cache_service
+
+        document_key = extraction_cache_service._cache_key("f" * 64, "document")
+        ocr_key = extraction_cache_service._cache_key("f" * 64, "ocr_page")
+
+        monkeypatch.setattr(settings, "parser_strip_boilerplate", not settings.parser_strip_boilerplate)
+        assert extraction_cache_service._cache_key("f" * 64, "document") != document_key
+        assert extraction_cache_service._cache_key("f" * 64, "ocr_page") == ocr_key
+
+        monkeypatch.setattr(settings, "parser_ocr_language", "eng")
+        assert extraction_cache_service._cache_key("f" * 64, "ocr_page") != ocr_key
+
+
+@pytest.mark.unit
+class TestFidelityLevels:
+    """Test suite for per-page engine selection (pdfium / pdfplumber)."""
+
+    def test_fast_uses_pdfium_text_only(self, rc_pdf_content):
+        """fast never opens pdfplumber on text pages and finds the same sections."""
+        fast = parser_service.extract_from_pdf_sync(rc_pdf_content, parallel=False, fidelity="fast")
+        full = parser_service.extract_from_pdf_sync(rc_pdf_content, parallel=False, fidelity="full")
+
+        assert fast["engines"] == {"pdfium": fast["page_count"]}
+        assert full["engines"] == {"pdfplumber": full["page_count"]}
+        assert fast["tables"] == [] and full["tables"]
+        assert fast["extraction_method"] == "pdfium_fast"
+        assert [(s["page"], s["number"]) for s in fast["sections"]] == [(s["page"], s["number"]) for s in full["sections"]]
+        assert fast["metadata"]["page_count"] == full["metadata"]["page_count"] == fast["page_count"]
+
+    def test_standard_keeps_tables(self, rc_pdf_content):
+        """Pages passing the table pre-check go to pdfplumber, so their tables are kept."""
+        full = parser_service.extract_from_pdf_sync(rc_pdf_content, parallel=False, fidelity="full")
+        standard = parser_service.extract_from_pdf_sync(rc_pdf_content, parallel=False, fidelity="standard")
+        parallel = parser_service.extract_from_pdf_sync(rc_pdf_content, parallel=True, fidelity="standard")
+
+        assert set(standard["engines"]) == {"pdfium", "pdfplumber"}
+        assert standard["tables"] == full["tables"]
+        assert parallel["sections"] == standard["sections"]
+
+    def test_table_precheck_is_lossless(self, rc_pdf_content, monkeypatch):
+        """Skipping extract_tables on pages without crossing rulings loses no table."""
+        from app.core.config import settings
+
+        checked = parser_service.extract_from_pdf_sync(rc_pdf_content, parallel=False, fidelity="full")
+        monkeypatch.setattr(settings, "parser_table_min_edges", 0)
+        unchecked = parser_service.extract_from_pdf_sync(rc_pdf_content, parallel=False, fidelity="full")
+
+        assert 0 < checked["tables_skipped"] < checked["page_count"]
+        assert unchecked["tables_skipped"] == 0
+        assert checked["tables"] == unchecked["tables"]
+
+    def test_ruling_edges(self):
+        """Thin paths are lines, larger ones rectangles; short strokes are ignored."""
+        edges = parser_service._count_ruling_edges([(100, 0.5), (0.5, 40), (50, 20), (1, 1), (2, 100)])
+
+        assert edges == (3, 4)
+        assert parser_service._has_table_rulings(*edges)
+        assert not parser_service._has_table_rulings(5, 1)
+
+    def test_unknown_fidelity(self, rc_pdf_content):
+        """Fidelity levels are validated."""
+        with pytest.raises(ValueError):
+            parser_service.extract_from_pdf_sync(rc_pdf_content, fidelity="best")
+
+    def test_pdfium_text_conventions(self):
+        """Line breaks, hyphenation marks and heading tabs follow pdfplumber's output."""
+        class TextPage:
+            def get_text_bounded(self):
+                return "11.1.1Demandes de paiement  \r\nsous\x02traitance\r\n"
+
+        assert parser_service._pdfium_page_text(TextPage()) == "11.1.1 Demandes de paiement\nsous-traitance"
+
+
+@pytest.mark.unit
+class TestOutlineSections:
+    """Test suite for the outline (bookmarks) driven section path."""
+
+    @pytest.fixture(scope="class")
+    def outlined_pdf_content(self, rc_pdf_content):
+        """RC.pdf with bookmarks, with and without the heading numbering."""
+        from PyPDF2 import PdfReader, PdfWriter
+
+        writer = PdfWriter()
+        for page in PdfReader(io.BytesIO(rc_pdf_content)).pages:
+            writer.add_page(page)
+
+        objet = writer.add_outline_item("Objet de l'accord-cadre", 2)
+        writer.add_outline_item("Forme de l'accord-cadre", 2, parent=objet)
+        organisation = writer.add_outline_item("2. Organisation de la consultation", 2)
+        writer.add_outline_item("Procédure de passation", 2, parent=organisation)
+        writer.add_outline_item("Annexe technique", 3, parent=organisation)
+
+        buffer = io.BytesIO()
+        writer.write(buffer)
+        return buffer.getvalue()
+
+    def test_sections_come_from_outline(self, outlined_pdf_content):
+        """Bookmarks are anchored on their heading lines; TOC lines are not sections."""
+        result = parser_service.extract_from_pdf_sync(outlined_pdf_content, parallel=False)
+
+        assert [(e["title"], e["level"], e["page"]) for e in result["metadata"]["outline"]][:2] == [
+            ("Objet de l'accord-cadre", 1, 3),
+            ("Forme de l'accord-cadre", 2, 3),
+        ]
+        assert [(s["page"], s["type"], s["number"], s["title"], s["parent_number"]) for s in result["sections"]] == [
+            (3, "NUMBERED_ITEM", "1", "Objet de l'accord-cadre", None),
+            (3, "SECTION", "1.1", "Forme de l'accord-cadre", "1"),
+            (3, "NUMBERED_ITEM", "2", "Organisation de la consultation", None),
+            (3, "SECTION", "2.1", "Procédure de passation", "2"),
+            (4, "HEADING", "2.2", "Annexe technique", "2"),  # Not in the text: top of its page
+        ]
+        assert result["sections"][1]["content"].startswith("La consultation ne fait pas l'objet")
+        assert result["sections"][4]["line"] == 0
+
+    def test_outline_paths_agree(self, outlined_pdf_content):
+        """Parallel and streamed extraction use the outline too."""
+        serial = parser_service.extract_from_pdf_sync(outlined_pdf_content, parallel=False)
+        parallel = parser_service.extract_from_pdf_sync(outlined_pdf_content, parallel=True)
+        pages = list(parser_service.iter_pages(outlined_pdf_content, strip_boilerplate=True))
+
+        assert parallel["sections"] == serial["sections"]
+        assert [s for page in pages for s in page["sections"]] == serial["sections"]
+
+    def test_small_outline_is_ignored(self, rc_pdf_content):
+        """Without enough bookmarks, sections are detected in the text."""
+        outline = [{"title": "Objet", "level": 1, "page": 3}]
+
+        assert parser_service._outline_by_page(outline) is None
+        assert parser_service._outline_by_page([]) is None
+
+
+@pytest.mark.unit
+class TestStructuredInfo:
+    """Test suite for the structured info scanner."""
+
+    def test_scan_collects_references_deadlines_emails_phones(self):
+        """References, emails, phones and normalized deadlines, in order of appearance."""
+        text = (
+            "Marché n° 2024-017 - AO-2024-123\n"
+            "Contact : achats@ville-exemple.fr, 01 23 45 67 89\n"
+            "Date limite de remise des offres : 15/03/2024 à 12h00\n"
+            "Visite sur site avant le 1er mars 2024\n"
+            "Réunion de lancement le 02/04/2024\n"
+            "Échéance : 31/02/2024\n"
+            "Relance : achats@ville-exemple.fr"
+        )
+
+        info = parser_service._scan_structured_info(text)
+
+        assert info["reference_numbers"] == ["Marché n° 2024-017", "AO-2024-123"]
+        assert info["email_addresses"] == ["achats@ville-exemple.fr"]
+        assert info["phone_numbers"] == ["01 23 45 67 89"]
+        assert [(d["date"], d["datetime"]) for d in info["deadlines"]] == [
+            ("15/03/2024 à 12h00", "2024-03-15T12:00:00"),
+            ("1er mars 2024", "2024-03-01T00:00:00"),
+            ("31/02/2024", None),  # Not a real date
+        ]
+        assert info["deadlines"][0]["context"] == "Date limite de remise des offres : 15/03/2024 à 12h00"
+
+    @pytest.mark.parametrize("text", [
+        "Marché n° 2024/015/AO",
+        "Référence : AO-2024-123/LOT2",
+        "MARCHÉ N° AO-2024-77 du 2024/03/AO",
+        "Écrire à a@ville.fr@mairie.fr ou 5@ville.fr-2@ville.fr",
+        "Tél : 01 23 45 67 89, x+33 1 23 45 67 89, 0123456789012",
+    ])
+    def test_overlapping_matches_like_per_pattern_findall(self, text):
+        """Matches of different patterns may overlap; each pattern finds what its own findall finds."""
+        references = []
+        for pattern in (r'\b\d{4}[-/]\d{2,4}[-/]\w+\b', r'\bAO[-/]?\d{4}[-/]?\d+\b', r'\bMarché\s+n°\s*[\w-]+\b'):
+            references += re.findall(pattern, text, re.IGNORECASE)
+        emails = re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
+        phones = re.findall(r'\b(?:0|\+33)[1-9](?:[\s.-]?\d{2}){4}\b', text)
+
+        info = parser_service._scan_structured_info(text)
+
+        assert sorted(info["reference_numbers"]) == sorted(set(references))
+        assert sorted(info["email_addresses"]) == sorted(set(emails))
+        assert sorted(info["phone_numbers"]) == sorted(set(phones))
+
+    def test_page_scans_merge_exactly(self, rc_pdf_content):
+        """Scanning pages one by one (streaming) finds what a whole-text scan finds."""
+        import pdfplumber
+
+        with pdfplumber.open(io.BytesIO(rc_pdf_content)) as pdf:
+            pages = [page.extract_text() or "" for page in pdf.pages]
+
+        whole = parser_service._scan_structured_info("\n\n".join(pages))
+        by_page = [parser_service._scan_structured_info(page) for page in pages]
+
+        assert whole["deadlines"] == [d for info in by_page for d in info["deadlines"]]
+        for key in ("reference_numbers", "email_addresses", "phone_numbers"):
+            assert whole[key] == list(dict.fromkeys(v for info in by_page for v in info[key]))
+
+
+@pytest.mark.unit
+class TestBoilerplate:
+    """Test suite for running header/footer stripping."""
+
+    def test_repeated_header_and_footer_are_stripped(self):
+        """Lines repeated at the top/bottom of pages go, section lines are remapped."""
+        page_results = []
+        for page_num in range(1, 5):
+            body = "\n".join(f"Alinéa {page_num}.{i} : {'clause ' * (page_num + i)}" for i in range(6))
+            text = (
+                "Procédure : 25TIC06\n"
+                f"{page_num}. Article {page_num}\n"
+                f"{body}\n"
+                f"Règlement de la consultation Page {page_num} sur 4"
+            )
+            page_results.append({
+                "page": page_num,
+                "text": text,
+                "tables": [],
+                "sections": parser_service._detect_sections(text, page_num)
+            })
+        raw_fingerprints = [parser_service._page_fingerprint(r["text"]) for r in page_results]
+
+        extraction = parser_service._merge_page_results(page_results, strip_boilerplate=True)
+
+        assert "Procédure" not in extraction["text"] and "Règlement" not in extraction["text"]
+        assert extraction["page_fingerprints"] == raw_fingerprints
+        assert [(s["number"], s["page"], s["line"]) for s in extraction["sections"]] == [
+            (str(n), n, 0) for n in range(1, 5)
+        ]
+        assert extraction["sections"][0]["content"].startswith("Alinéa 1.0")
+        assert extraction["sections"][0]["content"].endswith("Alinéa 1.5 : " + "clause " * 5 + "clause")
+
+        boilerplate = extraction["boilerplate"]
+        assert boilerplate["lines"] == ["Procédure : #TIC#", "Règlement de la consultation Page # sur #"]
+        assert boilerplate["chars_removed"] == 4 * (len("Procédure : 25TIC06\n") + len("\nRèglement de la consultation Page 1 sur 4"))
+        assert boilerplate["tokens_saved"] == boilerplate["chars_removed"] // 4
+
+    def test_short_documents_are_left_alone(self):
+        """Fewer than 3 pages never have boilerplate."""
+        page_results = [
+            {"page": n, "text": "En-tête\nCorps", "tables": [], "sections": []} for n in (1, 2)
+        ]
+
+        extraction = parser_service._merge_page_results(page_results, strip_boilerplate=True)
+
+        assert extraction["text"] == "En-tête\nCorps\n\nEn-tête\nCorps"
+        assert extraction["boilerplate"] == {"lines": [], "chars_removed": 0, "tokens_saved": 0}
+
+
+@pytest.mark.unit
+class TestStreamingExtraction:
+    """Test suite for the bounded-memory streaming API."""
+
+    def test_iter_pages_matches_full_extraction(self, rc_pdf_content):
+        """Sections streamed page by page equal the whole-document sections."""
+        full = parser_service.extract_from_pdf_sync(rc_pdf_content, parallel=False)
+
+        pages = list(parser_service.iter_pages(rc_pdf_content, strip_boilerplate=True))
+        streamed_sections = [s for page in pages for s in page["sections"]]
+
+        assert [p["page"] for p in pages] == list(range(1, full["page_count"] + 1))
+        assert streamed_sections == full["sections"]
+
+    def test_streaming_extraction_sinks(self, rc_pdf_content, tmp_path):
+        """Streaming extraction writes text to the sink and hands out sections."""
+        full = parser_service.extract_from_pdf_sync(rc_pdf_content, parallel=False)
+
+        pdf_path = tmp_path / "RC.pdf"
+        pdf_path.write_bytes(rc_pdf_content)
+
+        received_sections = []
+        text_sink = io.StringIO()
+
+        result = parser_service.extract_from_pdf_streaming_sync(
+            source=str(pdf_path),
+            on_sections=received_sections.extend,
+            text_sink=text_sink
+        )
+
+        assert text_sink.getvalue() == full["text"]
+        assert received_sections == full["sections"]
+        assert result["tables"] == full["tables"]
+        assert result["page_count"] == full["page_count"]
+        assert result["stats"]["sections_count"] == len(full["sections"])
+        assert result["structured"]["section_summary"] == full["structured"]["section_summary"]
+        assert sorted(result["structured"]["email_addresses"]) == sorted(full["structured"]["email_addresses"])
+
+        print(f"✅ Streaming: {result['stats']['text_length']} chars, {len(received_sections)} sections")
+
+    def test_streaming_error_is_raised(self, rc_pdf_content, monkeypatch):
+        """A failing page fails the extraction: partial results are never returned as complete."""
+        real_iter_pages = parser_service.iter_pages
+
+        def failing_iter_pages(*args, **kwargs):
+            for page in real_iter_pages(*args, **kwargs):
+                if page["page"] == 3:
+                    raise RuntimeError("corrupt page stream")
+                yield page
+
+        monkeypatch.setattr(parser_service, "iter_pages", failing_iter_pages)
+        text_sink = io.StringIO()
+
+        with pytest.raises(RuntimeError, match="corrupt page stream"):
+            parser_service.extract_from_pdf_streaming_sync(
+                source=rc_pdf_content, on_sections=lambda sections: None, text_sink=text_sink
+            )
+        assert text_sink.getvalue()  # Pages 1-2 were handed over before the error
+
+
+
+@pytest.mark.unit
+class TestIncrementalExtraction:
+    """Test suite for per-page fingerprints and incremental re-extraction."""
+
+    def test_only_changed_pages_are_reextracted(self, rc_pdf_content):
+        """A page with a different fingerprint is re-detected, others are reused."""
+        full = parser_service.extract_from_pdf_sync(rc_pdf_content, parallel=False)
+
+        assert len(full["page_fingerprints"]) == full["page_count"]
+
+        # Previous version differs on page 3 only
+        previous = {
+            "page_fingerprints": list(full["page_fingerprints"]),
+            "boilerplate": full["boilerplate"],
+            "fidelity": full["fidelity"],
+            "sections": [s for s in full["sections"] if s["page"] != 3],
+            "tables": [t for t in full["tables"] if t["page"] != 3],
+        }
+        previous["page_fingerprints"][2] = "0" * 16
+
+        result = parser_service.extract_changed_pages_sync(rc_pdf_content, previous)
+
+        assert result["changed_pages"] == [3]
+        assert result["sections"] == full["sections"]
+        assert result["tables"] == full["tables"]
+        assert result["text"] == full["text"]
+        assert result["boilerplate"] == full["boilerplate"]
+
+    def test_streaming_hands_over_changed_pages_only(self, rc_pdf_content):
+        """A streamed new version only hands out the sections of pages whose fingerprint changed."""
+        full = parser_service.extract_from_pdf_sync(rc_pdf_content, parallel=False)
+        changed_page = full["sections"][-1]["page"]
+
+        previous_fingerprints = list(full["page_fingerprints"])
+        previous_fingerprints[changed_page - 1] = "0" * 16
+
+        received_sections = []
+        result = parser_service.extract_from_pdf_streaming_sync(
+            source=rc_pdf_content,
+            on_sections=received_sections.extend,
+            text_sink=io.StringIO(),
+            previous_fingerprints=previous_fingerprints
+        )
+
+        assert result["changed_pages"] == [changed_page]
+        assert result["page_fingerprints"] == full["page_fingerprints"]
+        assert received_sections == [s for s in full["sections"] if s["page"] == changed_page]
+        assert result["stats"]["sections_count"] == len(full["sections"])
+
+    def test_diff_page_fingerprints(self):
+        """Changed and appended pages are reported, 1-based."""
+        changed = parser_service.diff_page_fingerprints(["a", "b", "c"], ["a", "x", "c", "d"])
+
+        assert changed == [2, 4]
+
+
+@pytest.mark.unit
+class TestSelectiveOcr:
+    """Test suite for per-page OCR of pages without a text layer."""
+
+    def test_text_pdf_is_not_ocred(self, rc_pdf_content):
+        """Pages with a text layer never go through Tesseract."""
+        result = parser_service.extract_from_pdf_sync(rc_pdf_content, use_ocr=True, parallel=False)
+
+        assert result["ocr_pages"] == []
+        assert result["extraction_method"] == parser_service.EXTRACTION_METHODS[result["fidelity"]]
+
+    def test_scanned_pages_are_ocred_and_cached(self, scanned_pdf_content, monkeypatch):
+        """Only missing pages are OCRed once; a retry is served from the page cache."""
+        ocr_calls = []
+
+        def fake_ocr_pages(source, page_numbers, budget=None):
+            ocr_calls.append(list(page_numbers))
+            return {page_num: f"Article {page_num} – Titre OCR" for page_num in page_numbers}
+
+        monkeypatch.setattr(parser_service, "_ocr_pages_sync", fake_ocr_pages)
+        cache = DictOcrCache()
+
+        first = parser_service.extract_from_pdf_sync(scanned_pdf_content, use_ocr=True, ocr_cache=cache)
+        retry = parser_service.extract_from_pdf_sync(scanned_pdf_content, use_ocr=True, ocr_cache=cache)
+
+        assert ocr_calls == [[1, 2]]
+        assert len(cache.entries) == 2
+        assert first["ocr_pages"] == [1, 2]
+        assert first["extraction_method"] == "pdfplumber_ocr"
+        assert [s["number"] for s in first["sections"]] == ["1", "2"]
+        assert retry["text"] == first["text"]
+
+        # Fingerprints stay on the (empty) text layer
+        assert first["page_fingerprints"] == [parser_service._page_fingerprint("")] * 2
+
+    def test_ocr_sections_follow_outline(self, scanned_pdf_content, monkeypatch):
+        """In a document with bookmarks, OCRed pages get their sections from the outline too."""
+        from PyPDF2 import PdfReader, PdfWriter
+
+        writer = PdfWriter()
+        for page in PdfReader(io.BytesIO(scanned_pdf_content)).pages:
+            writer.add_page(page)
+        writer.add_outline_item("Objet du marché", 0)
+        delais = writer.add_outline_item("Délais d'exécution", 1)
+        writer.add_outline_item("Pénalités", 1, parent=delais)
+        buffer = io.BytesIO()
+        writer.write(buffer)
+
+        ocr_text = {
+            1: "Objet du marché\nArticle 1 - Fourniture de mobilier",
+            2: "Délais d'exécution\nLivraison sous 30 jours\nPénalités\n1/1000 par jour de retard",
+        }
+        monkeypatch.setattr(
+            parser_service, "_ocr_pages_sync",
+            lambda source, page_numbers, budget=None: {n: ocr_text[n] for n in page_numbers}
+        )
+
+        result = parser_service.extract_from_pdf_sync(buffer.getvalue(), use_ocr=True, parallel=False)
+
+        assert result["ocr_pages"] == [1, 2]
+        assert [(s["page"], s["number"], s["title"]) for s in result["sections"]] == [
+            (1, "1", "Objet du marché"),
+            (2, "2", "Délais d'exécution"),
+            (2, "2.1", "Pénalités"),
+        ]
+
+    def test_unchanged_scanned_pages_keep_their_ocr_text(self, scanned_pdf_content, monkeypatch):
+        """A new version with the same scanned pages keeps their OCR text, from the page cache."""
+        ocr_calls = []
+
+        def fake_ocr_pages(source, page_numbers, budget=None):
+            ocr_calls.append(list(page_numbers))
+            return {page_num: f"Article {page_num} – Titre OCR" for page_num in page_numbers}
+
+        monkeypatch.setattr(parser_service, "_ocr_pages_sync", fake_ocr_pages)
+        cache = DictOcrCache()
+
+        first = parser_service.extract_from_pdf_sync(scanned_pdf_content, use_ocr=True, ocr_cache=cache)
+        result = parser_service.extract_changed_pages_sync(
+            scanned_pdf_content, first, use_ocr=True, ocr_cache=cache
+        )
+
+        assert result["changed_pages"] == []
+        assert ocr_calls == [[1, 2]]
+        assert result["ocr_pages"] == [1, 2]
+        assert result["text"] == first["text"]
+        assert result["sections"] == first["sections"]
+        assert result["structured"]["reference_numbers"] == first["structured"]["reference_numbers"]
+
+    def test_streamed_pages_are_ocred_in_batches(self, monkeypatch):
+        """The streaming path OCRs scanned pages a pool's worth at a time, still yielding them in order."""
+        from PIL import Image
+        from app.core.config import settings
+
+        images = [Image.new("RGB", (600, 300), "white") for _ in range(5)]
+        buffer = io.BytesIO()
+        images[0].save(buffer, "PDF", save_all=True, append_images=images[1:])
+
+        ocr_calls = []
+
+        def fake_ocr_pages(source, page_numbers, budget=None):
+            ocr_calls.append(list(page_numbers))
+            return {page_num: f"Article {page_num} – Titre OCR" for page_num in page_numbers}
+
+        monkeypatch.setattr(parser_service, "_ocr_pages_sync", fake_ocr_pages)
+        monkeypatch.setattr(settings, "parser_ocr_workers", 2)
+
+        pages = list(parser_service.iter_pages(buffer.getvalue(), use_ocr=True))
+
+        assert ocr_calls == [[1, 2], [3, 4], [5]]
+        assert [page["page"] for page in pages] == [1, 2, 3, 4, 5]
+        assert all(page["ocr"] for page in pages)
+        assert [s["number"] for page in pages for s in page["sections"]] == ["1", "2", "3", "4", "5"]
+
+
+
+@pytest.mark.unit
+class TestExtractionBudget:
+    """Test suite for per-document CPU/wall/RSS budgets."""
+
+    def test_over_budget_raises_with_diagnostics(self, rc_pdf_content, tmp_path):
+        """Serial, parallel and streaming extraction stop between pages, not after the document."""
+        from app.services.parser_service import ParseBudget, ParseBudgetExceeded
+
+        with pytest.raises(ParseBudgetExceeded) as serial:
+            parser_service.extract_from_pdf_sync(
+                rc_pdf_content, parallel=False, budget=ParseBudget(wall_seconds=1e-9)
+            )
+        assert serial.value.diagnostics["resource"] == "wall_seconds"
+        assert (serial.value.diagnostics["stage"], serial.value.diagnostics["page"]) == ("pages", 1)
+        assert set(serial.value.diagnostics) >= {"limit", "cpu_seconds", "wall_seconds", "rss_mb"}
+
+        # Not swallowed by the serial fallback of the pool
+        with pytest.raises(ParseBudgetExceeded):
+            parser_service.extract_from_pdf_sync(rc_pdf_content, parallel=True, budget=ParseBudget(rss_mb=1))
+
+        pdf_path = tmp_path / "RC.pdf"
+        pdf_path.write_bytes(rc_pdf_content)
+        received_sections = []
+        with pytest.raises(ParseBudgetExceeded):
+            parser_service.extract_from_pdf_streaming_sync(
+                source=str(pdf_path),
+                on_sections=received_sections.extend,
+                text_sink=io.StringIO(),
+                budget=ParseBudget(cpu_seconds=1e-9)
+            )
+
+    def test_within_budget_is_unchanged(self, rc_pdf_content):
+        """A budget that is not exceeded does not change the output."""
+        from app.services.parser_service import ParseBudget
+
+        reference = parser_service.extract_from_pdf_sync(rc_pdf_content, parallel=False)
+        budgeted = parser_service.extract_from_pdf_sync(
+            rc_pdf_content, parallel=False, budget=ParseBudget(cpu_seconds=600, wall_seconds=600, rss_mb=1 << 20)
+        )
+
+        assert budgeted["sections"] == reference["sections"]
+        assert budgeted["text"] == reference["text"]
+
+    def test_degrades_to_text_only_then_gives_up(self):
+        """Over budget, the task extracts again text-only; a second overrun carries both attempts."""
+        from app.services.parser_service import ParseBudgetExceeded
+        from app.tasks.tender_tasks import _extract_within_budget
+
+        calls = []
+
+        def extract(fail_fidelities, **options):
+            calls.append((options.get("fidelity"), options["use_ocr"]))
+            if options.get("budget") and (options.get("fidelity") or "standard") in fail_fidelities:
+                raise ParseBudgetExceeded({
+                    "resource": "cpu_seconds", "limit": 1, "stage": "pages", "page": 3,
+                    "cpu_seconds": 2, "wall_seconds": 2, "rss_mb": 100
+                })
+            return {"text": "ok"}
+
+        result = _extract_within_budget(extract, fail_fidelities={"standard"}, use_ocr=True)
+        assert calls == [(None, True), ("fast", False)]
+        assert result["budget"]["degraded"] and result["budget"]["attempts"][0]["page"] == 3
+
+        with pytest.raises(ParseBudgetExceeded) as exc:
+            _extract_within_budget(extract, fail_fidelities={"standard", "fast"}, use_ocr=True)
+        assert [a["fidelity"] for a in exc.value.diagnostics["attempts"]] == ["standard", "fast"]
+
+        assert _extract_within_budget(extract, enforce=False, fail_fidelities={"standard"}, use_ocr=True) == {"text": "ok"}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
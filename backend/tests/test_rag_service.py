@@ -1,12 +1,34 @@
 """
 Tests for RAG Service.
 """
+import random
 import pytest
+from types import SimpleNamespace
 from uuid import uuid4
-from app.services.rag_service import rag_service
+from tenacity import wait_none
+from app.services.rag_service import RAGService, rag_service
 from app.models.base import get_celery_session
 
 
+class FakeEmbeddingsClient:
+    """OpenAI client stand-in: one-dimension embeddings (input length), items shuffled."""
+
+    def __init__(self, failures: int = 0):
+        self.requests = []
+        self.failures = failures
+        self.embeddings = self
+
+    def create(self, model, input):
+        self.requests.append(list(input))
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("Embeddings API unavailable")
+
+        data = [SimpleNamespace(index=i, embedding=[float(len(text))]) for i, text in enumerate(input)]
+        random.shuffle(data)
+        return SimpleNamespace(data=data)
+
+
 class TestRAGServiceSync:
     """Test suite for synchronous RAG methods."""
 
@@ -191,5 +213,259 @@ class TestRAGServiceSync:
         print(f"✅ Large section split correctly: 1 section → {len(chunks)} chunks")
 
 
+
+@pytest.mark.unit
+class TestEmbeddingBatching:
+    """Test suite for batched embedding requests."""
+
+    def test_packing_respects_item_and_token_limits(self, monkeypatch):
+        """Batches keep input order and stay under both limits; oversized texts go alone."""
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "embedding_batch_max_items", 3)
+        monkeypatch.setattr(settings, "embedding_batch_max_tokens", 100)
+
+        texts = ["a" * 160] * 5 + ["b" * 1000] + ["c" * 160]
+        batches = rag_service._pack_embedding_batches(texts)
+
+        assert batches == [[0, 1], [2, 3], [4], [5], [6]]
+        assert rag_service._pack_embedding_batches([]) == []
+
+    def test_batched_results_map_back_to_chunks(self, monkeypatch):
+        """Few requests, embeddings in chunk order; a failing request is retried alone."""
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "embedding_batch_max_items", 4)
+        monkeypatch.setattr(RAGService._embed_batch_sync.retry, "wait", wait_none())
+
+        client = FakeEmbeddingsClient()
+        monkeypatch.setattr(rag_service, "sync_client", client)
+
+        texts = [f"Article {i} " + "x" * i for i in range(10)]
+        embeddings = rag_service.create_embeddings_batch_sync(texts)
+
+        assert embeddings == [[float(len(text))] for text in texts]
+        assert [len(request) for request in client.requests] == [4, 4, 2]
+
+        # Second request fails once: only it is sent again
+        client = FakeEmbeddingsClient()
+        monkeypatch.setattr(rag_service, "sync_client", client)
+        calls = {"count": 0}
+        create = client.create
+
+        def flaky_create(model, input):
+            calls["count"] += 1
+            if calls["count"] == 2:
+                client.requests.append(list(input))
+                raise ConnectionError("Embeddings API unavailable")
+            return create(model, input)
+
+        client.create = flaky_create
+        assert rag_service.create_embeddings_batch_sync(texts) == embeddings
+        assert [request[0] for request in client.requests] == [texts[0], texts[4], texts[4], texts[8]]
+
+    @pytest.mark.asyncio
+    async def test_async_batches(self, monkeypatch):
+        """The async variant packs and orders like the sync one."""
+        from app.core.config import settings
+
+        class AsyncFakeClient:
+            def __init__(self):
+                self.sync = FakeEmbeddingsClient()
+                self.embeddings = self
+
+            async def create(self, model, input):
+                return self.sync.create(model, input)
+
+        monkeypatch.setattr(settings, "embedding_batch_max_items", 3)
+        client = AsyncFakeClient()
+        monkeypatch.setattr(rag_service, "async_client", client)
+
+        texts = [f"Clause {i} " + "y" * (i * 7) for i in range(8)]
+        embeddings = await rag_service.create_embeddings_batch(texts)
+
+        assert embeddings == [[float(len(text))] for text in texts]
+        assert len(client.sync.requests) == 3
+
+
+
+@pytest.mark.unit
+class TestEmbeddingCache:
+    """Test suite for the content-addressed embedding cache."""
+
+    def test_cache_key_normalization(self):
+        """Layout-only differences share a key; the model and the wording do not."""
+        from app.services.embedding_cache_service import embedding_cache_service as cache
+
+        key = cache.cache_key("Article 12 –  Pénalités\nde retard", model="m")
+
+        assert key == cache.cache_key("  Article 12 – Pénalités de retard ", model="m")
+        assert key == cache.cache_key("Article 12 – Pe\u0301nalités de retard", model="m")  # NFD accent
+        assert key != cache.cache_key("Article 12 – Pénalités de retard", model="other")
+        assert key != cache.cache_key("Article 13 – Pénalités de retard", model="m")
+
+    def test_only_misses_are_embedded(self, monkeypatch):
+        """Cached chunks skip OpenAI; misses are embedded once (deduplicated) and stored."""
+        from app.services.embedding_cache_service import embedding_cache_service as cache
+
+        store = {cache.cache_key("RGPD clause"): [42.0]}
+        stored = []
+
+        def get_many_sync(db, texts):
+            return [store.get(cache.cache_key(text)) for text in texts]
+
+        def set_many_sync(db, texts, embeddings):
+            stored.append(list(texts))
+            store.update({cache.cache_key(text): embedding for text, embedding in zip(texts, embeddings)})
+
+        monkeypatch.setattr(cache, "get_many_sync", get_many_sync)
+        monkeypatch.setattr(cache, "set_many_sync", set_many_sync)
+
+        client = FakeEmbeddingsClient()
+        monkeypatch.setattr(rag_service, "sync_client", client)
+
+        texts = ["New clause", "RGPD clause", "New clause", "Other"]
+        embeddings = rag_service.embed_texts_cached_sync(None, texts)
+
+        assert embeddings == [[10.0], [42.0], [10.0], [5.0]]
+        assert client.requests == [["New clause", "Other"]]
+        assert stored == [["New clause", "Other"]]
+
+        # Second pass is served from the cache
+        assert rag_service.embed_texts_cached_sync(None, texts) == embeddings
+        assert len(client.requests) == 1
+
+    @pytest.mark.parametrize("estimated_rows, evicted", [(100, False), (199_999, True)])
+    def test_eviction_only_above_the_estimated_limit(self, monkeypatch, estimated_rows, evicted):
+        """The count + LRU delete runs only when the planner estimate plus the new rows exceeds the limit."""
+        from app.core.config import settings
+        from app.services.embedding_cache_service import embedding_cache_service as cache
+
+        monkeypatch.setattr(settings, "embedding_cache_max_entries", 200_000)
+
+        class FakeCacheSession:
+            def __init__(self):
+                self.executed = []
+                self.commits = 0
+
+            def execute(self, statement, params=None):
+                self.executed.append(str(statement))
+                return SimpleNamespace(rowcount=2, scalar=lambda: estimated_rows)
+
+            def commit(self):
+                self.commits += 1
+
+        db = FakeCacheSession()
+        cache.set_many_sync(db, ["Clause A", "Clause B"], [[1.0], [2.0]])
+
+        assert "INSERT INTO embedding_cache" in db.executed[0]
+        assert "pg_class" in db.executed[1]
+        assert any("DELETE FROM embedding_cache" in sql for sql in db.executed) == evicted
+        assert not any("count(*)" in sql for sql in db.executed[:2])
+        assert db.commits == 1
+
+
+class FakeSearchSession:
+    """Sync session recording executed statements and returning canned retrieval rows."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.executed = []
+
+    def execute(self, statement, params=None):
+        self.executed.append((statement, params))
+        return SimpleNamespace(fetchall=lambda: self.rows)
+
+
+@pytest.mark.unit
+class TestHybridRetrieval:
+    """Test suite for hybrid (full-text + ANN, reciprocal rank fusion) retrieval."""
+
+    def _compile(self, statement):
+        from sqlalchemy.dialects import postgresql
+        return str(statement.compile(dialect=postgresql.psycopg2.dialect()))
+
+    def test_hybrid_statement(self):
+        """One statement: ANN and full-text candidates, fused; the embedding is sent once."""
+        sql = self._compile(rag_service._search_sql("hybrid", "document_type = 'tender'"))
+
+        assert sql.count("%(query_embedding)s") == 1
+        assert "websearch_to_tsquery('french', %(query_text)s)" in sql
+        assert sql.count("to_tsvector('french', chunk_text) @@ tsq") == 1
+        assert "FULL OUTER JOIN lexical_hits" in sql
+        assert sql.count("document_type = 'tender'") == 2
+
+        vector_sql = self._compile(rag_service._search_sql("vector", "TRUE"))
+        assert "tsvector" not in vector_sql and vector_sql.count("%(query_embedding)s") == 1
+
+        with pytest.raises(ValueError):
+            rag_service._search_sql("keyword", "TRUE")
+
+    def test_fts_expression_matches_index(self):
+        """Queries use the exact expression of the GIN index, or the planner ignores it."""
+        from app.models.document import DocumentEmbedding
+        from app.services.vector_index_service import vector_index_service
+
+        index = next(i for i in DocumentEmbedding.__table__.indexes if i.name == vector_index_service.FTS_INDEX)
+        expression = str(index.expressions[0])
+
+        assert expression == vector_index_service.tsvector_sql()
+        assert expression in vector_index_service.fts_definition()["columns_sql"]
+
+    def test_hybrid_retrieve_sync(self, monkeypatch):
+        """Mode per call; ranks and fused score come back; ef_search covers the candidates."""
+        from app.core.config import settings
+
+        monkeypatch.setattr(rag_service, "embed_texts_cached_sync", lambda db, texts: [[0.1] * 1536])
+        monkeypatch.setattr(settings, "rag_hybrid_candidates", 50)
+        monkeypatch.setattr(settings, "vector_hnsw_ef_search", 40)
+
+        row = SimpleNamespace(
+            id=uuid4(), document_id=uuid4(), document_type="tender", chunk_text="Article 12 - Pénalités",
+            meta_data={"page": 3}, distance=0.25, vector_rank=None, lexical_rank=1, rrf_score=1 / 61,
+            _fields=("id", "document_id", "document_type", "chunk_text", "meta_data", "distance",
+                     "vector_rank", "lexical_rank", "rrf_score")
+        )
+        db = FakeSearchSession([row])
+
+        results = rag_service.retrieve_relevant_content_sync(
+            db, "pénalités de retard article 12", top_k=5, document_ids=[str(row.document_id)], mode="hybrid"
+        )
+
+        assert results[0]["similarity_score"] == 0.75
+        assert results[0]["lexical_rank"] == 1 and results[0]["vector_rank"] is None
+
+        (settings_sql, settings_params), (_, params) = db.executed
+        assert "50" in settings_params.values()
+        assert params["query_text"] == "pénalités de retard article 12"
+        assert params["candidates"] == 50 and params["rrf_k"] == settings.rag_rrf_k
+        assert params["document_ids"] == [str(row.document_id)]
+
+    def test_quantized_retrieve_sync(self, monkeypatch):
+        """halfvec/binary storage: rows are re-scored exactly, ef_search covers the shortlist."""
+        from app.core.config import settings
+
+        monkeypatch.setattr(rag_service, "embed_texts_cached_sync", lambda db, texts: [[0.1] * 1536])
+        monkeypatch.setattr(settings, "vector_rescore_candidates", 80)
+
+        row = SimpleNamespace(
+            id=uuid4(), document_id=uuid4(), document_type="tender", chunk_text="Article 3 - Durée",
+            meta_data={}, distance=0.5, _fields=("id", "document_id", "document_type", "chunk_text", "meta_data", "distance")
+        )
+        db = FakeSearchSession([row])
+
+        results = rag_service.retrieve_relevant_content_sync(db, "durée", top_k=5, mode="vector", storage="binary")
+
+        assert results[0]["similarity_score"] == 0.5
+        (_, settings_params), (statement, params) = db.executed
+        assert "80" in settings_params.values()
+        assert params["candidates"] == 5 and params["shortlist"] == 80
+        sql = self._compile(statement)
+        assert "binary_quantize" in sql and sql.count("%(query_embedding)s") == 1
+
+        hybrid = self._compile(rag_service._search_sql("hybrid", "TRUE", "halfvec"))
+        assert "halfvec(1536)" in hybrid and "LIMIT %(shortlist)s" in hybrid
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,94 @@
+"""
+Tests for Reranker Service.
+"""
+import pytest
+
+from app.core.config import settings
+from app.services.reranker_service import reranker_service
+
+
+class FakeCrossEncoder:
+    """Scores a pair by how many query words the chunk contains; records the calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    def predict(self, pairs, batch_size, show_progress_bar, convert_to_numpy):
+        self.calls.append({"pairs": list(pairs), "batch_size": batch_size})
+        return [sum(word in text.lower() for word in query.lower().split()) for query, text in pairs]
+
+
+@pytest.fixture
+def fake_reranker(monkeypatch):
+    """Reranker with a fake model and an in-memory score cache."""
+    model = FakeCrossEncoder()
+    cache = {}
+
+    def cached_scores(key, ids):
+        return {chunk_id: cache[key][chunk_id] for chunk_id in ids if chunk_id in cache.get(key, {})}
+
+    def store_scores(key, scores):
+        cache.setdefault(key, {}).update(scores)
+
+    async def cached_scores_async(key, ids):
+        return cached_scores(key, ids)
+
+    async def store_scores_async(key, scores):
+        store_scores(key, scores)
+
+    monkeypatch.setattr(settings, "reranker_enabled", True)
+    monkeypatch.setattr(settings, "reranker_batch_size", 16)
+    monkeypatch.setattr(reranker_service, "_model", model)
+    monkeypatch.setattr(reranker_service, "_unavailable", False)
+    monkeypatch.setattr(reranker_service, "_cached_scores_sync", cached_scores)
+    monkeypatch.setattr(reranker_service, "_store_scores_sync", store_scores)
+    monkeypatch.setattr(reranker_service, "_cached_scores", cached_scores_async)
+    monkeypatch.setattr(reranker_service, "_store_scores", store_scores_async)
+    return model
+
+
+CANDIDATES = [
+    {"id": "a", "chunk_text": "Article 3 - Durée de l'accord-cadre", "similarity_score": 0.82},
+    {"id": "b", "chunk_text": "Article 12 - Pénalités de retard : 1/1000 par jour", "similarity_score": 0.80},
+    {"id": "c", "chunk_text": "Pénalités plafonnées à 10% de la valeur", "similarity_score": 0.79},
+]
+
+
+@pytest.mark.unit
+class TestReranking:
+    """Test suite for cross-encoder reranking."""
+
+    def test_reorders_and_caches_scores(self, fake_reranker):
+        """Best pairs first; a second pass on the same query only scores new chunks."""
+        query = "pénalités de retard"
+
+        ranked = reranker_service.rerank_sync(query, CANDIDATES, top_k=2)
+
+        assert [c["id"] for c in ranked] == ["b", "c"]
+        assert ranked[0]["rerank_score"] == 3.0
+        assert fake_reranker.calls[0]["batch_size"] == 16
+        assert len(fake_reranker.calls[0]["pairs"]) == 3
+
+        new = {"id": "d", "chunk_text": "Pénalités de retard et de retard", "similarity_score": 0.5}
+        ranked = reranker_service.rerank_sync(query, CANDIDATES + [new], top_k=5)
+
+        assert [pair[1] for pair in fake_reranker.calls[1]["pairs"]] == [new["chunk_text"]]
+        assert [c["id"] for c in ranked] == ["b", "d", "c", "a"]
+
+    @pytest.mark.asyncio
+    async def test_async_rerank(self, fake_reranker):
+        """The async path ranks like the sync one."""
+        ranked = await reranker_service.rerank("durée accord-cadre", CANDIDATES, top_k=1)
+
+        assert [c["id"] for c in ranked] == ["a"]
+
+    def test_retrieval_order_without_model(self, fake_reranker, monkeypatch):
+        """Disabled (or sentence-transformers missing): plain truncation, no scoring."""
+        monkeypatch.setattr(settings, "reranker_enabled", False)
+
+        assert reranker_service.rerank_sync("pénalités", CANDIDATES, top_k=2) == CANDIDATES[:2]
+        assert fake_reranker.calls == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
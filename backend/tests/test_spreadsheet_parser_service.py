@@ -0,0 +1,80 @@
+"""
+Tests for Spreadsheet Parser Service.
+"""
+import io
+import json
+import pytest
+from pathlib import Path
+
+import openpyxl
+
+from app.services.spreadsheet_parser_service import spreadsheet_parser_service
+
+
+EXAMPLES_DIR = Path(__file__).parent.parent.parent / "Examples" / "VSGP-AO"
+
+
+@pytest.fixture
+def price_workbook_content():
+    """Small BPU-like workbook: a notice, then a titled price table."""
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "BPU"
+
+    sheet.append(["BORDEREAU DES PRIX UNITAIRES"])
+    sheet.append([])
+    sheet.append([None, "Prix par profil"])
+    sheet.append([None, "Profil", "TJM", "Quantité"])
+    sheet.append([None, "Chef de projet", 650.0, 12])
+    sheet.append([None, "Expert\u200b réseau", 720.5, 3])
+
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+@pytest.mark.unit
+class TestSpreadsheetExtraction:
+    """Test suite for the native .xlsx extraction path."""
+
+    def test_price_table_keeps_typed_rows(self, price_workbook_content):
+        """Blocks become tables with typed rows and a title section under the sheet."""
+        result = spreadsheet_parser_service.extract_from_xlsx_sync(price_workbook_content)
+
+        assert result["page_count"] == 1
+        assert result["extraction_method"] == "openpyxl"
+
+        table = result["tables"][0]
+        assert table["title"] == "Prix par profil"
+        assert table["headers"] == ["Profil", "TJM", "Quantité"]
+        assert table["rows"] == [["Chef de projet", "650", "12"], ["Expert réseau", "720.5", "3"]]
+        assert table["typed_rows"] == [["Chef de projet", 650.0, 12], ["Expert réseau", 720.5, 3]]
+        assert table["is_price_table"]
+
+        sheet_section, table_section = result["sections"]
+        assert (sheet_section["type"], sheet_section["number"], sheet_section["title"]) == ("SHEET", "1", "BPU")
+        assert (table_section["type"], table_section["number"]) == ("TABLE", "1.1")
+        assert table_section["parent_number"] == "1"
+        assert "Chef de projet | 650 | 12" in table_section["content"]
+
+        # Stored as-is in extraction_meta_data
+        json.dumps(result)
+
+    def test_example_workbooks(self):
+        """Sample BPU/DQE/DPGF workbooks produce price tables."""
+        for name in ("BPU.xlsx", "DQE.xlsx", "DPGF.xlsx"):
+            path = EXAMPLES_DIR / name
+            if not path.exists():
+                pytest.skip(f"Sample workbook not found: {path}")
+
+            result = spreadsheet_parser_service.extract_from_xlsx_sync(str(path))
+
+            assert result["page_count"] == len(result["metadata"]["sheets"])
+            assert len(result["page_fingerprints"]) == result["page_count"]
+            assert any(t["is_price_table"] for t in result["tables"])
+
+            print(f"✅ {name}: {len(result['tables'])} tables, {len(result['sections'])} sections")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
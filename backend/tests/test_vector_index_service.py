@@ -0,0 +1,169 @@
+"""
+Tests for Vector Index Service.
+"""
+import numpy as np
+import pytest
+from pgvector.utils import from_db, to_db_binary, from_db_binary
+from sqlalchemy.dialects.postgresql import asyncpg, psycopg2
+
+from app.core.config import settings
+from app.models.vector import EmbeddingVector, format_vector
+from app.services.vector_index_service import vector_index_service
+
+
+@pytest.mark.unit
+class TestVectorIndexDefinitions:
+    """Test suite for the ANN index DDL."""
+
+    def test_hnsw_global_and_partial_indexes(self, monkeypatch):
+        """One index on the table, one partial index per filtered document type."""
+        monkeypatch.setattr(settings, "vector_filtered_index_types", "tender, past_proposal")
+
+        definitions = vector_index_service.index_definitions("hnsw")
+
+        assert [d["name"] for d in definitions] == [
+            "idx_document_embeddings_ann_hnsw",
+            "idx_document_embeddings_ann_hnsw_tender",
+            "idx_document_embeddings_ann_hnsw_past_proposal",
+        ]
+        assert vector_index_service.create_index_sql(definitions[1]) == (
+            "CREATE INDEX CONCURRENTLY idx_document_embeddings_ann_hnsw_tender ON document_embeddings "
+            "USING hnsw (embedding vector_cosine_ops) WITH (m = 16, ef_construction = 64) "
+            "WHERE document_type = 'tender'"
+        )
+
+    def test_ivfflat_lists_follow_row_counts(self, monkeypatch):
+        """Lists are sized per index on the rows it covers."""
+        monkeypatch.setattr(settings, "vector_filtered_index_types", "tender")
+        monkeypatch.setattr(settings, "vector_ivfflat_lists", 0)
+
+        definitions = vector_index_service.index_definitions("ivfflat", {None: 4_000_000, "tender": 250_000})
+
+        assert "WITH (lists = 2000)" in definitions[0]["columns_sql"]
+        assert "WITH (lists = 250)" in definitions[1]["columns_sql"]
+        assert vector_index_service.ivfflat_lists(500) == 10
+
+    def test_invalid_settings_are_rejected(self, monkeypatch):
+        """Values written into DDL are validated."""
+        with pytest.raises(ValueError):
+            vector_index_service.index_definitions("flat")
+
+        monkeypatch.setattr(settings, "vector_filtered_index_types", "tender'; DROP TABLE x; --")
+        with pytest.raises(ValueError):
+            vector_index_service.index_definitions("hnsw")
+
+
+@pytest.mark.unit
+class TestVectorSearchParams:
+    """Test suite for filtered and tuned searches."""
+
+    def test_type_filter_matches_partial_indexes(self, monkeypatch):
+        """A single indexed type is a literal; anything else is bound."""
+        monkeypatch.setattr(settings, "vector_filtered_index_types", "tender,past_proposal")
+
+        assert vector_index_service.type_filter(None) == ("TRUE", {})
+        assert vector_index_service.type_filter(["tender"]) == ("document_type = 'tender'", {})
+        assert vector_index_service.type_filter(["cctp"]) == (
+            "document_type = ANY(:document_types)", {"document_types": ["cctp"]}
+        )
+        assert vector_index_service.type_filter(["tender", "past_proposal"])[1] == {
+            "document_types": ["tender", "past_proposal"]
+        }
+
+    def test_search_params(self, monkeypatch):
+        """ef_search never drops below top_k; iterative scans only when configured."""
+        monkeypatch.setattr(settings, "vector_iterative_scan", "")
+
+        params = vector_index_service._search_params(top_k=50, ef_search=20, probes=None)
+        assert params == {"hnsw.ef_search": "50", "ivfflat.probes": str(settings.vector_ivfflat_probes)}
+
+        monkeypatch.setattr(settings, "vector_iterative_scan", "relaxed_order")
+        params = vector_index_service._search_params(top_k=5, ef_search=None, probes=3)
+        assert params["hnsw.ef_search"] == str(settings.vector_hnsw_ef_search)
+        assert params["ivfflat.probes"] == "3"
+        assert params["hnsw.iterative_scan"] == "relaxed_order"
+
+        sql, bind = vector_index_service._set_config_sql({"hnsw.ef_search": "80"})
+        assert str(sql) == "SELECT set_config('hnsw.ef_search', :p0, true)"
+        assert bind == {"p0": "80"}
+
+
+@pytest.mark.unit
+class TestQuantizedStorage:
+    """Test suite for halfvec / binary first-stage search."""
+
+    def test_expression_indexes(self, monkeypatch):
+        """Quantized storages index an expression under their own names; queries use the same expression."""
+        monkeypatch.setattr(settings, "vector_filtered_index_types", "tender")
+
+        halfvec = vector_index_service.index_definitions("hnsw", storage="halfvec")
+        binary = vector_index_service.index_definitions("ivfflat", {None: 50_000}, storage="binary")
+
+        assert [d["name"] for d in halfvec] == [
+            "idx_document_embeddings_ann_hnsw_halfvec",
+            "idx_document_embeddings_ann_hnsw_halfvec_tender",
+        ]
+        assert halfvec[0]["columns_sql"] == (
+            "USING hnsw ((CAST(embedding AS halfvec(1536))) halfvec_cosine_ops) WITH (m = 16, ef_construction = 64)"
+        )
+        assert binary[0]["columns_sql"] == (
+            "USING ivfflat ((CAST(binary_quantize(embedding) AS bit(1536))) bit_hamming_ops) WITH (lists = 50)"
+        )
+        assert vector_index_service.distance_sql("binary", ":q") == (
+            "CAST(binary_quantize(embedding) AS bit(1536)) <~> CAST(binary_quantize(:q) AS bit(1536))"
+        )
+
+        with pytest.raises(ValueError):
+            vector_index_service.index_definitions("hnsw", storage="int8")
+
+    def test_rescoring(self, monkeypatch):
+        """Quantized search shortlists on the index, then orders on the exact distance."""
+        monkeypatch.setattr(settings, "vector_rescore_candidates", 100)
+
+        sql = " ".join(vector_index_service.nearest_sql("document_type = 'tender'", "halfvec").split())
+
+        assert "ORDER BY CAST(embedding AS halfvec(1536)) <=> CAST((SELECT embedding FROM query_vector) AS halfvec(1536)) LIMIT :shortlist" in sql
+        assert sql.endswith("ORDER BY distance LIMIT :candidates")
+        assert "rescored.embedding <=> (SELECT embedding FROM query_vector) AS distance" in sql
+        assert ":shortlist" not in vector_index_service.nearest_sql(storage="full")
+
+        assert vector_index_service.shortlist_size(5, "binary") == 100
+        assert vector_index_service.shortlist_size(150, "halfvec") == 150
+        assert vector_index_service.shortlist_size(5, "full") is None
+
+
+@pytest.mark.unit
+class TestVectorBinding:
+    """Test suite for the driver-specific embedding bind."""
+
+    def test_psycopg2_binds_float32_text(self):
+        """The text literal is compact and loses nothing a vector column keeps."""
+        embedding = np.random.default_rng(0).normal(size=1536).tolist()
+        process = EmbeddingVector(1536).bind_processor(psycopg2.dialect())
+
+        literal = process(embedding)
+
+        assert len(literal) < len(str(embedding)) * 0.6
+        assert np.array_equal(from_db(literal), np.asarray(embedding, dtype=np.float32))
+        assert process(None) is None
+
+    def test_asyncpg_binds_raw_values(self):
+        """asyncpg gets the values for its binary codec."""
+        embedding = [0.25, -1.5, 3.0]
+        process = EmbeddingVector(3).bind_processor(asyncpg.dialect())
+
+        assert process(embedding) is embedding
+        assert from_db_binary(to_db_binary(process(embedding))).tolist() == embedding
+        assert len(to_db_binary(embedding)) == 4 + 3 * 4
+
+    def test_dimension_mismatch(self):
+        """Both drivers reject vectors of the wrong size before the round trip."""
+        for dialect in (psycopg2.dialect(), asyncpg.dialect()):
+            with pytest.raises(ValueError):
+                EmbeddingVector(1536).bind_processor(dialect)([0.1, 0.2])
+
+        assert format_vector([0.1, 0.2]) == "[0.100000001,0.200000003]"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])